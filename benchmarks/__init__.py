@@ -0,0 +1,3 @@
+"""
+Performance benchmarks for the OrangeHRM flows covered by the test suite.
+"""
@@ -0,0 +1,101 @@
+"""
+The user flows measured by the benchmarks, built on the page objects.
+
+Every flow takes a WebDriver and a StepTimer and records each of its steps.
+Flows navigate through config.url_for() so they follow the target chosen on
+the command line.
+"""
+
+# First-party
+from pageObjects.adminPage import AdminHeader, AdminMainMenu
+from pageObjects.loginPage import Login
+from utilities import config
+
+
+def _login(driver, timer):
+    """
+    Open the login page and sign in as the configured admin.
+    :param driver: WebDriver instance.
+    :param timer: StepTimer recording the steps.
+    """
+    login_object = Login(driver)
+    with timer.step("open_login_page"):
+        driver.get(config.url_for(config.LOGIN_PATH))
+        login_object.is_login_form_displayed()
+    with timer.step("submit_credentials"):
+        login_object.enter_username(config.ADMIN_USERNAME)
+        login_object.enter_password(config.ADMIN_PASSWORD)
+        login_object.click_login()
+        login_object.wait_for_url(config.DASHBOARD_PATH)
+    return login_object
+
+
+def valid_login(driver, timer):
+    """
+    Log in with valid credentials and land on the dashboard.
+    """
+    _login(driver, timer)
+
+
+def logout(driver, timer):
+    """
+    Log in, open the user drop-down and log out again.
+    """
+    login_object = _login(driver, timer)
+    with timer.step("open_drop_down"):
+        login_object.view_drop_down_menu()
+    with timer.step("logout"):
+        login_object.click_logout()
+        login_object.is_login_form_displayed()
+
+
+def forgot_password(driver, timer):
+    """
+    Request a password reset link from the login page.
+    """
+    login_object = Login(driver)
+    with timer.step("open_login_page"):
+        driver.get(config.url_for(config.LOGIN_PATH))
+    with timer.step("open_reset_form"):
+        login_object.click_forgot_password_link()
+    with timer.step("request_reset"):
+        login_object.enter_username(config.ADMIN_USERNAME)
+        login_object.click_reset_password_button()
+        login_object.check_reset_link_sent_message()
+
+
+def admin_header(driver, timer):
+    """
+    Log in, open the Admin module and check every header option.
+    """
+    _login(driver, timer)
+    admin_object = AdminHeader(driver)
+    with timer.step("open_admin_module"):
+        admin_object.click_admin_tab()
+    with timer.step("check_options"):
+        assert all(
+            state["clickable"] for state in admin_object.visibility_report().values()
+        )
+
+
+def admin_main_menu(driver, timer):
+    """
+    Log in, open the Admin module and check every main menu entry.
+    """
+    _login(driver, timer)
+    admin_object = AdminMainMenu(driver)
+    with timer.step("open_admin_module"):
+        admin_object.click_admin_tab()
+    with timer.step("check_options"):
+        assert all(
+            state["clickable"] for state in admin_object.visibility_report().values()
+        )
+
+
+FLOWS = {
+    "valid_login": valid_login,
+    "logout": logout,
+    "forgot_password": forgot_password,
+    "admin_header": admin_header,
+    "admin_main_menu": admin_main_menu,
+}
@@ -0,0 +1,268 @@
+"""
+Latency benchmark for the login and Admin navigation flows.
+
+Runs each flow many times against a target, reports p50/p95/p99 per step,
+browser startup and total run time, and compares the result to a stored
+baseline. Exits with status 1 when a flow regressed past the threshold.
+
+    python -m benchmarks.latency --target local --iterations 20
+    python -m benchmarks.latency --target local --update-baseline
+"""
+
+# Standard library
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+# First-party
+from benchmarks.flows import FLOWS
+from utilities import config
+from utilities.browserLauncher import PROFILES, BrowserLauncher
+from utilities.driverPool import DriverPool
+from utilities.standin.server import StandinServer
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def percentile(values, fraction):
+    """
+    Return a percentile of a list of numbers, interpolating between ranks.
+    :param values: list: Samples.
+    :param fraction: float: Percentile between 0 and 1.
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(values):
+    """
+    Return the count, p50, p95 and p99 of a list of durations.
+    :param values: list: Durations in seconds.
+    """
+    return {
+        "count": len(values),
+        "p50": percentile(values, 0.50),
+        "p95": percentile(values, 0.95),
+        "p99": percentile(values, 0.99),
+    }
+
+
+class StepTimer:
+    """
+    Records the duration of named steps across flow iterations.
+    """
+
+    def __init__(self):
+        """
+        Initialize the StepTimer instance.
+        """
+        self.samples = defaultdict(list)
+
+    @contextmanager
+    def step(self, name):
+        """
+        Time a block of code under the given step name.
+        :param name: str: Step name.
+        """
+        started = time.perf_counter()
+        yield
+        self.samples[name].append(time.perf_counter() - started)
+
+
+class LatencyBenchmark:
+    """
+    Runs the flows repeatedly and checks the results against a baseline.
+    """
+
+    def __init__(self, flows, iterations, profile=None, threshold=0.2):
+        """
+        Initialize the LatencyBenchmark instance.
+        :param flows: list: Names of the flows in benchmarks.flows.FLOWS to run.
+        :param iterations: int: Runs per flow.
+        :param profile: str: Browser launch profile.
+        :param threshold: float: Allowed slowdown over the baseline, 0.2 is 20%.
+        """
+        self.flows = flows
+        self.iterations = iterations
+        self.threshold = threshold
+        self.launcher = BrowserLauncher(profile, warm=0)
+
+    def run(self):
+        """
+        Run every flow and return the summarised results.
+        """
+        started = time.perf_counter()
+        pool = DriverPool(factory=self.launcher.acquire, size=1)
+        timers = {name: StepTimer() for name in self.flows}
+        errors = defaultdict(int)
+        try:
+            for _ in range(self.iterations):
+                for name in self.flows:
+                    driver = pool.checkout()
+                    timer = timers[name]
+                    try:
+                        with timer.step("total"):
+                            FLOWS[name](driver, timer)
+                    except Exception:
+                        # A failed run records no "total" and counts as an error.
+                        errors[name] += 1
+                    pool.checkin(driver)
+        finally:
+            pool.shutdown()
+
+        return {
+            "target": config.BASE_URL,
+            "profile": self.launcher.profile.name,
+            "iterations": self.iterations,
+            "total_seconds": time.perf_counter() - started,
+            "browser_startup": summarize(self.launcher.startup_times),
+            "flows": {
+                name: {
+                    "errors": errors[name],
+                    "steps": {
+                        step: summarize(samples)
+                        for step, samples in timers[name].samples.items()
+                    },
+                }
+                for name in self.flows
+            },
+        }
+
+    def regressions(self, result, baseline):
+        """
+        List the flows whose p50 or p95 total grew past the threshold.
+        :param result: dict: Output of run().
+        :param baseline: dict: A previous output of run().
+        """
+        found = []
+        for name, flow in result["flows"].items():
+            before = baseline.get("flows", {}).get(name, {}).get("steps", {})
+            now = flow["steps"].get("total")
+            if "total" not in before or not now:
+                continue
+            for statistic in ("p50", "p95"):
+                limit = before["total"][statistic] * (1 + self.threshold)
+                if now[statistic] > limit:
+                    found.append(
+                        "%s %s %.3fs exceeds baseline %.3fs by more than %d%%"
+                        % (
+                            name,
+                            statistic,
+                            now[statistic],
+                            before["total"][statistic],
+                            self.threshold * 100,
+                        )
+                    )
+            if flow["errors"]:
+                found.append("%s failed %d times" % (name, flow["errors"]))
+        return found
+
+
+def print_report(result):
+    """
+    Print the per-step percentiles of a benchmark result.
+    :param result: dict: Output of LatencyBenchmark.run().
+    """
+    print(
+        "Target %(target)s, profile %(profile)s, %(iterations)d iterations, "
+        "total %(total_seconds).1fs" % result
+    )
+    startup = result["browser_startup"]
+    print(
+        "browser startup: p50 %.3fs  p95 %.3fs  p99 %.3fs (%d launches)"
+        % (startup["p50"], startup["p95"], startup["p99"], startup["count"])
+    )
+    for name, flow in result["flows"].items():
+        print("%s (%d errors)" % (name, flow["errors"]))
+        for step, stats in flow["steps"].items():
+            print(
+                "  %-20s p50 %.3fs  p95 %.3fs  p99 %.3fs"
+                % (step, stats["p50"], stats["p95"], stats["p99"])
+            )
+
+
+def main(argv=None):
+    """
+    Run the benchmark from the command line.
+    :param argv: list: Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--target",
+        default=config.TARGET,
+        help='"demo", "local" for the bundled stand-in, or a base URL.',
+    )
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument(
+        "--flows", nargs="+", choices=sorted(FLOWS), default=list(FLOWS)
+    )
+    parser.add_argument(
+        "--profile", choices=sorted(PROFILES), default=config.BROWSER_PROFILE
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown over the baseline, 0.2 is 20%%.",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store this run as the new baseline instead of comparing.",
+    )
+    parser.add_argument("--output", help="Also write the result JSON here.")
+    args = parser.parse_args(argv)
+
+    standin = None
+    if args.target == "local":
+        standin = StandinServer(port=0)
+        standin.start()
+        config.BASE_URL = standin.url
+    elif args.target != "demo":
+        config.BASE_URL = args.target.rstrip("/")
+
+    try:
+        benchmark = LatencyBenchmark(
+            args.flows, args.iterations, args.profile, args.threshold
+        )
+        result = benchmark.run()
+    finally:
+        if standin is not None:
+            standin.stop()
+
+    print_report(result)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(result, handle, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(result, handle, indent=2)
+        print("Baseline written to", args.baseline)
+        return 0
+
+    try:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+    except OSError:
+        print("No baseline at %s; run with --update-baseline first" % args.baseline)
+        return 0
+
+    regressions = benchmark.regressions(result, baseline)
+    for regression in regressions:
+        print("REGRESSION:", regression)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""
+Concurrent virtual-user load test built on the Login page object.
+
+Each virtual user owns a browser and loops through login, opening the user
+drop-down and logout, pausing for a think time between iterations. Users
+start one after another over the ramp-up period and stop when the duration
+ends. The report gives logins per second, latency percentiles and error
+rates by kind.
+
+    python -m benchmarks.load --users 10 --ramp-up 20 --duration 120
+"""
+
+# Standard library
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-party
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+# First-party
+from benchmarks.latency import summarize
+from pageObjects.loginPage import Login
+from utilities import config
+from utilities.browserLauncher import PROFILES, BrowserLauncher
+from utilities.driverPool import DriverPool
+from utilities.standin.server import StandinServer
+
+
+def login_outcome(driver):
+    """
+    Condition that the login either reached the dashboard or was rejected.
+    :param driver: WebDriver instance.
+    :return: str: "ok" or "invalid_credentials", or None while still pending.
+    """
+    if config.DASHBOARD_PATH in driver.current_url:
+        return "ok"
+    # The login page renders the error container empty until a login fails.
+    if any(
+        error.is_displayed() and error.text.strip()
+        for error in driver.find_elements(By.XPATH, Login.login_form_error)
+    ):
+        return "invalid_credentials"
+    return None
+
+
+class LoadTest:
+    """
+    Drives concurrent virtual users through the login flow.
+    """
+
+    def __init__(
+        self,
+        users,
+        ramp_up=0.0,
+        duration=60.0,
+        think_time=1.0,
+        profile=None,
+        username=None,
+        password=None,
+    ):
+        """
+        Initialize the LoadTest instance.
+        :param users: int: Number of concurrent virtual users.
+        :param ramp_up: float: Seconds over which the users are started.
+        :param duration: float: Seconds each user keeps iterating, measured
+            from the start of the test.
+        :param think_time: float: Mean pause between iterations, varied by +-50%.
+        :param profile: str: Browser launch profile.
+        :param username: str: Login name, defaults to config.ADMIN_USERNAME.
+        :param password: str: Password, defaults to config.ADMIN_PASSWORD.
+        """
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.think_time = think_time
+        self.username = username or config.ADMIN_USERNAME
+        self.password = password or config.ADMIN_PASSWORD
+        self.launcher = BrowserLauncher(profile, warm=0)
+        self.samples = []
+        self._lock = threading.Lock()
+
+    def run(self):
+        """
+        Run the virtual users and return the summarised results.
+        """
+        started = time.monotonic()
+        deadline = started + self.duration
+        with ThreadPoolExecutor(self.users, thread_name_prefix="virtual-user") as pool:
+            futures = [
+                pool.submit(
+                    self._virtual_user,
+                    started + self.ramp_up * user / self.users,
+                    deadline,
+                )
+                for user in range(self.users)
+            ]
+        self.launcher.shutdown()
+        for future in futures:
+            future.result()
+        return self.summarize(time.monotonic() - started)
+
+    def summarize(self, elapsed):
+        """
+        Turn the recorded iterations into throughput, percentiles and error rates.
+        :param elapsed: float: Wall time of the whole test in seconds.
+        """
+        logins = [sample for sample in self.samples if sample["outcome"] == "ok"]
+        errors = Counter(
+            sample["outcome"] for sample in self.samples if sample["outcome"] != "ok"
+        )
+        # Throughput is measured once every user is running.
+        window_start = min(self.ramp_up, elapsed)
+        steady = [sample for sample in logins if sample["finished"] >= window_start]
+        steady_seconds = elapsed - window_start
+        return {
+            "target": config.BASE_URL,
+            "users": self.users,
+            "ramp_up": self.ramp_up,
+            "think_time": self.think_time,
+            "elapsed_seconds": elapsed,
+            "iterations": len(self.samples),
+            "logins": len(logins),
+            "logins_per_second": len(logins) / elapsed if elapsed else 0.0,
+            "steady_logins_per_second": (
+                len(steady) / steady_seconds if steady_seconds > 0 else 0.0
+            ),
+            "login_latency": summarize([sample["login"] for sample in logins]),
+            "iteration_latency": summarize([sample["total"] for sample in logins]),
+            "errors": dict(errors),
+            "error_rate": (
+                sum(errors.values()) / len(self.samples) if self.samples else 0.0
+            ),
+            "browser_startup": summarize(self.launcher.startup_times),
+        }
+
+    def _virtual_user(self, start_at, deadline):
+        """
+        Wait for the user's ramp-up slot, then iterate until the deadline.
+        :param start_at: float: time.monotonic() value at which to start.
+        :param deadline: float: time.monotonic() value at which to stop.
+        """
+        time.sleep(max(start_at - time.monotonic(), 0))
+        try:
+            driver = self.launcher.acquire()
+        except WebDriverException:
+            self._record({"outcome": "browser_start", "finished": 0.0})
+            return
+
+        origin = deadline - self.duration
+        try:
+            while time.monotonic() < deadline:
+                sample = self._iteration(driver)
+                sample["finished"] = time.monotonic() - origin
+                self._record(sample)
+                if sample["outcome"] != "ok":
+                    try:
+                        DriverPool.reset(driver)
+                    except WebDriverException:
+                        # The browser is gone; this user stops early.
+                        break
+                pause = random.uniform(0.5, 1.5) * self.think_time
+                time.sleep(max(min(pause, deadline - time.monotonic()), 0))
+        finally:
+            driver.quit()
+
+    def _iteration(self, driver):
+        """
+        Log in, open the drop-down and log out once.
+        :param driver: WebDriver instance owned by the virtual user.
+        :return: dict: Outcome and login/total latency in seconds.
+        """
+        sample = {"outcome": "ok"}
+        login_object = Login(driver)
+        started = time.perf_counter()
+        try:
+            driver.get(config.url_for(config.LOGIN_PATH))
+            login_object.enter_username(self.username)
+            login_object.enter_password(self.password)
+            login_object.click_login()
+            sample["outcome"] = login_object.wait(config.LONG_TIMEOUT).until(
+                login_outcome, "Login neither succeeded nor failed"
+            )
+            sample["login"] = time.perf_counter() - started
+            if sample["outcome"] == "ok":
+                login_object.view_drop_down_menu()
+                login_object.click_logout()
+                login_object.wait_for_url(config.LOGIN_PATH)
+        except TimeoutException:
+            sample["outcome"] = "timeout"
+        except WebDriverException:
+            sample["outcome"] = "webdriver_error"
+        sample["total"] = time.perf_counter() - started
+        return sample
+
+    def _record(self, sample):
+        """
+        Store one iteration result.
+        :param sample: dict: Result of _iteration().
+        """
+        with self._lock:
+            self.samples.append(sample)
+
+
+def print_report(result):
+    """
+    Print the outcome of a load test.
+    :param result: dict: Output of LoadTest.run().
+    """
+    print(
+        "%(users)d users against %(target)s for %(elapsed_seconds).1fs: "
+        "%(logins)d logins in %(iterations)d iterations" % result
+    )
+    print(
+        "throughput: %.2f logins/s overall, %.2f logins/s after ramp-up"
+        % (result["logins_per_second"], result["steady_logins_per_second"])
+    )
+    for name in ("login_latency", "iteration_latency"):
+        stats = result[name]
+        print(
+            "%-18s p50 %.3fs  p95 %.3fs  p99 %.3fs"
+            % (name.replace("_", " ") + ":", stats["p50"], stats["p95"], stats["p99"])
+        )
+    print("error rate: %.1f%%" % (result["error_rate"] * 100))
+    for outcome, count in sorted(result["errors"].items()):
+        print("  %-20s %d" % (outcome, count))
+
+
+def main(argv=None):
+    """
+    Run the load test from the command line.
+    :param argv: list: Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--target",
+        default="local",
+        help='"local" for the bundled stand-in, "demo", or a base URL.',
+    )
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--ramp-up", type=float, default=10.0)
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--think-time", type=float, default=1.0)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Seconds of latency the local stand-in adds to each response.",
+    )
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="headless")
+    parser.add_argument("--username")
+    parser.add_argument("--password")
+    parser.add_argument("--output", help="Also write the result JSON here.")
+    args = parser.parse_args(argv)
+
+    standin = None
+    if args.target == "local":
+        standin = StandinServer(port=0, latency=args.latency)
+        standin.start()
+        config.BASE_URL = standin.url
+    elif args.target != "demo":
+        config.BASE_URL = args.target.rstrip("/")
+
+    try:
+        result = LoadTest(
+            args.users,
+            args.ramp_up,
+            args.duration,
+            args.think_time,
+            args.profile,
+            args.username,
+            args.password,
+        ).run()
+    finally:
+        if standin is not None:
+            standin.stop()
+
+    print_report(result)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(result, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+Compare running tests in isolated tabs of one browser against a browser per test.
+
+The same flows are run with the same concurrency in both modes while the
+memory of every browser process is sampled in the background. The report
+gives throughput, peak memory and peak memory per concurrent test.
+
+    python -m benchmarks.tabs --concurrency 4 --rounds 5
+"""
+
+# Standard library
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# First-party
+from benchmarks.flows import FLOWS
+from benchmarks.latency import StepTimer
+from utilities import config
+from utilities.browserLauncher import PROFILES, BrowserLauncher
+from utilities.driverPool import DriverPool
+from utilities.memoryMonitor import MemorySampler
+from utilities.processMemory import driver_memory
+from utilities.standin.server import StandinServer
+from utilities.tabPool import TabPool
+
+
+def run_mode(pool, memory, jobs, concurrency):
+    """
+    Run the flows through a pool with the given concurrency.
+    :param pool: DriverPool or TabPool handing out drivers.
+    :param memory: Callable returning the memory of all browsers in bytes.
+    :param jobs: list: Flow names to run, one entry per run.
+    :param concurrency: int: Flows running at the same time.
+    """
+    errors = []
+
+    def run_one(name):
+        driver = pool.checkout()
+        try:
+            FLOWS[name](driver, StepTimer())
+        except Exception as error:
+            errors.append("%s: %s" % (name, error.__class__.__name__))
+        finally:
+            pool.checkin(driver)
+
+    with MemorySampler(memory) as sampler:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as executor:
+            list(executor.map(run_one, jobs))
+        elapsed = time.perf_counter() - started
+
+    values = sampler.values
+    peak = max(values, default=0)
+    return {
+        "runs": len(jobs),
+        "errors": errors,
+        "elapsed_seconds": elapsed,
+        "flows_per_second": len(jobs) / elapsed if elapsed else 0.0,
+        "peak_memory_mib": peak / 2**20,
+        "mean_memory_mib": sum(values) / len(values) / 2**20 if values else 0.0,
+        "peak_memory_per_test_mib": peak / concurrency / 2**20,
+    }
+
+
+def browser_per_test(jobs, concurrency, profile):
+    """
+    Run the flows with one browser for each concurrent test.
+    """
+    launcher = BrowserLauncher(profile, warm=0)
+    browsers = []
+
+    def launch():
+        driver = launcher.acquire()
+        browsers.append(driver)
+        return driver
+
+    pool = DriverPool(factory=launch, size=concurrency, max_uses=len(jobs) + 1)
+    started = time.perf_counter()
+    # Boot every browser before the clock starts, as the tab mode does.
+    for driver in [pool.checkout() for _ in range(concurrency)]:
+        pool.checkin(driver)
+    setup = time.perf_counter() - started
+    try:
+        result = run_mode(
+            pool,
+            lambda: sum(driver_memory(driver) or 0 for driver in browsers) or None,
+            jobs,
+            concurrency,
+        )
+    finally:
+        pool.shutdown()
+    result["setup_seconds"] = setup
+    return result
+
+
+def tabs_in_one_browser(jobs, concurrency, profile):
+    """
+    Run the flows in isolated tabs of a single browser.
+    """
+    started = time.perf_counter()
+    pool = TabPool(concurrency, profile=profile)
+    setup = time.perf_counter() - started
+    try:
+        result = run_mode(pool, pool.memory, jobs, concurrency)
+    finally:
+        pool.shutdown()
+    result["setup_seconds"] = setup
+    return result
+
+
+MODES = {"browsers": browser_per_test, "tabs": tabs_in_one_browser}
+
+
+def main(argv=None):
+    """
+    Run the comparison from the command line.
+    :param argv: list: Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--target",
+        default="local",
+        help='"local" for the bundled stand-in, "demo", or a base URL.',
+    )
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument(
+        "--flows", nargs="+", choices=sorted(FLOWS), default=list(FLOWS)
+    )
+    parser.add_argument(
+        "--modes", nargs="+", choices=sorted(MODES), default=list(MODES)
+    )
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="headless")
+    parser.add_argument("--output", help="Also write the result JSON here.")
+    args = parser.parse_args(argv)
+
+    standin = None
+    if args.target == "local":
+        standin = StandinServer(port=0)
+        standin.start()
+        config.BASE_URL = standin.url
+    elif args.target != "demo":
+        config.BASE_URL = args.target.rstrip("/")
+
+    jobs = args.flows * args.rounds
+    results = {}
+    try:
+        for mode in args.modes:
+            results[mode] = MODES[mode](jobs, args.concurrency, args.profile)
+    finally:
+        if standin is not None:
+            standin.stop()
+
+    for mode, result in results.items():
+        print(
+            "%-9s %3d runs in %6.1fs  %5.2f flows/s  peak %7.1f MiB  "
+            "%6.1f MiB per test  setup %.1fs  %d errors"
+            % (
+                mode,
+                result["runs"],
+                result["elapsed_seconds"],
+                result["flows_per_second"],
+                result["peak_memory_mib"],
+                result["peak_memory_per_test_mib"],
+                result["setup_seconds"],
+                len(result["errors"]),
+            )
+        )
+    if "browsers" in results and "tabs" in results:
+        baseline, tabs = results["browsers"], results["tabs"]
+        if baseline["peak_memory_per_test_mib"] and baseline["flows_per_second"]:
+            print(
+                "tabs use %.0f%% of the memory per test and reach %.0f%% of the "
+                "throughput of one browser per test"
+                % (
+                    100
+                    * tabs["peak_memory_per_test_mib"]
+                    / baseline["peak_memory_per_test_mib"],
+                    100 * tabs["flows_per_second"] / baseline["flows_per_second"],
+                )
+            )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
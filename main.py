@@ -1,11 +1,81 @@
 """
 Main module to run all tests
 """
+
+# Standard library
+import argparse
+import os
+import sys
+
 # Third-party
 import pytest
 
-if __name__ == "__main__":
+# First-party
+from utilities import config
+from utilities.networkThrottle import THROTTLE_PROFILES
+from utilities.parallelRunner import ParallelRunner
+from utilities.testDaemon import TestDaemon
+
+
+def parse_args(argv=None):
+    """
+    Parse the command line; unknown arguments are passed through to pytest.
+    :param argv: list: Arguments to parse, defaults to sys.argv.
     """
-    Discover and run all tests with pytest
+    parser = argparse.ArgumentParser(description="Run the OrangeHRM test suite.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes, each with its own browser.",
+    )
+    parser.add_argument(
+        "--junitxml",
+        default=None,
+        help="Path of the merged JUnit XML report in parallel mode.",
+    )
+    parser.add_argument(
+        "--full-run",
+        action="store_true",
+        help="Run every test, not only those affected by changes since the last run.",
+    )
+    parser.add_argument(
+        "--network",
+        choices=sorted(THROTTLE_PROFILES),
+        default=None,
+        help="Emulate a network link in every browser and enforce its flow budgets.",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep a warm test daemon running; send it runs with "
+        "python -m utilities.testDaemon run [pytest args].",
+    )
+    return parser.parse_known_args(argv)
+
+
+def main(argv=None):
+    """
+    Discover and run all tests with pytest, serially or sharded across workers.
+    :param argv: list: Command line arguments.
     """
-    pytest.main(["-v", "testCases"])
+    args, pytest_args = parse_args(argv)
+    pytest_args = pytest_args or ["testCases"]
+    if args.full_run:
+        config.FULL_RUN = True
+        # Picked up by the collection and worker subprocesses in parallel mode.
+        os.environ["ORANGEHRM_FULL_RUN"] = "1"
+    if args.network:
+        config.NETWORK_THROTTLE = args.network
+        os.environ["ORANGEHRM_NETWORK_THROTTLE"] = args.network
+    if args.daemon:
+        return TestDaemon().serve()
+    if args.workers > 1:
+        return ParallelRunner(args.workers, args.junitxml).run(pytest_args)
+    if args.junitxml:
+        pytest_args.append("--junitxml=%s" % args.junitxml)
+    return pytest.main(["-v", *pytest_args])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,393 @@
+"""
+Defines the BasePage class shared by all page objects.
+"""
+
+# Standard library
+import json
+import os
+
+# Third-party
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions
+
+# First-party
+from utilities import config
+from utilities.browserLauncher import get_profile
+from utilities.waits import (
+    Wait,
+    first_clickable,
+    navigation_settled,
+    no_pending_xhr,
+    url_contains,
+)
+
+# Verified faster equivalents of locator XPaths, written by
+# utilities/locatorProfiler.py. Shipped empty: selectors only hold for the
+# deployment they were verified against, so each one profiles its own.
+FAST_SELECTORS_PATH = os.path.join(os.path.dirname(__file__), "fastSelectors.json")
+
+# Resolves a batch of locators and reports their state in one round trip. Each
+# locator is a [by, value] pair as returned by BasePage.selector().
+VISIBILITY_REPORT_SCRIPT = """
+var locators = arguments[0], report = {};
+Object.keys(locators).forEach(function (name) {
+    var by = locators[name][0], value = locators[name][1];
+    var node = by === 'css selector'
+        ? document.querySelector(value)
+        : document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    var displayed = false;
+    if (node) {
+        var style = window.getComputedStyle(node);
+        displayed = node.getClientRects().length > 0
+            && style.visibility !== 'hidden'
+            && parseFloat(style.opacity) > 0;
+    }
+    report[name] = {
+        present: !!node,
+        displayed: displayed,
+        clickable: displayed && !node.disabled
+    };
+});
+return report;
+"""
+
+
+def load_fast_selectors(path=FAST_SELECTORS_PATH):
+    """
+    Read the fast-selector table, or return an empty one if it does not exist
+    or was verified against another application than config.BASE_URL.
+    :param path: str: JSON file written by utilities/locatorProfiler.py.
+    """
+    try:
+        with open(path, encoding="utf-8") as handle:
+            table = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if table.get("base_url") != config.BASE_URL:
+        return {}
+    return table.get("selectors", {})
+
+
+def _displayed_check(suffix, locator):
+    """
+    Build an is_<suffix>_displayed method checking a single locator.
+    :param suffix: str: Method name suffix.
+    :param locator: str: Locator name in the page's locator table.
+    """
+
+    def is_displayed(self):
+        return self.is_locator_displayed(locator)
+
+    is_displayed.__name__ = "is_%s_displayed" % suffix
+    is_displayed.__doc__ = """
+        Check if the %s option is displayed.
+        """ % suffix.replace("_", " ").title()
+    return is_displayed
+
+
+class BasePage:
+    """
+    Base class for page objects, providing navigation and waiting helpers.
+
+    Subclasses describe their elements declaratively:
+
+    - ``locators`` maps a locator name to its XPath. Every entry is also exposed
+      as a class attribute, so ``Login.username_field`` is still the XPath string.
+    - ``displayed_checks`` maps a method suffix to a locator name and generates
+      an ``is_<suffix>_displayed`` method for each entry.
+
+    Both tables are merged with those of the parent classes.
+    """
+
+    locators = {}
+    displayed_checks = {}
+    # Locator names covered by visibility_report(), derived from displayed_checks.
+    report_locators = ()
+
+    # Errors after which a cached element is looked up again before retrying.
+    retry_exceptions = (
+        StaleElementReferenceException,
+        ElementNotInteractableException,
+        ElementClickInterceptedException,
+    )
+
+    # Objects told about page events; see add_listener().
+    listeners = []
+
+    # "Class.locator" to a verified faster selector for the locator's XPath.
+    fast_selectors = load_fast_selectors() if config.FAST_SELECTORS else {}
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Merge the locator tables and generate the accessor methods they describe.
+        """
+        super().__init_subclass__(**kwargs)
+        own_locators = cls.__dict__.get("locators", {})
+        own_checks = cls.__dict__.get("displayed_checks", {})
+        cls.locators = {**super(cls, cls).locators, **own_locators}
+        cls.displayed_checks = {**super(cls, cls).displayed_checks, **own_checks}
+
+        for name, xpath in own_locators.items():
+            setattr(cls, name, xpath)
+        for suffix, locator in own_checks.items():
+            method = _displayed_check(suffix, locator)
+            method.__qualname__ = "%s.%s" % (cls.__qualname__, method.__name__)
+            setattr(cls, method.__name__, method)
+        if own_checks:
+            cls.report_locators = tuple(dict.fromkeys(cls.displayed_checks.values()))
+
+    @classmethod
+    def page_classes(cls):
+        """
+        Yield every page-object class derived from this one.
+        """
+        for subclass in cls.__subclasses__():
+            yield subclass
+            yield from subclass.page_classes()
+
+    @staticmethod
+    def add_listener(listener):
+        """
+        Register an object to be told about page events.
+
+        For every event the listener's ``on_<event>(page, *args)`` method is
+        called if it has one. Events:
+
+        - ``locator(name)``: a locator name is about to be resolved.
+        - ``located(states)``: elements were found; maps locator names to
+          whether they had to be clickable.
+        - ``leaving()``: the page is about to navigate away from the current
+          document, which is still loaded.
+        - ``navigation()``: the page is navigating and cached elements were
+          dropped.
+        - ``loaded()``: a document finished loading.
+        :param listener: Object with on_<event> methods.
+        """
+        if listener not in BasePage.listeners:
+            BasePage.listeners.append(listener)
+
+    @staticmethod
+    def remove_listener(listener):
+        """
+        Stop telling a listener about page events.
+        :param listener: Object previously passed to add_listener().
+        """
+        if listener in BasePage.listeners:
+            BasePage.listeners.remove(listener)
+
+    def __init__(self, driver):
+        """
+        Initialize the page object.
+        :param driver: WebDriver instance for controlling the browser.
+        """
+        self.driver = driver
+        if get_profile().maximize:
+            self.driver.maximize_window()
+        self._elements = {}
+        # Locator name to whether it was clickable, for the current page state.
+        self._clickable = {}
+
+    def click_url(self):
+        """
+        Open the specified URL.
+        """
+        self._notify("leaving")
+        self.invalidate()
+        self.driver.get(self.url)
+        self._notify("loaded")
+
+    def locator(self, name):
+        """
+        Return the XPath behind a locator name.
+        :param name: str: Locator name.
+        """
+        self._notify("locator", name)
+        return getattr(self, name)
+
+    def selector(self, name):
+        """
+        Return the fastest known (By, value) pair for a locator name.
+
+        A fast selector is only used while the XPath it was verified against is
+        still the locator's XPath, so editing a locator never uses a stale one.
+        :param name: str: Locator name.
+        """
+        xpath = self.locator(name)
+        for cls in type(self).__mro__:
+            fast = self.fast_selectors.get("%s.%s" % (cls.__name__, name))
+            if fast is not None and fast["xpath"] == xpath:
+                return fast["by"], fast["value"]
+        return By.XPATH, xpath
+
+    def invalidate(self):
+        """
+        Forget cached elements and visibility results, e.g. after a navigation.
+        """
+        self._elements.clear()
+        self._clickable.clear()
+        self._notify("navigation")
+
+    def find(
+        self, name, condition=expected_conditions.element_to_be_clickable, timeout=None
+    ):
+        """
+        Return the element behind a locator, reusing the handle cached on this page.
+        :param name: str: Locator name.
+        :param condition: expected_conditions factory the element must satisfy.
+        :param timeout: float: Seconds to wait, defaults to config.DEFAULT_TIMEOUT.
+        """
+        element = self._elements.get(name)
+        if element is None:
+            element = self.wait(timeout).until_element(self.selector(name), condition)
+            self._elements[name] = element
+            self._notify(
+                "located",
+                {name: condition is expected_conditions.element_to_be_clickable},
+            )
+        return element
+
+    def find_first(self, names, timeout=None):
+        """
+        Return whichever of several alternative locators becomes clickable first.
+
+        Lets a page object support several versions of the UI: all alternatives
+        are polled together, so a page needing the last one is as fast as a page
+        needing the first. The winning element is cached under its own name.
+        :param names: list: Locator names, most preferred first.
+        :param timeout: float: Seconds to wait, defaults to config.DEFAULT_TIMEOUT.
+        :return: tuple: (name of the matching locator, WebElement).
+        """
+        for name in names:
+            if name in self._elements:
+                return name, self._elements[name]
+        index, element = self.wait(timeout).until(
+            first_clickable([self.selector(name) for name in names]),
+            "None of %s became clickable" % ", ".join(names),
+        )
+        name = names[index]
+        self._elements[name] = element
+        self._notify("located", {name: True})
+        return name, element
+
+    def interact(
+        self,
+        name,
+        action,
+        condition=expected_conditions.element_to_be_clickable,
+        timeout=None,
+    ):
+        """
+        Run an action on a cached element, looking it up again once if it went stale.
+        :param name: str: Locator name.
+        :param action: Callable receiving the WebElement.
+        :param condition: expected_conditions factory the element must satisfy.
+        :param timeout: float: Seconds to wait, defaults to config.DEFAULT_TIMEOUT.
+        """
+        try:
+            return action(self.find(name, condition, timeout))
+        except self.retry_exceptions:
+            self._elements.pop(name, None)
+            return action(self.find(name, condition, timeout))
+
+    def wait(self, timeout=None):
+        """
+        Return a Wait bound to this page's driver.
+        :param timeout: float: Seconds to wait, defaults to config.DEFAULT_TIMEOUT.
+        """
+        return Wait(self.driver, timeout)
+
+    def wait_for_url(self, text, timeout=None):
+        """
+        Wait until the current URL contains the given text.
+        :param text: str: Expected part of the URL.
+        :param timeout: float: Seconds to wait, defaults to config.DEFAULT_TIMEOUT.
+        """
+        return self.wait(timeout).until(
+            url_contains(text), "URL never contained %r" % text
+        )
+
+    def wait_for_page_ready(self, timeout=None):
+        """
+        Wait until navigation has settled and no XHR or fetch request is pending.
+        :param timeout: float: Seconds to wait, defaults to config.DEFAULT_TIMEOUT.
+        """
+        wait = self.wait(timeout)
+        wait.until(navigation_settled(), "Navigation did not settle")
+        wait.until(no_pending_xhr(), "Requests were still pending")
+        self._notify("loaded")
+
+    def visibility_report(self, names=None, timeout=None):
+        """
+        Report the state of several locators, polling until all are clickable.
+
+        Every poll is a single execute_script round trip. When the timeout passes
+        the last report is returned rather than raising. The result is kept,
+        negative or not, until the page is invalidated.
+        :param names: iterable: Locator attribute names, defaults to report_locators.
+        :param timeout: float: Seconds to wait, defaults to config.DEFAULT_TIMEOUT.
+        :return: dict: Name to {"present", "displayed", "clickable"} booleans.
+        """
+        locators = {
+            name: self.selector(name)
+            for name in (self.report_locators if names is None else names)
+        }
+        last_report = {}
+
+        def all_clickable(driver):
+            last_report.update(
+                driver.execute_script(VISIBILITY_REPORT_SCRIPT, locators)
+            )
+            return all(state["clickable"] for state in last_report.values())
+
+        try:
+            self.wait(timeout).until(all_clickable)
+        except TimeoutException:
+            pass
+        self._clickable.update(
+            (name, state["clickable"]) for name, state in last_report.items()
+        )
+        self._notify(
+            "located",
+            {name: True for name, state in last_report.items() if state["clickable"]},
+        )
+        return last_report
+
+    def is_locator_displayed(self, name):
+        """
+        Check if the element behind a locator attribute is displayed and clickable.
+
+        The first check on a page reports on all of report_locators at once, so
+        the checks that follow are answered without another round trip, and a
+        page that is known to be wrong is not waited on again.
+        :param name: str: Locator attribute name.
+        """
+        if name not in self._clickable:
+            if name in self.report_locators:
+                names = [
+                    other
+                    for other in self.report_locators
+                    if other not in self._clickable
+                ]
+            else:
+                names = [name]
+            self.visibility_report(names)
+        return self._clickable[name]
+
+    def _notify(self, event, *args):
+        """
+        Call the on_<event> method of every listener that has one.
+        :param event: str: Event name.
+        :param args: Event arguments passed after the page.
+        """
+        for listener in BasePage.listeners:
+            handler = getattr(listener, "on_" + event, None)
+            if handler is not None:
+                handler(self, *args)
@@ -5,171 +5,209 @@ Defines the Login class for handling login-related web page actions.
 # Third-party
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions
-from selenium.webdriver.support.wait import WebDriverWait
+
+# First-party
+from pageObjects.basePage import BasePage
+from utilities import config
+
+present = expected_conditions.presence_of_element_located
+
+# Marks the error messages already on the page, so the next ones can be told
+# apart even when their text is the same.
+MARK_LOGIN_ERRORS_SCRIPT = """
+arguments[0].forEach(function (xpath) {
+    var nodes = document.evaluate(
+        xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    for (var index = 0; index < nodes.snapshotLength; index++) {
+        nodes.snapshotItem(index).setAttribute('data-orangehrm-seen', '');
+    }
+});
+"""
+
+# Empties an input field and lets the application's data binding know.
+CLEAR_FIELD_SCRIPT = """
+arguments[0].value = '';
+arguments[0].dispatchEvent(new Event('input', {bubbles: true}));
+"""
+
+# Returns the text of the first unmarked, non-empty error message, or null.
+NEW_LOGIN_ERROR_SCRIPT = """
+var xpaths = arguments[0];
+for (var outer = 0; outer < xpaths.length; outer++) {
+    var nodes = document.evaluate(
+        xpaths[outer], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    for (var index = 0; index < nodes.snapshotLength; index++) {
+        var node = nodes.snapshotItem(index), text = node.textContent.trim();
+        if (text && !node.hasAttribute('data-orangehrm-seen')) {
+            return text;
+        }
+    }
+}
+return null;
+"""
 
 
-class Login:
+class Login(BasePage):
     """
     Class for handling login related web-page actions.
     """
 
-    url = "https://opensource-demo.orangehrmlive.com/web/index.php/auth/login"
-    login_form = "//div[@class='orangehrm-login-form']"
-    forgot_password_link_v1 = ".//*[text()='Forgot your password?']"
-    forgot_password_link_v2 = "//p[text() ='Forgot your password? ']"
-    forgot_password_header = "//p[contains(@class, 'orangehrm-login-forgot-header')]"
-    username_field = "//input[@name='username']"
-    password_field = "//input[@name='password']"
-    reset_password_button = (
-        "//button[contains(@class, 'orangehrm-forgot-password-button--reset')]"
-    )
-    reset_link_sent_message = "//*[text()='Reset Password link sent successfully']"
-    user_drop_down_menu = "//li[@class='oxd-userdropdown']"
-    drop_down_menu = "//ul[@class='oxd-dropdown-menu']"
-    login_button = "//button[@type='submit']"
-    logout_button = "//li/a[contains(@href,'logout')]"
-    login_form_error = "//div[@class='orangehrm-login-error']"
-    required_field = "//span[contains(@class, 'oxd-input-field-error-message')]"
-
-    def __init__(self, driver):
-        """
-        Initialize the Admin instance.
-        :param driver: WebDriver instance for controlling the browser.
-        """
-        self.driver = driver
-        self.driver.maximize_window()
-
-    def click_url(self):
-        """
-        Open the specified URL.
-        """
-        self.driver.get(self.url)
+    url = config.url_for(config.LOGIN_PATH)
+    locators = {
+        "login_form": "//div[@class='orangehrm-login-form']",
+        # Scoped to the forgot-password header, which used to be located first.
+        "forgot_password_link_v1": (
+            "//p[contains(@class, 'orangehrm-login-forgot-header')]"
+            "//*[text()='Forgot your password?']"
+        ),
+        "forgot_password_link_v2": "//p[text() ='Forgot your password? ']",
+        "username_field": "//input[@name='username']",
+        "password_field": "//input[@name='password']",
+        "reset_password_button": (
+            "//button[contains(@class, 'orangehrm-forgot-password-button--reset')]"
+        ),
+        "reset_link_sent_message": (
+            "//*[text()='Reset Password link sent successfully']"
+        ),
+        "user_drop_down_menu": "//li[@class='oxd-userdropdown']",
+        "drop_down_menu": "//ul[@class='oxd-dropdown-menu']",
+        "login_button": "//button[@type='submit']",
+        "logout_button": "//li/a[contains(@href,'logout')]",
+        "login_form_error": "//div[@class='orangehrm-login-error']",
+        "required_field": "//span[contains(@class, 'oxd-input-field-error-message')]",
+    }
 
     def enter_username(self, username):
         """
         Enter the username and press Enter.
         :param username: str: Username to be entered.
         """
-        element = WebDriverWait(self.driver, 10).until(
-            expected_conditions.element_to_be_clickable((By.XPATH, self.username_field))
-        )
-        element.send_keys(username)
+        self.interact("username_field", lambda element: element.send_keys(username))
 
     def enter_password(self, password):
         """
         Enter the password.
         :param password: str: Password to be entered.
         """
-        WebDriverWait(self.driver, 10).until(
-            expected_conditions.element_to_be_clickable((By.XPATH, self.password_field))
-        ).send_keys(password)
+        self.interact("password_field", lambda element: element.send_keys(password))
 
     def click_login(self):
         """
         Click the login button.
         """
-        WebDriverWait(self.driver, 10).until(
-            expected_conditions.element_to_be_clickable((By.XPATH, self.login_button))
-        ).click()
+        self._notify("leaving")
+        self.interact("login_button", lambda element: element.click())
+        self.invalidate()
 
     def click_forgot_password_link(self):
         """
-        Click the 'Forgot your password?' link.
-        """
-        try:
-            header_elem = WebDriverWait(self.driver, 10).until(
-                expected_conditions.presence_of_element_located(
-                    (By.XPATH, self.forgot_password_header)
-                )
-            )
-            WebDriverWait(header_elem, 10).until(
-                expected_conditions.element_to_be_clickable(
-                    (By.XPATH, self.forgot_password_link_v1)
-                )
-            ).click()
-        except:
-            WebDriverWait(self.driver, 10).until(
-                expected_conditions.element_to_be_clickable(
-                    (By.XPATH, self.forgot_password_link_v2)
-                )
-            ).click()
+        Click the 'Forgot your password?' link, whichever UI version shows it.
+        :return: str: Name of the locator variant that matched.
+        """
+        variant, element = self.find_first(
+            ["forgot_password_link_v1", "forgot_password_link_v2"]
+        )
+        self._notify("leaving")
+        element.click()
+        self.invalidate()
+        return variant
 
     def click_reset_password_button(self):
         """
         Click the 'Reset Password' button.
         """
-        button = WebDriverWait(self.driver, 10).until(
-            expected_conditions.element_to_be_clickable(
-                (By.XPATH, self.reset_password_button)
-            )
-        )
-        button.click()
+        self._notify("leaving")
+        self.interact("reset_password_button", lambda element: element.click())
+        self.invalidate()
 
     def check_reset_link_sent_message(self):
         """
         Check if the 'Reset Password link sent successfully' message is displayed.
         """
-        element = WebDriverWait(self.driver, 30).until(
-            expected_conditions.presence_of_element_located(
-                (By.XPATH, self.reset_link_sent_message)
-            )
+        return self.interact(
+            "reset_link_sent_message",
+            lambda element: element.is_displayed(),
+            present,
+            config.LONG_TIMEOUT,
+        )
+
+    def login_error(self, username, password, timeout=None):
+        """
+        Submit credentials on the loaded login page and return the error they cause.
+
+        Meant to be called repeatedly on the same page: the fields are cleared
+        before typing, and the wait is for an error message that was not on the
+        page before this submit, whether the form re-rendered in place or the
+        page reloaded. The login page is only loaded again if a previous
+        attempt left it.
+        :param username: str: Username to submit.
+        :param password: str: Password to submit.
+        :param timeout: float: Seconds to wait, defaults to config.LONG_TIMEOUT.
+        :return: str: Text of the invalid credentials or required field message.
+        """
+        if config.LOGIN_PATH not in self.driver.current_url:
+            self.click_url()
+        errors = [self.locator("login_form_error"), self.locator("required_field")]
+        self.driver.execute_script(MARK_LOGIN_ERRORS_SCRIPT, errors)
+
+        def retype(element, value):
+            # Select-all key bindings differ per platform; clear the field in JS.
+            self.driver.execute_script(CLEAR_FIELD_SCRIPT, element)
+            if value:
+                element.send_keys(value)
+
+        for name, value in (("username_field", username), ("password_field", password)):
+            self.interact(name, lambda element, value=value: retype(element, value))
+        self.click_login()
+        return self.wait(config.LONG_TIMEOUT if timeout is None else timeout).until(
+            lambda driver: driver.execute_script(NEW_LOGIN_ERROR_SCRIPT, errors),
+            "No login error appeared for %r / %r" % (username, password),
         )
-        return element.is_displayed()
 
     def view_drop_down_menu(self):
         """
         View the user drop-down menu.
         """
-        WebDriverWait(self.driver, 30).until(
-            expected_conditions.presence_of_element_located(
-                (By.XPATH, self.user_drop_down_menu)
-            )
-        ).click()
-
-        WebDriverWait(self.driver, 30).until(
-            expected_conditions.presence_of_element_located(
-                (By.XPATH, self.drop_down_menu)
-            )
+        self.interact(
+            "user_drop_down_menu",
+            lambda element: element.click(),
+            present,
+            config.LONG_TIMEOUT,
         )
+        self.find("drop_down_menu", present, config.LONG_TIMEOUT)
 
     def click_logout(self):
         """
         Click the logout button.
         """
-        WebDriverWait(self.driver, 10).until(
-            expected_conditions.element_to_be_clickable((By.XPATH, self.logout_button))
-        ).click()
+        self._notify("leaving")
+        self.interact("logout_button", lambda element: element.click())
+        self.invalidate()
 
     def is_login_form_displayed(self):
         """
         Check if the login form is displayed.
         """
-        login_form = WebDriverWait(self.driver, 10).until(
-            expected_conditions.presence_of_element_located((By.XPATH, self.login_form))
+        return self.interact(
+            "login_form", lambda element: element.is_displayed(), present
         )
-        return login_form.is_displayed()
 
     def invalid_credentials_message(self):
         """
         Get the invalid credentials error message.
         """
-        alert_message = WebDriverWait(self.driver, 10).until(
-            expected_conditions.presence_of_element_located(
-                (By.XPATH, self.login_form_error)
-            )
-        )
-        return alert_message.text
+        return self.interact("login_form_error", lambda element: element.text, present)
 
     def required_field_message(self):
         """
         Get the required field error message.
         """
-        alert_message = WebDriverWait(self.driver, 10).until(
-            expected_conditions.presence_of_element_located(
-                (By.XPATH, self.login_form_error)
-            )
-        )
-        required_field_message = alert_message.find_element(
-            By.XPATH, self.required_field
+        return self.interact(
+            "login_form_error",
+            lambda element: element.find_element(
+                By.XPATH, self.locator("required_field")
+            ).text,
+            present,
         )
-        return required_field_message.text
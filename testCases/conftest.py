@@ -0,0 +1,449 @@
+"""
+Shared pytest fixtures and hooks for the OrangeHRM test cases.
+"""
+
+# Standard library
+import time
+from collections import defaultdict
+
+# Third-party
+import pytest
+
+# First-party
+from pageObjects.basePage import BasePage
+from pageObjects.loginPage import Login
+from utilities import config, instrumentation, testDaemon
+from utilities.domSnapshot import SnapshotRecorder
+from utilities.driverPool import DriverPool
+from utilities.durations import DurationStore
+from utilities.failureArtifacts import ArtifactCollector
+from utilities.memoryMonitor import MemoryMonitor
+from utilities.networkThrottle import budget_breakdown, get_throttle
+from utilities.perfMetrics import PerformanceHarvester
+from utilities.sessionCache import SessionCache
+from utilities.standin.server import StandinServer
+from utilities.testImpact import ImpactIndex, ImpactRecorder
+
+_measured_durations = defaultdict(float)
+_network_savings = {}
+_impact_recorder = ImpactRecorder()
+_impact_reasons = {}
+_impact_deselected = []
+launcher_report_key = pytest.StashKey()
+memory_report_key = pytest.StashKey()
+artifacts_key = pytest.StashKey()
+test_start_key = pytest.StashKey()
+
+
+def pytest_collection_modifyitems(session, items):
+    """
+    Deselect the tests that nothing they depend on changed for since their last pass.
+    """
+    # A test daemon imports this module once for many sessions.
+    _impact_reasons.clear()
+    _impact_deselected.clear()
+    _network_savings.clear()
+    _impact_recorder.install()
+    if config.FULL_RUN:
+        return
+    selected, deselected, reasons = ImpactIndex().select(items)
+    if deselected:
+        session.config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    _impact_reasons.update(reasons)
+    _impact_deselected.extend(item.nodeid for item in deselected)
+
+
+def pytest_configure(config):
+    """
+    Register the markers used by the test cases.
+    """
+    config.addinivalue_line(
+        "markers",
+        "budget(**seconds): seconds the test may take from its first navigation "
+        "per network throttle profile, e.g. budget(wan=4.0)",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Enforce flow budgets, and capture failure artifacts while the failed test
+    still holds its browser.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if call.when == "call" and report.passed:
+        _check_budget(item, call, report)
+    collector = item.config.stash.get(artifacts_key, None)
+    # By teardown the browser has gone back to the pool and been reset.
+    if not report.failed or collector is None or call.when == "teardown":
+        return
+    driver = _test_driver(item)
+    if driver is not None:
+        path = collector.capture(
+            item.nodeid, driver, item.stash.get(test_start_key, None), call.when
+        )
+        report.sections.append(("failure artifacts", path))
+
+
+def _check_budget(item, call, report):
+    """
+    Fail a passed test whose flow took longer than its budget on the emulated network.
+
+    The flow runs from the moment a fixture had a browser ready for the test,
+    before fixtures such as admin_session load its first page, to the end of its
+    body. Tests without such a fixture are timed over their body.
+    """
+    marker = item.get_closest_marker("budget")
+    profile = get_throttle()
+    budget = marker.kwargs.get(profile.name) if marker else None
+    start = item.stash.get(test_start_key, call.start)
+    seconds = call.stop - start
+    if budget is None or seconds <= budget:
+        return
+    harvester = item.funcargs.get("perf_metrics")
+    page_loads = []
+    if harvester is not None:
+        driver = _test_driver(item)
+        if driver is not None:
+            harvester.harvest(driver)
+        page_loads = harvester.page_loads(item.nodeid)
+    spans = (
+        instrumentation.tracer.spans_since(start)
+        if instrumentation.is_enabled()
+        else []
+    )
+    report.outcome = "failed"
+    report.longrepr = budget_breakdown(seconds, budget, profile, spans, page_loads)
+
+
+def _start_flow(request):
+    """
+    Start a test's budget clock, once its browser is checked out and logged in.
+    :param request: pytest FixtureRequest of the test.
+    """
+    request.node.stash[test_start_key] = time.time()
+
+
+def _test_driver(item):
+    """
+    Return the WebDriver a test received through its fixtures, if any.
+    """
+    for value in getattr(item, "funcargs", {}).values():
+        driver = getattr(value, "driver", value)
+        if hasattr(driver, "get_screenshot_as_base64"):
+            return driver
+    return None
+
+
+def pytest_runtest_logreport(report):
+    """
+    Accumulate setup, call and teardown time for every test.
+    """
+    _measured_durations[report.nodeid] += report.duration
+    _impact_recorder.report(report.nodeid, report.outcome)
+
+
+def pytest_sessionfinish(session):
+    """
+    Save this run's test durations so the parallel runner can balance later runs,
+    and the dependencies each test used.
+    """
+    if _measured_durations:
+        DurationStore().update(dict(_measured_durations))
+        _measured_durations.clear()
+    if _impact_recorder.records:
+        ImpactIndex().update(_impact_recorder.records)
+        _impact_recorder.records.clear()
+    elif (
+        _impact_deselected and session.exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED
+    ):
+        # Nothing changed since the last green run, which is a success.
+        session.exitstatus = pytest.ExitCode.OK
+    # Restore the page objects for whatever imports them next, e.g. the test
+    # daemon's next run.
+    _impact_recorder.uninstall()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def standin_server():
+    """
+    Fixture serving the local OrangeHRM stand-in when ORANGEHRM_TARGET=local.
+    """
+    if config.TARGET != "local":
+        yield None
+        return
+    server = StandinServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Report the impact selection, browser startup, network savings and memory.
+    """
+    if _impact_deselected:
+        terminalreporter.write_sep("-", "test impact selection")
+        terminalreporter.write_line(
+            "%d tests deselected as unaffected; set ORANGEHRM_FULL_RUN=1 to run all"
+            % len(_impact_deselected)
+        )
+        for node_id, reason in _impact_reasons.items():
+            terminalreporter.write_line("%s: %s" % (node_id, reason))
+
+    report = config.stash.get(launcher_report_key, None)
+    if report and report["launches"]:
+        terminalreporter.write_sep("-", "browser startup")
+        terminalreporter.write_line(
+            "%(profile)s: %(launches)d launches, min %(min).2fs, "
+            "mean %(mean).2fs, max %(max).2fs" % report
+        )
+
+    if any(savings["blocked_requests"] for savings in _network_savings.values()):
+        terminalreporter.write_sep("-", "network filter savings")
+        for node_id, savings in _network_savings.items():
+            terminalreporter.write_line(
+                "%s: %d requests, %.1f KiB blocked (%d of unknown size)"
+                % (
+                    node_id,
+                    savings["blocked_requests"],
+                    savings["bytes_saved"] / 1024,
+                    savings["unknown_size"],
+                )
+            )
+
+    memory = config.stash.get(memory_report_key, None)
+    if memory and memory["tests"]:
+        terminalreporter.write_sep("-", "browser memory")
+        for node_id, summary in memory["tests"].items():
+            terminalreporter.write_line(
+                "%s: %.0f -> %.0f MiB, peak %.0f MiB (test %d on this browser)"
+                % (
+                    node_id,
+                    summary["start"]["total"] / 2**20,
+                    summary["end"]["total"] / 2**20,
+                    summary["peak"]["total"] / 2**20,
+                    summary["browser_tests"],
+                )
+            )
+        if memory["recycled"]:
+            terminalreporter.write_line(
+                "browsers recycled: "
+                + ", ".join(
+                    "%d for %s" % (count, reason)
+                    for reason, count in memory["recycled"].items()
+                    if count
+                )
+            )
+
+
+@pytest.fixture(autouse=True)
+def impact_record(request):
+    """
+    Fixture recording the locators and page-object methods a test uses.
+    """
+    _impact_recorder.begin(request.node.nodeid, str(request.node.path))
+    yield
+    _impact_recorder.end()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def dom_snapshots():
+    """
+    Fixture saving DOM snapshots for offline locator replay when
+    ORANGEHRM_SNAPSHOTS is set.
+    """
+    if not config.SNAPSHOTS:
+        yield None
+        return
+    recorder = SnapshotRecorder()
+    BasePage.add_listener(recorder)
+    yield recorder
+    BasePage.remove_listener(recorder)
+    recorder.save()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def failure_artifacts(request):
+    """
+    Fixture collecting failure artifacts unless ORANGEHRM_ARTIFACTS=0.
+    """
+    if not config.FAILURE_ARTIFACTS:
+        yield None
+        return
+    collector = ArtifactCollector()
+    request.config.stash[artifacts_key] = collector
+    yield collector
+    del request.config.stash[artifacts_key]
+    collector.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def perf_metrics():
+    """
+    Fixture recording page-load metrics unless ORANGEHRM_PERF_METRICS=0.
+    """
+    if not config.PERF_METRICS:
+        yield None
+        return
+    harvester = PerformanceHarvester()
+    BasePage.add_listener(harvester)
+    yield harvester
+    BasePage.remove_listener(harvester)
+    harvester.save()
+
+
+@pytest.fixture(autouse=True)
+def perf_test(request, perf_metrics):
+    """
+    Fixture filing the page metrics recorded during a test under its node id.
+    """
+    if perf_metrics is not None:
+        perf_metrics.test = request.node.nodeid
+    yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def tracing():
+    """
+    Fixture installing the step instrumentation when ORANGEHRM_TRACE is set, or
+    when a network throttle is active so flow budgets can report their steps.
+    """
+    if not (config.TRACE or get_throttle().active):
+        yield None
+        return
+    yield instrumentation.enable()
+    instrumentation.disable()
+
+
+@pytest.fixture(autouse=True)
+def trace_test(request, tracing):
+    """
+    Fixture collecting the spans of each test while tracing, and writing the
+    per-test JSON and trace-event files when ORANGEHRM_TRACE is set.
+    """
+    if tracing is None:
+        yield
+        return
+    tracing.begin(request.node.nodeid)
+    yield
+    if config.TRACE:
+        tracing.end()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Fixture providing the browser pool shared by the whole test session.
+    """
+    if testDaemon.persistent_pool:
+        # The test daemon keeps its pool, and the browsers in it, between runs.
+        yield testDaemon.persistent_pool
+        request.config.stash[launcher_report_key] = (
+            testDaemon.persistent_pool.launcher.report()
+        )
+        return
+    pool = DriverPool()
+    yield pool
+    pool.shutdown()
+    request.config.stash[launcher_report_key] = pool.launcher.report()
+
+
+@pytest.fixture(scope="session")
+def memory_monitor(request, driver_pool):
+    """
+    Fixture recording a memory curve of the browser for every test.
+    """
+    monitor = MemoryMonitor()
+    yield monitor
+    monitor.save()
+    summaries = {name: monitor.summary(name) for name in monitor.tests}
+    request.config.stash[memory_report_key] = {
+        "tests": {name: summary for name, summary in summaries.items() if summary},
+        "recycled": getattr(driver_pool, "recycled", {}),
+    }
+
+
+@pytest.fixture()
+def setup(request, driver_pool, memory_monitor, perf_metrics):
+    """
+    Fixture to check out a warm WebDriver instance for a single test case.
+
+    Under the test daemon, tests using admin_session get its logged-in browser.
+    """
+    session_browser = (
+        testDaemon.session_browser if "admin_session" in request.fixturenames else None
+    )
+    driver = session_browser.checkout() if session_browser else driver_pool.checkout()
+    instrumentation.attach(driver)
+    # Drop log entries left over from the browser's previous test.
+    driver_pool.network_filter.collect(driver)
+    _start_flow(request)
+    with memory_monitor.watch(request.node.nodeid, driver):
+        yield driver
+    if perf_metrics is not None:
+        # The last page a test loaded has no later navigation to harvest it.
+        perf_metrics.harvest(driver)
+    _network_savings[request.node.nodeid] = driver_pool.network_filter.collect(driver)
+    if session_browser:
+        session_browser.checkin()
+    else:
+        driver_pool.checkin(driver)
+
+
+@pytest.fixture(scope="module")
+def shared_login_page(driver_pool, perf_metrics):
+    """
+    Fixture loading one login page for all the cases of a table-driven test.
+    """
+    driver = driver_pool.checkout()
+    instrumentation.attach(driver)
+    login_object = Login(driver)
+    login_object.click_url()
+    login_object.is_login_form_displayed()
+    yield login_object
+    if perf_metrics is not None:
+        perf_metrics.harvest(driver)
+    driver_pool.checkin(driver)
+
+
+@pytest.fixture()
+def login_page(request, shared_login_page, driver_pool, memory_monitor):
+    """
+    Fixture handing each case the shared login page, with the memory curve and
+    network savings recorded per case as setup does.
+    """
+    driver = shared_login_page.driver
+    # Drop log entries left over from the page load or the previous case.
+    driver_pool.network_filter.collect(driver)
+    _start_flow(request)
+    with memory_monitor.watch(request.node.nodeid, driver):
+        yield shared_login_page
+    _network_savings[request.node.nodeid] = driver_pool.network_filter.collect(driver)
+
+
+@pytest.fixture(scope="session")
+def session_cache():
+    """
+    Fixture providing the login session shared by tests that only need to be logged in.
+    """
+    return SessionCache()
+
+
+@pytest.fixture()
+def admin_session(request, setup, session_cache):
+    """
+    Fixture to open the Admin module with a cached login, skipping the login form.
+    """
+    session_browser = testDaemon.session_browser
+    if session_browser and session_browser.driver is setup:
+        session_browser.open(config.ADMIN_PATH)
+        return setup
+    # Log in before the flow budget clock starts; open() reuses the saved session.
+    if session_cache.load() is None:
+        session_cache.refresh(setup)
+    _start_flow(request)
+    session_cache.open(setup, config.ADMIN_PATH)
+    return setup
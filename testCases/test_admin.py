@@ -4,26 +4,11 @@ Module Description: Test cases for the Admin Page.
 This module contains test cases to validate the functionality of the Admin Page.
 """
 
-# Standard library
-import time
-
 # Third-party
 import pytest
-from selenium import webdriver
 
 # First-party
 from pageObjects.adminPage import AdminHeader, AdminMainMenu
-from pageObjects.loginPage import Login
-
-
-@pytest.fixture()
-def setup():
-    """
-    Fixture to set up the WebDriver instance before running each test case.
-    """
-    driver = webdriver.Chrome()
-    yield driver
-    driver.quit()
 
 
 class TestAdminPage:
@@ -31,25 +16,12 @@ class TestAdminPage:
     Test class for validating the Admin Page.
     """
 
-    url = "https://opensource-demo.orangehrmlive.com/web/index.php/auth/login"
-    ADMIN_USERNAME = "Admin"
-    ADMIN_PASSWORD = "admin123"
-
-    def test_validate_header_options(self, setup):
+    def test_validate_header_options(self, admin_session):
         """
         Test if the header options on the admin page are displayed correctly.
         """
-        self.driver = setup
-        self.driver.get(self.url)
-        time.sleep(2)
-
-        login_object = Login(self.driver)
-        login_object.enter_username(self.ADMIN_USERNAME)
-        login_object.enter_password(self.ADMIN_PASSWORD)
-        login_object.click_login()
-
+        self.driver = admin_session
         admin_object = AdminHeader(self.driver)
-        admin_object.click_admin_tab()
 
         assert admin_object.is_job_displayed()
         assert admin_object.is_organization_displayed()
@@ -58,21 +30,13 @@ class TestAdminPage:
         assert admin_object.is_corporate_branding_displayed()
         assert admin_object.is_configuration_displayed()
 
-    def test_validate_main_menu_options(self, setup):
+    @pytest.mark.budget(wan=5.0, slow_3g=15.0)
+    def test_validate_main_menu_options(self, admin_session):
         """
         Test if the main menu options on the admin side panel are displayed correctly.
         """
-        self.driver = setup
-        self.driver.get(self.url)
-        time.sleep(2)
-
-        login_object = Login(self.driver)
-        login_object.enter_username(self.ADMIN_USERNAME)
-        login_object.enter_password(self.ADMIN_PASSWORD)
-        login_object.click_login()
-
+        self.driver = admin_session
         admin_object = AdminMainMenu(self.driver)
-        admin_object.click_admin_tab()
 
         assert admin_object.is_admin_displayed()
         assert admin_object.is_pim_displayed()
@@ -0,0 +1,160 @@
+"""
+Module Description: Unit tests for the visibility checks and fast selectors of
+the page objects.
+
+These tests run without a browser.
+"""
+
+# Standard library
+import json
+
+# Third-party
+import pytest
+
+# First-party
+from pageObjects.basePage import BasePage, load_fast_selectors
+from utilities import config
+
+
+class ReportPage(BasePage):
+    """
+    Page with two batched checks and one locator outside the batch.
+    """
+
+    locators = {
+        "header": "//header",
+        "menu": "//nav",
+        "footer": "//footer",
+    }
+    displayed_checks = {"header": "header", "menu": "menu"}
+
+
+class FakeDriver:
+    """
+    Driver answering visibility reports from a fixed set of clickable locators.
+    """
+
+    def __init__(self, clickable):
+        """
+        Initialize the FakeDriver instance.
+        :param clickable: set: Locator names reported as clickable.
+        """
+        self.clickable = clickable
+        self.reports = []
+
+    def maximize_window(self):
+        pass
+
+    def execute_script(self, script, locators):
+        self.reports.append(sorted(locators))
+        return {
+            name: {
+                "present": name in self.clickable,
+                "displayed": name in self.clickable,
+                "clickable": name in self.clickable,
+            }
+            for name in locators
+        }
+
+
+@pytest.fixture
+def short_timeout(monkeypatch):
+    """
+    Make the report's wait give up quickly.
+    """
+    monkeypatch.setattr(config, "DEFAULT_TIMEOUT", 0.05)
+
+
+class TestVisibilityChecks:
+    """
+    Test class for answering is_*_displayed from one report per page state.
+    """
+
+    def test_one_report_answers_every_check(self, short_timeout):
+        """
+        Test that the first check fetches the whole batch for the others.
+        """
+        driver = FakeDriver({"header", "menu"})
+        page = ReportPage(driver)
+
+        assert page.is_header_displayed() and page.is_menu_displayed()
+        assert driver.reports == [["header", "menu"]]
+
+    def test_negative_results_are_kept(self, short_timeout):
+        """
+        Test that a page known to be wrong is not waited on again.
+        """
+        driver = FakeDriver({"header"})
+        page = ReportPage(driver)
+
+        assert page.is_header_displayed()
+        polls = len(driver.reports)
+        assert not page.is_menu_displayed()
+        assert not page.is_menu_displayed()
+        assert len(driver.reports) == polls
+
+    def test_locators_outside_the_batch_are_reported_alone(self, short_timeout):
+        """
+        Test that a locator outside report_locators is reported once, alone.
+        """
+        driver = FakeDriver(set())
+        page = ReportPage(driver)
+
+        assert not page.is_locator_displayed("footer")
+        assert not page.is_locator_displayed("footer")
+        assert {tuple(report) for report in driver.reports} == {("footer",)}
+
+    def test_invalidate_forgets_the_report(self, short_timeout):
+        """
+        Test that a navigation makes the next check ask the browser again.
+        """
+        driver = FakeDriver(set())
+        page = ReportPage(driver)
+        assert not page.is_menu_displayed()
+
+        driver.clickable = {"header", "menu"}
+        page.invalidate()
+
+        assert page.is_menu_displayed()
+
+
+class TestLoadFastSelectors:
+    """
+    Test class for reading the profiler's fast-selector table.
+    """
+
+    def write_table(self, path, base_url):
+        """
+        Write a table with one selector verified against a base URL.
+        """
+        selectors = {
+            "Login.login_button": {
+                "xpath": "//button[@type='submit']",
+                "by": "css selector",
+                "value": 'button[type="submit"]',
+            }
+        }
+        path.write_text(json.dumps({"base_url": base_url, "selectors": selectors}))
+        return selectors
+
+    def test_selectors_verified_on_the_target_are_used(self, tmp_path, monkeypatch):
+        """
+        Test that a table verified against the tested application is loaded.
+        """
+        monkeypatch.setattr(config, "BASE_URL", "https://hr.example.com")
+        path = tmp_path / "fastSelectors.json"
+        selectors = self.write_table(path, "https://hr.example.com")
+
+        assert load_fast_selectors(str(path)) == selectors
+
+    def test_selectors_verified_elsewhere_are_ignored(self, tmp_path, monkeypatch):
+        """
+        Test that a table verified against another application, or a missing
+        file, yields no fast selectors.
+        """
+        monkeypatch.setattr(config, "BASE_URL", "https://hr.example.com")
+        path = tmp_path / "fastSelectors.json"
+        self.write_table(path, "http://127.0.0.1:8765")
+
+        assert load_fast_selectors(str(path)) == {}
+        assert load_fast_selectors(str(tmp_path / "missing.json")) == {}
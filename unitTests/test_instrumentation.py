@@ -0,0 +1,149 @@
+"""
+Module Description: Unit tests for the step instrumentation and flow budgets.
+
+These tests run without a browser.
+"""
+
+# Standard library
+import time
+
+# First-party
+from pageObjects.loginPage import Login
+from utilities import instrumentation
+from utilities.networkThrottle import budget_breakdown, get_throttle, top_level_steps
+
+
+def span(name, start, wall, category="step", wait=0.0, commands=0):
+    """
+    Build a finished span as recorded by the Tracer.
+    """
+    return {
+        "name": name,
+        "category": category,
+        "start": start,
+        "wall": wall,
+        "wait": wait,
+        "commands": commands,
+    }
+
+
+class FakeDriver:
+    """
+    Driver answering the commands a page object issues on click_url().
+    """
+
+    def maximize_window(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def execute_script(self, script, *args):
+        return None
+
+
+class TestTracer:
+    """
+    Test class for nesting spans.
+    """
+
+    def test_waits_and_commands_roll_up_into_steps(self):
+        """
+        Test that a step counts the waits and commands nested in it, and a wait
+        falling back to another wait only once.
+        """
+        tracer = instrumentation.Tracer()
+        tracer.begin("test")
+        with tracer.span("Login.click_login", "step"):
+            with tracer.span("Wait.until_element", "wait"):
+                with tracer.span("Wait.until", "wait"):
+                    with tracer.span("findElement", "webdriver"):
+                        time.sleep(0.01)
+            with tracer.span("clickElement", "webdriver"):
+                pass
+
+        spans = {record["name"]: record for record in tracer.spans}
+        step = spans["Login.click_login"]
+        assert step["commands"] == 2
+        assert step["wait"] == spans["Wait.until_element"]["wall"]
+        assert spans["Wait.until_element"]["wait"] == 0.0
+        assert step["wall"] >= step["wait"] >= 0.01
+
+    def test_spans_since_filters_by_wall_clock(self):
+        """
+        Test that only spans started after a timestamp are returned.
+        """
+        tracer = instrumentation.Tracer()
+        tracer.begin("test")
+        with tracer.span("setup", "step"):
+            pass
+        time.sleep(0.01)
+        started = time.time()
+        with tracer.span("body", "step"):
+            pass
+
+        assert [record["name"] for record in tracer.spans_since(started)] == ["body"]
+
+    def test_enable_traces_inherited_base_page_steps_once(self):
+        """
+        Test that BasePage methods get spans and an override calling its
+        parent is one step.
+        """
+
+        class OverridingLogin(Login):
+            def click_url(self):
+                return super().click_url()
+
+        tracer = instrumentation.enable()
+        try:
+            tracer.begin("test")
+            Login(FakeDriver()).click_url()
+            OverridingLogin(FakeDriver()).click_url()
+            names = [record["name"] for record in tracer.spans]
+        finally:
+            instrumentation.disable()
+
+        assert names == ["BasePage.click_url", "OverridingLogin.click_url"]
+        assert not instrumentation.is_enabled()
+
+
+class TestFlowBudget:
+    """
+    Test class for the breakdown of flows over budget.
+    """
+
+    def test_top_level_steps_skip_nested_ones(self):
+        """
+        Test that steps inside other steps are left out, in start order.
+        """
+        spans = [
+            span("BasePage.find", 0.2, 0.1),
+            span("Login.click_login", 0.1, 0.5),
+            span("Wait.until", 0.7, 0.1, category="wait"),
+            span("Login.login_error", 0.7, 0.2),
+        ]
+
+        assert [record["name"] for record in top_level_steps(spans)] == [
+            "Login.click_login",
+            "Login.login_error",
+        ]
+
+    def test_breakdown_lists_steps_and_the_rest(self):
+        """
+        Test that the report shows each step and the time outside page objects.
+        """
+        report = budget_breakdown(
+            2.0,
+            1.5,
+            get_throttle("wan"),
+            [span("Login.click_login", 0.0, 1.2, wait=0.8, commands=3)],
+            [("/web/index.php/dashboard/index", {"ttfb": 310, "load": 900})],
+        )
+        lines = report.splitlines()
+
+        assert lines[0] == "Flow took 2.00s, over its 1.50s budget on " + (
+            get_throttle("wan").describe()
+        )
+        assert lines[2].split() == ["Login.click_login", "1.20", "0.80", "3"]
+        assert lines[3].split() == ["outside", "page", "objects", "0.80"]
+        assert lines[4].startswith("page /web/index.php/dashboard/index: TTFB 310 ms")
@@ -0,0 +1,72 @@
+"""
+Module Description: Unit tests for checking locators against DOM snapshots.
+
+These tests run without a browser.
+"""
+
+# Third-party
+import pytest
+
+# First-party
+from utilities.domSnapshot import VISIBLE_ATTRIBUTE
+from utilities.locatorReplay import check_locator
+
+lxml_html = pytest.importorskip("lxml.html")
+
+SNAPSHOT = """
+<html><body>
+  <form>
+    <input name="username" %s="true">
+    <button type="submit" %s="false">Login</button>
+  </form>
+</body></html>
+""" % (VISIBLE_ATTRIBUTE, VISIBLE_ATTRIBUTE)
+
+
+@pytest.fixture
+def document():
+    """
+    Parsed snapshot of a login form.
+    """
+    return lxml_html.document_fromstring(SNAPSHOT)
+
+
+class TestCheckLocator:
+    """
+    Test class for evaluating one XPath against a snapshot.
+    """
+
+    def test_matching_locator_is_fine(self, document):
+        """
+        Test that a clickable first match passes.
+        """
+        assert check_locator(document, "//input[@name='username']", True) is None
+
+    def test_locator_matching_nothing(self, document):
+        """
+        Test that a locator without matches is reported.
+        """
+        assert check_locator(document, "//input[@name='password']", False) == (
+            "matches nothing"
+        )
+
+    def test_text_result_is_not_an_element(self, document):
+        """
+        Test that an XPath selecting only text does not count as a match.
+        """
+        assert check_locator(document, "//button/text()", False) == ("matches nothing")
+
+    def test_invalid_xpath(self, document):
+        """
+        Test that a syntax error is reported instead of raised.
+        """
+        assert check_locator(document, "//input[", False).startswith("invalid XPath")
+
+    def test_unclickable_first_match(self, document):
+        """
+        Test that clickability is only required when the locator asks for it.
+        """
+        assert check_locator(document, "//button", True) == (
+            "first match is not clickable"
+        )
+        assert check_locator(document, "//button", False) is None
@@ -0,0 +1,148 @@
+"""
+Module Description: Unit tests for the parallel runner and the duration store.
+
+These tests run without a browser.
+"""
+
+# Third-party
+import pytest
+
+# First-party
+from utilities.durations import DurationStore
+from utilities.parallelRunner import ParallelRunner, resolve_paths
+
+
+class TestSchedule:
+    """
+    Test class for the longest-processing-time-first sharding.
+    """
+
+    def test_slowest_tests_spread_over_workers(self):
+        """
+        Test that every worker gets one of the slowest tests and loads balance.
+        """
+        durations = {"a": 10.0, "b": 9.0, "c": 5.0, "d": 4.0, "e": 1.0}
+        shards = ParallelRunner(2).schedule(sorted(durations), durations)
+
+        loads = [sum(durations[node_id] for node_id in shard) for shard in shards]
+        assert sorted(loads) == [14.0, 15.0]
+        assert {shard[0] for shard in shards} == {"a", "b"}
+
+    def test_unknown_tests_use_the_median(self):
+        """
+        Test that a test without history is weighted like the median known test.
+        """
+        durations = {"a": 1.0, "b": 3.0, "c": 100.0}
+        shards = ParallelRunner(2).schedule(["a", "b", "c", "new"], durations)
+
+        # "new" counts as 3s: after "c" on one worker, it joins "b" on the other.
+        assert ["c"] in shards
+        assert sorted(node_id for shard in shards for node_id in shard) == [
+            "a",
+            "b",
+            "c",
+            "new",
+        ]
+
+    def test_without_history_every_test_gets_the_default(self):
+        """
+        Test that tests are dealt round robin when nothing was timed yet.
+        """
+        shards = ParallelRunner(3).schedule(["a", "b", "c", "d"], {})
+
+        assert sorted(len(shard) for shard in shards) == [1, 1, 2]
+
+    def test_more_workers_than_tests_leaves_shards_empty(self):
+        """
+        Test that surplus workers get no tests.
+        """
+        shards = ParallelRunner(4).schedule(["a"], {"a": 2.0})
+
+        assert sum(1 for shard in shards if shard) == 1
+
+
+class TestCollect:
+    """
+    Test class for collecting the node ids in a subprocess.
+    """
+
+    def test_collection_error_returns_pytest_exit_code(self, tmp_path, capsys):
+        """
+        Test that an import error is reported with its output and exit code.
+        """
+        test_file = tmp_path / "test_broken.py"
+        test_file.write_text("import module_that_does_not_exist\n")
+
+        exit_code, node_ids = ParallelRunner(2).collect([str(test_file)])
+
+        assert exit_code == pytest.ExitCode.INTERRUPTED
+        assert node_ids == []
+        assert "module_that_does_not_exist" in capsys.readouterr().out
+
+    def test_collect_lists_node_ids(self, tmp_path):
+        """
+        Test that collected tests come back as node ids.
+        """
+        test_file = tmp_path / "test_fine.py"
+        test_file.write_text("def test_one():\n    pass\n")
+
+        exit_code, node_ids = ParallelRunner(2).collect([str(test_file)])
+
+        assert exit_code == pytest.ExitCode.OK
+        assert [node_id.split("::")[-1] for node_id in node_ids] == ["test_one"]
+
+
+class TestResolvePaths:
+    """
+    Test class for making the caller's test paths absolute.
+    """
+
+    def test_paths_relative_to_the_caller(self, tmp_path):
+        """
+        Test that existing paths, with or without a node id or as an option
+        value, become absolute and other arguments are kept.
+        """
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_a.py").write_text("")
+        tests = str(tmp_path / "tests")
+
+        assert resolve_paths(
+            [
+                "tests",
+                "tests/test_a.py::TestA::test_one",
+                "--ignore=tests/test_a.py",
+                "-k",
+                "header",
+                "--maxfail=1",
+            ],
+            cwd=str(tmp_path),
+        ) == [
+            tests,
+            tests + "/test_a.py::TestA::test_one",
+            "--ignore=" + tests + "/test_a.py",
+            "-k",
+            "header",
+            "--maxfail=1",
+        ]
+
+
+class TestDurationStore:
+    """
+    Test class for the per-test duration history.
+    """
+
+    def test_missing_file_loads_empty(self, tmp_path):
+        """
+        Test that a store without a file has no durations.
+        """
+        assert DurationStore(str(tmp_path / "durations.json")).load() == {}
+
+    def test_update_blends_with_history(self, tmp_path):
+        """
+        Test that new measurements are smoothed into the previous ones.
+        """
+        store = DurationStore(str(tmp_path / "cache" / "durations.json"))
+        store.update({"a": 4.0})
+        store.update({"a": 8.0, "b": 2.0})
+
+        assert store.load() == {"a": 6.0, "b": 2.0}
@@ -0,0 +1,99 @@
+"""
+Module Description: Unit tests for the page-performance metrics store.
+
+These tests run without a browser.
+"""
+
+# First-party
+from utilities.perfMetrics import MetricsStore, PerformanceHarvester
+
+
+def add_loads(store, build, page, values, recorded_at=0.0):
+    """
+    Append one "load" measurement per value for a page and build.
+    :param store: MetricsStore to write.
+    :param build: str: Build name.
+    :param page: str: Page path.
+    :param values: list: Milliseconds.
+    :param recorded_at: float: Timestamp of the rows.
+    """
+    store.append(
+        [(recorded_at, build, "run", page, "test", "load", value) for value in values]
+    )
+
+
+class TestMetricsStore:
+    """
+    Test class for the medians and regressions across builds.
+    """
+
+    def test_builds_are_ordered_by_first_measurement(self, tmp_path):
+        """
+        Test that builds come back oldest first.
+        """
+        store = MetricsStore(str(tmp_path / "metrics.sqlite"))
+        add_loads(store, "2.0", "/login", [100], recorded_at=2)
+        add_loads(store, "1.0", "/login", [100], recorded_at=1)
+
+        assert store.builds() == ["1.0", "2.0"]
+
+    def test_medians_per_page_and_build(self, tmp_path):
+        """
+        Test that each page and build gets the median and sample count.
+        """
+        store = MetricsStore(str(tmp_path / "metrics.sqlite"))
+        add_loads(store, "1.0", "/login", [100, 300, 200])
+        add_loads(store, "1.0", "/admin", [50, 70])
+
+        assert store.medians("load") == {
+            "/login": {"1.0": (200, 3)},
+            "/admin": {"1.0": (60, 2)},
+        }
+        assert store.medians("ttfb") == {}
+
+    def test_regressions_beyond_threshold(self, tmp_path):
+        """
+        Test that only pages slower than the threshold allows are reported.
+        """
+        store = MetricsStore(str(tmp_path / "metrics.sqlite"))
+        add_loads(store, "1.0", "/login", [100, 100])
+        add_loads(store, "1.0", "/admin", [100])
+        add_loads(store, "1.0", "/gone", [100])
+        add_loads(store, "2.0", "/login", [130, 125])
+        add_loads(store, "2.0", "/admin", [110])
+
+        assert store.regressions("load", 0.2, "1.0", "2.0") == [("/login", 100, 127.5)]
+        assert store.regressions("load", 0.5, "1.0", "2.0") == []
+
+
+class TestPerformanceHarvester:
+    """
+    Test class for collecting metrics from the browser.
+    """
+
+    def test_harvest_files_rows_under_the_current_test(self, tmp_path):
+        """
+        Test that a harvested document is grouped per load for its test.
+        """
+
+        class FakeDriver:
+            def execute_script(self, script):
+                return {
+                    "url": "http://localhost/web/index.php/auth/login?x=1",
+                    "metrics": {"load": 120, "ttfb": 30, "first_paint": None},
+                }
+
+        harvester = PerformanceHarvester(
+            MetricsStore(str(tmp_path / "metrics.sqlite")), "1.0", "run"
+        )
+        harvester.test = "test_a"
+        harvester.harvest(FakeDriver())
+
+        assert harvester.page_loads("test_a") == [
+            ("/web/index.php/auth/login", {"load": 120, "ttfb": 30})
+        ]
+        assert harvester.page_loads("test_b") == []
+        harvester.save()
+        assert harvester.store.medians("load") == {
+            "/web/index.php/auth/login": {"1.0": (120, 1)}
+        }
@@ -0,0 +1,160 @@
+"""
+Module Description: Unit tests for the tab pool of the multi-tab benchmark.
+
+These tests run without a browser.
+"""
+
+# Standard library
+import json
+
+# Third-party
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.command import Command
+
+# First-party
+from utilities import config
+from utilities.networkFilter import NetworkFilter
+from utilities.tabPool import DOCUMENT_STATE_SCRIPT, TabPool
+
+
+class FakeBrowser:
+    """
+    Browser answering the commands the tab pool and its tabs send.
+    """
+
+    def __init__(self):
+        """
+        Initialize the FakeBrowser instance.
+        """
+        self.handles = ["home"]
+        self.commands = []
+        self.log = []
+        # States DOCUMENT_STATE_SCRIPT reports, one per check.
+        self.states = []
+        self.targets = 0
+
+    def execute(self, command, params=None):
+        self.commands.append(command)
+        if command == Command.W3C_GET_CURRENT_WINDOW_HANDLE:
+            return {"value": "home"}
+        if command == Command.W3C_GET_WINDOW_HANDLES:
+            return {"value": list(self.handles)}
+        if command == "executeCdpCommand" and params["cmd"] == "Target.createTarget":
+            self.targets += 1
+            self.handles.append("tab-%d" % self.targets)
+            return {"value": {"targetId": "tab-%d" % self.targets}}
+        if command == "executeCdpCommand":
+            return {"value": {"browserContextId": "context"}}
+        if command == Command.W3C_EXECUTE_SCRIPT:
+            if params["script"] == DOCUMENT_STATE_SCRIPT:
+                return {"value": self.states.pop(0)}
+            return {"value": None}
+        return {"value": None}
+
+    def execute_cdp_cmd(self, cmd, params):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": params})[
+            "value"
+        ]
+
+    def get_log(self, log_type):
+        entries, self.log = self.log, []
+        return entries
+
+    def quit(self):
+        pass
+
+
+def log_entry(target, method):
+    """
+    Build a performance log entry as chromedriver reports it.
+    """
+    return {"message": json.dumps({"webview": target, "message": {"method": method}})}
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """
+    Tab pool of two tabs in a fake browser that waits for complete documents.
+    """
+    monkeypatch.setattr(config, "WAIT_INITIAL_POLL", 0.0)
+    pool = TabPool(2, factory=FakeBrowser, network_filter=NetworkFilter("none"))
+    pool.ready_states = ["complete"]
+    return pool
+
+
+class TestNavigationWaits:
+    """
+    Test class for waiting on the documents that tab commands load.
+    """
+
+    def test_click_that_navigates_waits_for_the_new_document(self, pool):
+        """
+        Test that a click starting a navigation returns once the page loaded.
+        """
+        pool.browser.states = ["leaving", "loading", "loaded", "stayed"]
+        pool.checkout().execute(Command.CLICK_ELEMENT, {"id": "button"})
+
+        assert pool.browser.states == ["stayed"]
+
+    def test_click_that_stays_returns_after_a_second_check(self, pool):
+        """
+        Test that a click without navigation is not waited on for long.
+        """
+        pool.browser.states = ["stayed", "stayed", "loaded"]
+        pool.checkout().execute(Command.CLICK_ELEMENT, {"id": "button"})
+
+        assert pool.browser.states == ["loaded"]
+
+    def test_get_never_counts_as_staying(self, pool):
+        """
+        Test that a navigation command waits until its document is replaced.
+        """
+        pool.browser.states = ["stayed", "stayed", "loaded"]
+        pool.checkout().execute(Command.GET, {"url": "about:blank"})
+
+        assert pool.browser.states == []
+
+    def test_navigation_that_never_loads_times_out(self, pool):
+        """
+        Test that a tab stuck leaving its document raises instead of hanging.
+        """
+        pool.browser.states = ["leaving"] * 1000
+        tab = pool.checkout()
+
+        with pytest.raises(TimeoutException):
+            pool._wait_for_document(tab.tab_handle, 1, may_stay=True, timeout=0)
+
+
+class TestTabs:
+    """
+    Test class for the isolation of the tabs sharing one browser.
+    """
+
+    def test_performance_log_is_split_per_tab(self, pool):
+        """
+        Test that every tab only reads its own performance log entries, even
+        when another tab drained the browser's log first.
+        """
+        first, second = pool.checkout(), pool.checkout()
+        pool.browser.log = [
+            log_entry(first.tab_target, "Network.loadingFailed"),
+            log_entry(second.tab_target, "Network.requestWillBeSent"),
+            log_entry("unknown", "Network.requestWillBeSent"),
+        ]
+
+        assert len(second.get_log("performance")) == 1
+        assert len(first.get_log("performance")) == 1
+        assert first.get_log("performance") == []
+
+    def test_quit_closes_only_the_tab(self, pool):
+        """
+        Test that quitting a tab driver closes its tab once and keeps the others.
+        """
+        first, second = pool.checkout(), pool.checkout()
+        first.quit()
+        first.quit()
+
+        assert first.tab_handle not in pool._contexts
+        assert second.tab_handle in pool._contexts
+        assert first.get_log("performance") == []
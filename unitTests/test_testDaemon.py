@@ -0,0 +1,72 @@
+"""
+Module Description: Unit tests for the daemon's reloading of changed modules.
+
+These tests run without a browser.
+"""
+
+# Standard library
+import importlib
+import os
+import sys
+
+# First-party
+from utilities import testDaemon
+
+MODULES = ("base", "user", "unrelated", "pkg", "pkg.sub", "pkg.relative")
+
+
+def write(path, source):
+    """
+    Write a module source file.
+    :param path: pathlib.Path: File to write.
+    :param source: str: Module source.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source, encoding="utf-8")
+
+
+def touch_later(path):
+    """
+    Move a file's modification time forward, as an edit would.
+    :param path: pathlib.Path: File to touch.
+    """
+    mtime = os.path.getmtime(path) + 10
+    os.utime(path, (mtime, mtime))
+
+
+class TestModuleReloader:
+    """
+    Test class for dropping changed modules and their dependents.
+    """
+
+    def test_changed_module_and_dependents_are_dropped(self, tmp_path, monkeypatch):
+        """
+        Test that an edit drops the module and what imports it, but neither
+        unrelated modules nor the package holding it.
+        """
+        write(tmp_path / "base.py", "VALUE = 1\n")
+        write(tmp_path / "user.py", "from base import VALUE\n")
+        write(tmp_path / "unrelated.py", "OTHER = 2\n")
+        write(tmp_path / "pkg" / "__init__.py", "from pkg import sub\n")
+        write(tmp_path / "pkg" / "sub.py", "import base\n")
+        write(tmp_path / "pkg" / "relative.py", "from .sub import base\n")
+        monkeypatch.setattr(testDaemon, "ROOT_DIR", str(tmp_path))
+        monkeypatch.syspath_prepend(str(tmp_path))
+        try:
+            for name in MODULES:
+                importlib.import_module(name)
+            reloader = testDaemon.ModuleReloader()
+            assert reloader.reload_changed() == []
+
+            touch_later(tmp_path / "base.py")
+
+            assert reloader.reload_changed() == [
+                "base",
+                "pkg.relative",
+                "pkg.sub",
+                "user",
+            ]
+            assert "pkg" in sys.modules and "unrelated" in sys.modules
+        finally:
+            for name in MODULES:
+                sys.modules.pop(name, None)
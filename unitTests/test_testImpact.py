@@ -0,0 +1,185 @@
+"""
+Module Description: Unit tests for the test-impact index.
+
+These tests run without a browser.
+"""
+
+# Standard library
+import os
+
+# First-party
+from pageObjects.basePage import BasePage
+from pageObjects.loginPage import Login
+from utilities import config
+from utilities.testImpact import (
+    ROOT_DIR,
+    ImpactIndex,
+    ImpactRecorder,
+    dependency_hash,
+    file_hash,
+    framework_hash,
+    referenced_constants,
+)
+
+LOCATOR_KEY = "pageObjects.loginPage:Login.login_button"
+METHOD_KEY = "pageObjects.loginPage:Login.login_error"
+
+
+class FakeItem:
+    """
+    The parts of a pytest item that ImpactIndex.select() reads.
+    """
+
+    def __init__(self, nodeid, path):
+        """
+        Initialize the FakeItem instance.
+        :param nodeid: str: Test node id.
+        :param path: str: Path of the test module.
+        """
+        self.nodeid = nodeid
+        self.path = path
+
+
+def passed_record(test_path, **changes):
+    """
+    Build an index entry for a test that passed with the current code.
+    :param test_path: str: Path of the test module.
+    :param changes: Entries to override.
+    """
+    record = {
+        "outcome": "passed",
+        "base_url": config.BASE_URL,
+        "framework": framework_hash(),
+        "files": {os.path.relpath(test_path, ROOT_DIR): file_hash(test_path)},
+        "locators": {LOCATOR_KEY: dependency_hash("locators", LOCATOR_KEY)},
+        "methods": {METHOD_KEY: dependency_hash("methods", METHOD_KEY)},
+    }
+    record.update(changes)
+    return record
+
+
+class TestImpactIndex:
+    """
+    Test class for selecting the tests affected by a change.
+    """
+
+    def test_empty_index_selects_everything(self, tmp_path):
+        """
+        Test that every test runs when nothing was recorded yet.
+        """
+        items = [FakeItem("a", str(tmp_path / "test_a.py"))]
+
+        selected, deselected, reasons = ImpactIndex(
+            str(tmp_path / "impact.json")
+        ).select(items)
+
+        assert (selected, deselected, reasons) == (items, [], {})
+
+    def test_selects_only_changed_failed_and_new_tests(self, tmp_path):
+        """
+        Test that unchanged passed tests are deselected and the others say why.
+        """
+        test_path = tmp_path / "test_module.py"
+        test_path.write_text("def test_x():\n    pass\n")
+        test_path = str(test_path)
+        index = ImpactIndex(str(tmp_path / "impact.json"))
+        index.update(
+            {
+                "unchanged": passed_record(test_path),
+                "failed": passed_record(test_path, outcome="failed"),
+                "locator": passed_record(
+                    test_path, locators={LOCATOR_KEY: "stale hash"}
+                ),
+                "method": passed_record(test_path, methods={METHOD_KEY: "stale"}),
+                "framework": passed_record(test_path, framework="old"),
+            }
+        )
+        names = ["unchanged", "failed", "locator", "method", "framework", "new"]
+        items = [FakeItem(name, test_path) for name in names]
+
+        selected, deselected, reasons = index.select(items)
+
+        assert [item.nodeid for item in deselected] == ["unchanged"]
+        assert [item.nodeid for item in selected] == names[1:]
+        assert reasons == {
+            "failed": "failed",
+            "locator": "locator Login.login_button",
+            "method": "method Login.login_error",
+            "framework": "framework",
+            "new": "new",
+        }
+
+    def test_edited_test_module_is_selected(self, tmp_path):
+        """
+        Test that a change to the test module itself selects its tests.
+        """
+        test_path = tmp_path / "test_module.py"
+        test_path.write_text("def test_x():\n    pass\n")
+        record = passed_record(str(test_path))
+        test_path.write_text("def test_x():\n    assert True\n")
+
+        reason = ImpactIndex(str(tmp_path / "impact.json")).reason_to_run(
+            "x", str(test_path), record, framework_hash()
+        )
+
+        assert reason == "test module"
+
+
+class TestDependencyHash:
+    """
+    Test class for the hashes of recorded locators and methods.
+    """
+
+    def test_method_hash_covers_module_constants(self, monkeypatch):
+        """
+        Test that editing a script a method executes changes the method's hash.
+        """
+        before = dependency_hash("methods", METHOD_KEY)
+        monkeypatch.setattr(
+            "pageObjects.loginPage.NEW_LOGIN_ERROR_SCRIPT", "return 'edited';"
+        )
+
+        assert dependency_hash("methods", METHOD_KEY) != before
+
+    def test_referenced_constants_include_nested_functions(self):
+        """
+        Test that constants read by lambdas and nested functions are found.
+        """
+        assert set(referenced_constants(Login.login_error)) == {
+            "CLEAR_FIELD_SCRIPT",
+            "MARK_LOGIN_ERRORS_SCRIPT",
+            "NEW_LOGIN_ERROR_SCRIPT",
+        }
+
+    def test_removed_dependency_has_no_hash(self):
+        """
+        Test that a locator that no longer exists hashes to None.
+        """
+        assert dependency_hash("locators", "pageObjects.loginPage:Login.gone") is None
+
+
+class TestImpactRecorder:
+    """
+    Test class for installing the recorder on the page objects.
+    """
+
+    def test_new_recorder_replaces_the_installed_one(self):
+        """
+        Test that a second recorder neither double-wraps methods nor keeps the
+        first recorder listening.
+        """
+        original = Login.click_login
+        first, second = ImpactRecorder(), ImpactRecorder()
+        try:
+            first.install()
+            second.install()
+
+            assert Login.click_login._impact_original is original
+            assert first not in BasePage.listeners
+            assert second in BasePage.listeners
+        finally:
+            second.uninstall()
+            first.uninstall()
+
+        assert Login.click_login is original
+        assert second not in BasePage.listeners
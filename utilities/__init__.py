@@ -0,0 +1,3 @@
+"""
+Shared infrastructure used by the page objects and the test suite.
+"""
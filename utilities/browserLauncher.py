@@ -0,0 +1,247 @@
+"""
+Named Chrome launch profiles and a launcher that keeps browsers booted ahead of time.
+"""
+
+# Standard library
+import logging
+import queue
+import threading
+import time
+
+# Third-party
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+# First-party
+from utilities import config
+
+logger = logging.getLogger(__name__)
+
+LEAN_ARGUMENTS = (
+    "--headless=new",
+    "--window-size=1920,1080",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-gpu",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-default-browser-check",
+    "--no-first-run",
+)
+
+
+class LaunchProfile:
+    """
+    A named set of Chrome options.
+    """
+
+    def __init__(
+        self,
+        name,
+        arguments=(),
+        page_load_strategy="normal",
+        maximize=True,
+        network_filter="none",
+    ):
+        """
+        Initialize the LaunchProfile instance.
+        :param name: str: Profile name used in config and reports.
+        :param arguments: tuple: Chrome command line switches.
+        :param page_load_strategy: str: "normal", "eager" or "none".
+        :param maximize: bool: Whether page objects maximize the window.
+        :param network_filter: str: Default utilities.networkFilter profile.
+        """
+        self.name = name
+        self.arguments = tuple(arguments)
+        self.page_load_strategy = page_load_strategy
+        self.maximize = maximize
+        self.network_filter = network_filter
+
+    def options(self):
+        """
+        Build the ChromeOptions for this profile.
+        """
+        options = webdriver.ChromeOptions()
+        for argument in self.arguments:
+            options.add_argument(argument)
+        options.page_load_strategy = self.page_load_strategy
+        logging_prefs = {}
+        if config.FAILURE_ARTIFACTS:
+            # Failure artifacts include the browser console.
+            logging_prefs["browser"] = "ALL"
+        if (config.NETWORK_FILTER or self.network_filter) != "none":
+            # The network filter reads blocked requests from the performance log.
+            logging_prefs["performance"] = "ALL"
+        if logging_prefs:
+            options.set_capability("goog:loggingPrefs", logging_prefs)
+        return options
+
+
+PROFILES = {
+    profile.name: profile
+    for profile in (
+        LaunchProfile("default"),
+        LaunchProfile(
+            "headless",
+            ("--headless=new", "--window-size=1920,1080"),
+            maximize=False,
+        ),
+        LaunchProfile("fixed_viewport", ("--window-size=1920,1080",), maximize=False),
+        LaunchProfile(
+            "lean", LEAN_ARGUMENTS, "eager", maximize=False, network_filter="strict"
+        ),
+    )
+}
+
+
+def get_profile(name=None):
+    """
+    Return a launch profile by name.
+    :param name: str: Profile name, defaults to config.BROWSER_PROFILE.
+    """
+    name = name or config.BROWSER_PROFILE
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            "Unknown browser profile %r, expected one of %s"
+            % (name, ", ".join(sorted(PROFILES)))
+        ) from None
+
+
+class BrowserLauncher:
+    """
+    Starts browsers for one profile, keeping a few booted in the background.
+
+    acquire() hands out an already running browser when one is ready and
+    immediately starts a replacement, so a test rarely waits for Chrome.
+    """
+
+    def __init__(self, profile=None, warm=None, page_load_strategy=None):
+        """
+        Initialize the BrowserLauncher instance.
+        :param profile: str: Launch profile name, defaults to config.BROWSER_PROFILE.
+        :param warm: int: Browsers kept booted ahead of demand.
+        :param page_load_strategy: str: Overrides the profile's strategy, e.g.
+            "none" for a caller that waits for documents itself.
+        """
+        self.profile = get_profile(profile)
+        self.warm = config.WARM_BROWSERS if warm is None else warm
+        self.page_load_strategy = page_load_strategy
+        self.startup_times = []
+        self._ready = queue.Queue()
+        self._booting = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Begin booting the warm browsers in the background.
+        """
+        self._refill()
+        return self
+
+    def acquire(self):
+        """
+        Return a running browser, waiting for a background boot if one is under way.
+        """
+        try:
+            driver = self._ready.get_nowait()
+        except queue.Empty:
+            driver = None
+        while driver is None:
+            with self._lock:
+                booting = self._booting
+            if not booting:
+                driver = self._boot()
+                break
+            try:
+                driver = self._ready.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self._refill()
+        return driver
+
+    def shutdown(self):
+        """
+        Stop refilling and quit the browsers that were never handed out.
+        """
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                driver = self._ready.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
+    def report(self):
+        """
+        Summarise browser startup times for this profile.
+        :return: dict: Launch count and min/mean/max startup seconds.
+        """
+        times = list(self.startup_times)
+        if not times:
+            return {"profile": self.profile.name, "launches": 0}
+        return {
+            "profile": self.profile.name,
+            "launches": len(times),
+            "min": min(times),
+            "mean": sum(times) / len(times),
+            "max": max(times),
+        }
+
+    def _boot(self):
+        """
+        Launch one browser in the calling thread and record how long it took.
+        """
+        options = self.profile.options()
+        if self.page_load_strategy:
+            options.page_load_strategy = self.page_load_strategy
+        started = time.monotonic()
+        driver = webdriver.Chrome(options=options)
+        self.startup_times.append(time.monotonic() - started)
+        return driver
+
+    def _refill(self):
+        """
+        Start background boots until the warm target is covered.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            missing = self.warm - self._ready.qsize() - self._booting
+            self._booting += max(missing, 0)
+        for _ in range(missing):
+            threading.Thread(
+                target=self._boot_in_background, name="browser-launcher", daemon=True
+            ).start()
+
+    def _boot_in_background(self):
+        """
+        Boot a browser for the ready queue, or quit it if the launcher closed meanwhile.
+        """
+        driver = None
+        try:
+            driver = self._boot()
+        except Exception:
+            # acquire() boots in the foreground once nothing is booting, and
+            # raises the error to the test if it happens again.
+            logger.exception(
+                "Background boot of a %s browser failed", self.profile.name
+            )
+        finally:
+            with self._lock:
+                self._booting -= 1
+                closed = self._closed
+                if driver is not None and not closed:
+                    self._ready.put(driver)
+        if driver is not None and closed:
+            driver.quit()
@@ -0,0 +1,134 @@
+"""
+Central configuration for the test framework.
+
+Every value can be overridden with an environment variable so CI runners can
+tune a run without code changes.
+"""
+
+# Standard library
+import os
+import time
+
+# Number of idle browsers kept warm between tests.
+POOL_SIZE = int(os.environ.get("ORANGEHRM_POOL_SIZE", "2"))
+
+# A browser is quit and replaced after serving this many tests.
+POOL_MAX_USES = int(os.environ.get("ORANGEHRM_POOL_MAX_USES", "25"))
+
+# A browser is also replaced once it and chromedriver use more than this many
+# MiB between tests. 0 disables the limit.
+POOL_MAX_MEMORY_MB = int(os.environ.get("ORANGEHRM_POOL_MAX_MEMORY_MB", "0"))
+
+# Seconds between memory samples taken while a test runs. 0 samples only at
+# the start and end of each test.
+MEMORY_SAMPLE_INTERVAL = float(
+    os.environ.get("ORANGEHRM_MEMORY_SAMPLE_INTERVAL", "0.5")
+)
+
+# Chrome launch profile, one of utilities.browserLauncher.PROFILES.
+BROWSER_PROFILE = os.environ.get("ORANGEHRM_BROWSER_PROFILE", "default")
+
+# Resources blocked through DevTools, one of utilities.networkFilter.FILTER_PROFILES.
+# Empty means the filter named by the launch profile.
+NETWORK_FILTER = os.environ.get("ORANGEHRM_NETWORK_FILTER", "")
+
+# Network link emulated in every browser, one of
+# utilities.networkThrottle.THROTTLE_PROFILES. Flow budgets for this profile
+# are enforced.
+NETWORK_THROTTLE = os.environ.get("ORANGEHRM_NETWORK_THROTTLE", "none")
+
+# Local TCP port the test daemon (main.py --daemon) listens on.
+DAEMON_PORT = int(os.environ.get("ORANGEHRM_DAEMON_PORT", "8787"))
+
+# Browsers booted in the background ahead of demand.
+WARM_BROWSERS = int(os.environ.get("ORANGEHRM_WARM_BROWSERS", "1"))
+
+# Seconds a page object waits for an element or condition before giving up.
+DEFAULT_TIMEOUT = float(os.environ.get("ORANGEHRM_TIMEOUT", "10"))
+# Used for steps that depend on slow server round trips, such as mail delivery.
+LONG_TIMEOUT = float(os.environ.get("ORANGEHRM_LONG_TIMEOUT", "30"))
+
+# Waits poll quickly at first and back off towards the maximum interval.
+WAIT_INITIAL_POLL = float(os.environ.get("ORANGEHRM_WAIT_INITIAL_POLL", "0.05"))
+WAIT_MAX_POLL = float(os.environ.get("ORANGEHRM_WAIT_MAX_POLL", "0.5"))
+WAIT_BACKOFF = float(os.environ.get("ORANGEHRM_WAIT_BACKOFF", "1.5"))
+# Element waits run in the browser with a MutationObserver, in one round trip,
+# for at most WAIT_OBSERVE_LIMIT seconds per script (chromedriver's default
+# script timeout is 30); the rest of a longer wait falls back to polling.
+OBSERVER_WAITS = os.environ.get("ORANGEHRM_OBSERVER_WAITS", "1") not in ("", "0")
+WAIT_OBSERVE_LIMIT = float(os.environ.get("ORANGEHRM_WAIT_OBSERVE_LIMIT", "25"))
+
+# "demo" targets the public OrangeHRM demo, "local" the bundled stand-in server.
+TARGET = os.environ.get("ORANGEHRM_TARGET", "demo")
+STANDIN_HOST = os.environ.get("ORANGEHRM_STANDIN_HOST", "127.0.0.1")
+STANDIN_PORT = int(os.environ.get("ORANGEHRM_STANDIN_PORT", "8765"))
+
+# Run every collected test instead of only those affected by changes since
+# the last run, see utilities/testImpact.py.
+FULL_RUN = os.environ.get("ORANGEHRM_FULL_RUN", "") not in ("", "0")
+
+# Use the verified fast selectors in pageObjects/fastSelectors.json.
+FAST_SELECTORS = os.environ.get("ORANGEHRM_FAST_SELECTORS", "1") not in ("", "0")
+
+# Save DOM snapshots of the visited pages for utilities/locatorReplay.py.
+SNAPSHOTS = os.environ.get("ORANGEHRM_SNAPSHOTS", "") not in ("", "0")
+# Where snapshots are kept; empty means <cache>/snapshots.
+SNAPSHOT_DIR = os.environ.get("ORANGEHRM_SNAPSHOT_DIR", "")
+
+# Save a screenshot, page source, console log and URL of every failed test.
+FAILURE_ARTIFACTS = os.environ.get("ORANGEHRM_ARTIFACTS", "1") not in ("", "0")
+# Where artifacts are kept; empty means <cache>/artifacts.
+ARTIFACT_DIR = os.environ.get("ORANGEHRM_ARTIFACT_DIR", "")
+# The oldest failures are evicted once the artifacts exceed this many MiB.
+ARTIFACT_MAX_MB = float(os.environ.get("ORANGEHRM_ARTIFACT_MAX_MB", "200"))
+# Background threads decoding and writing artifacts.
+ARTIFACT_WORKERS = int(os.environ.get("ORANGEHRM_ARTIFACT_WORKERS", "2"))
+
+# Record window.performance metrics of every page load, see utilities/perfMetrics.py.
+PERF_METRICS = os.environ.get("ORANGEHRM_PERF_METRICS", "1") not in ("", "0")
+# Build of the application under test the metrics are filed under.
+BUILD = os.environ.get("ORANGEHRM_BUILD", "unknown")
+# Identifies one run; the parallel runner hands its own to every worker.
+RUN_ID = os.environ.get(
+    "ORANGEHRM_RUN_ID", "%s-%d" % (time.strftime("%Y%m%dT%H%M%S"), os.getpid())
+)
+
+# Record per-step timings and WebDriver command counts for every test.
+TRACE = os.environ.get("ORANGEHRM_TRACE", "") not in ("", "0")
+
+# Location of the application under test; ORANGEHRM_BASE_URL wins over TARGET.
+BASE_URL = os.environ.get(
+    "ORANGEHRM_BASE_URL",
+    (
+        "http://%s:%d" % (STANDIN_HOST, STANDIN_PORT)
+        if TARGET == "local"
+        else "https://opensource-demo.orangehrmlive.com"
+    ),
+).rstrip("/")
+LOGIN_PATH = "/web/index.php/auth/login"
+DASHBOARD_PATH = "/web/index.php/dashboard/index"
+ADMIN_PATH = "/web/index.php/admin/viewAdminModule"
+
+# Account used by tests that only need to be logged in.
+ADMIN_USERNAME = os.environ.get("ORANGEHRM_USERNAME", "Admin")
+ADMIN_PASSWORD = os.environ.get("ORANGEHRM_PASSWORD", "admin123")
+
+# Directory holding state that survives between runs.
+CACHE_DIR = os.environ.get(
+    "ORANGEHRM_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), ".orangehrm_cache"),
+)
+
+# Saved login sessions are reused for this many seconds.
+SESSION_TTL = int(os.environ.get("ORANGEHRM_SESSION_TTL", "900"))
+
+# Fresh sessions are obtained over HTTP, falling back to the login form.
+HTTP_LOGIN = os.environ.get("ORANGEHRM_HTTP_LOGIN", "1") not in ("", "0")
+
+
+def url_for(path):
+    """
+    Build an absolute URL on the application under test.
+    :param path: str: Path starting with a slash.
+    """
+    return BASE_URL + path
@@ -0,0 +1,136 @@
+"""
+Captures serialized DOM snapshots of the pages the page objects work on.
+
+With ORANGEHRM_SNAPSHOTS=1 a listener on the page objects saves the page's
+HTML whenever a page object finds elements that no earlier snapshot of the
+same page covers. Every element carries its computed visibility, so
+utilities/locatorReplay.py can later check the page-object XPaths against the
+snapshots without a browser.
+"""
+
+# Standard library
+import glob
+import json
+import os
+import re
+import weakref
+from urllib.parse import urlsplit
+
+# First-party
+from utilities import config
+
+VISIBLE_ATTRIBUTE = "data-snapshot-clickable"
+
+# Serializes the document with the clickable state of every element, using the
+# same rule as BasePage.visibility_report().
+SNAPSHOT_SCRIPT = """
+var attribute = arguments[0];
+var live = [document.documentElement].concat(
+    Array.prototype.slice.call(document.documentElement.getElementsByTagName('*'))
+);
+var copy = document.documentElement.cloneNode(true);
+var copies = [copy].concat(
+    Array.prototype.slice.call(copy.getElementsByTagName('*'))
+);
+live.forEach(function (node, index) {
+    var style = window.getComputedStyle(node);
+    var displayed = node.getClientRects().length > 0
+        && style.visibility !== 'hidden'
+        && parseFloat(style.opacity) > 0;
+    copies[index].setAttribute(attribute, String(displayed && !node.disabled));
+});
+return '<!DOCTYPE html>\\n' + copy.outerHTML;
+"""
+
+
+def snapshot_dir():
+    """
+    Return the directory snapshots are written to and replayed from.
+    """
+    return config.SNAPSHOT_DIR or os.path.join(config.CACHE_DIR, "snapshots")
+
+
+def load_index(directory=None):
+    """
+    Return the snapshot entries written by every worker of the last capture.
+    :param directory: str: Snapshot directory, defaults to snapshot_dir().
+    """
+    entries = []
+    for path in sorted(
+        glob.glob(os.path.join(directory or snapshot_dir(), "index-*.json"))
+    ):
+        with open(path, encoding="utf-8") as handle:
+            entries += json.load(handle)
+    return entries
+
+
+class SnapshotRecorder:
+    """
+    Page listener saving a DOM snapshot for every newly located set of elements.
+    """
+
+    def __init__(self, directory=None):
+        """
+        Initialize the SnapshotRecorder instance.
+        :param directory: str: Output directory, defaults to snapshot_dir().
+        """
+        self.directory = directory or snapshot_dir()
+        self.worker = os.environ.get("ORANGEHRM_WORKER_ID", "0")
+        self.entries = []
+        # Locator names already covered, per (page class, path).
+        self._covered = {}
+        # Last known path per page object, dropped on navigation.
+        self._paths = weakref.WeakKeyDictionary()
+
+    def on_navigation(self, page):
+        """
+        Forget where a page object is, so the next capture reads the URL again.
+        :param page: BasePage instance.
+        """
+        self._paths.pop(page, None)
+
+    def on_located(self, page, states):
+        """
+        Snapshot the page if it located elements not covered so far.
+        :param page: BasePage instance.
+        :param states: dict: Locator name to whether it had to be clickable.
+        """
+        if not states:
+            return
+        path = self._paths.get(page)
+        if path is None:
+            path = self._paths[page] = urlsplit(page.driver.current_url).path
+        cls = type(page)
+        key = ("%s:%s" % (cls.__module__, cls.__qualname__), path)
+        covered = self._covered.setdefault(key, set())
+        if set(states) <= covered:
+            return
+        covered.update(states)
+
+        html = page.driver.execute_script(SNAPSHOT_SCRIPT, VISIBLE_ATTRIBUTE)
+        file_name = "%s-%s-%d.html" % (
+            self.worker,
+            re.sub(r"[^\w]+", "_", "%s%s" % (cls.__name__, path)).strip("_"),
+            len(self.entries),
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        with open(
+            os.path.join(self.directory, file_name), "w", encoding="utf-8"
+        ) as handle:
+            handle.write(html)
+        self.entries.append(
+            {"page": key[0], "path": path, "file": file_name, "locators": states}
+        )
+
+    def save(self):
+        """
+        Write the index of this worker's snapshots, replacing its previous capture.
+        """
+        if not self.entries:
+            return
+        path = os.path.join(self.directory, "index-%s.json" % self.worker)
+        for stale in glob.glob(os.path.join(self.directory, "%s-*.html" % self.worker)):
+            if os.path.basename(stale) not in {entry["file"] for entry in self.entries}:
+                os.remove(stale)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.entries, handle, indent=2)
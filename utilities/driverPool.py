@@ -0,0 +1,212 @@
+"""
+Pool of reusable WebDriver instances shared across the test session.
+"""
+
+# Standard library
+import threading
+from urllib.parse import urlsplit
+
+# Third-party
+from selenium.common.exceptions import WebDriverException
+
+# First-party
+from utilities import config
+from utilities.browserLauncher import BrowserLauncher
+from utilities.networkFilter import NetworkFilter
+from utilities.networkThrottle import apply_throttle
+from utilities.processMemory import driver_memory
+from utilities.waits import install_request_tracker
+
+RESET_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+def visited_origins(driver):
+    """
+    Return the web origins in the navigation history of the current window.
+    :param driver: Chrome WebDriver instance.
+    """
+    history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+    origins = set()
+    for entry in history["entries"]:
+        parts = urlsplit(entry["url"])
+        if parts.scheme in ("http", "https"):
+            origins.add("%s://%s" % (parts.scheme, parts.netloc))
+    return origins
+
+
+class DriverPool:
+    """
+    Hands out warm browsers to tests and resets them when they come back.
+
+    Browsers are recycled after ``max_uses`` checkouts, once they use more than
+    ``max_memory`` bytes, or as soon as they fail a health check, so a single
+    broken or bloated browser cannot leak into later tests.
+    """
+
+    def __init__(
+        self,
+        factory=None,
+        size=None,
+        max_uses=None,
+        network_filter=None,
+        max_memory=None,
+    ):
+        """
+        Initialize the DriverPool instance.
+        :param factory: Callable returning a new WebDriver instance, defaults
+            to a BrowserLauncher for config.BROWSER_PROFILE.
+        :param size: int: Maximum number of idle browsers kept warm.
+        :param max_uses: int: Number of checkouts before a browser is replaced.
+        :param network_filter: NetworkFilter applied to every new browser.
+        :param max_memory: int: Bytes a browser and its chromedriver may use
+            before being replaced, 0 for no limit.
+        """
+        self.launcher = None
+        if factory is None:
+            self.launcher = BrowserLauncher().start()
+            factory = self.launcher.acquire
+        self.factory = factory
+        self.network_filter = network_filter or NetworkFilter()
+        self.size = config.POOL_SIZE if size is None else size
+        self.max_uses = config.POOL_MAX_USES if max_uses is None else max_uses
+        self.max_memory = (
+            config.POOL_MAX_MEMORY_MB * 2**20 if max_memory is None else max_memory
+        )
+        self.recycled = {"max_uses": 0, "max_memory": 0, "unhealthy": 0}
+        self._idle = []
+        self._uses = {}
+        self._lock = threading.Lock()
+
+    def checkout(self):
+        """
+        Return a healthy browser, launching a new one if none is idle.
+        """
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                return self._launch()
+            if self.is_healthy(driver):
+                return driver
+            self._recycle(driver, "unhealthy")
+
+    def checkin(self, driver):
+        """
+        Give a browser back to the pool after a test has finished with it.
+        :param driver: WebDriver instance previously returned by checkout().
+        """
+        with self._lock:
+            self._uses[driver] = self._uses.get(driver, 0) + 1
+            uses = self._uses[driver]
+        if uses >= self.max_uses:
+            self._recycle(driver, "max_uses")
+            return
+
+        try:
+            self.reset(driver)
+        except WebDriverException:
+            self._recycle(driver, "unhealthy")
+            return
+        # Measured on the blank page, so only memory the browser kept counts.
+        if self.max_memory and (driver_memory(driver) or 0) > self.max_memory:
+            self._recycle(driver, "max_memory")
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(driver)
+                return
+        self._discard(driver)
+
+    def shutdown(self):
+        """
+        Quit every browser owned by the pool.
+        """
+        with self._lock:
+            drivers = list(self._uses)
+            self._idle.clear()
+        for driver in drivers:
+            self._discard(driver)
+        if self.launcher is not None:
+            self.launcher.shutdown()
+        self.network_filter.save()
+
+    @staticmethod
+    def is_healthy(driver):
+        """
+        Check that the browser still answers commands.
+        :param driver: WebDriver instance to probe.
+        """
+        try:
+            driver.execute_script("return document.readyState")
+        except WebDriverException:
+            return False
+        return True
+
+    @staticmethod
+    def reset(driver):
+        """
+        Clear cookies, storage and extra windows, then park the browser on a blank page.
+        :param driver: WebDriver instance to reset.
+        """
+        cdp = hasattr(driver, "execute_cdp_cmd")
+        origins = set()
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            if cdp:
+                origins |= visited_origins(driver)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Session storage belongs to the window; only the current page's can go.
+        driver.execute_script(RESET_STORAGE_SCRIPT)
+        if cdp:
+            origins |= visited_origins(driver)
+            for origin in sorted(origins):
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origin, "storageTypes": "all"},
+                )
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    def _launch(self):
+        """
+        Start a new browser and register it with the pool.
+        """
+        driver = self.factory()
+        if hasattr(driver, "execute_cdp_cmd"):
+            install_request_tracker(driver)
+            self.network_filter.apply(driver)
+            apply_throttle(driver)
+        with self._lock:
+            self._uses[driver] = 0
+        return driver
+
+    def _recycle(self, driver, reason):
+        """
+        Quit a browser and count why it was replaced.
+        :param driver: WebDriver instance to quit.
+        :param reason: str: Key of self.recycled.
+        """
+        with self._lock:
+            self.recycled[reason] += 1
+        self._discard(driver)
+
+    def _discard(self, driver):
+        """
+        Quit a browser and forget about it.
+        :param driver: WebDriver instance to quit.
+        """
+        with self._lock:
+            self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
@@ -0,0 +1,59 @@
+"""
+Per-test duration history used to balance parallel runs.
+"""
+
+# Standard library
+import json
+import os
+
+# First-party
+from utilities import config
+
+
+class DurationStore:
+    """
+    Reads and writes the seconds each test took on its most recent runs.
+    """
+
+    # Weight given to the newest measurement when blending it into the history.
+    smoothing = 0.5
+
+    def __init__(self, path=None):
+        """
+        Initialize the DurationStore instance.
+        :param path: str: JSON file mapping test node ids to seconds.
+        """
+        self.path = path or os.environ.get(
+            "ORANGEHRM_DURATIONS_FILE", os.path.join(config.CACHE_DIR, "durations.json")
+        )
+
+    def load(self):
+        """
+        Return the recorded durations, or an empty dict when none exist yet.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    def update(self, measured):
+        """
+        Blend new measurements into the stored history and save it.
+        :param measured: dict: Test node id to seconds taken in this run.
+        """
+        durations = self.load()
+        for node_id, seconds in measured.items():
+            previous = durations.get(node_id)
+            if previous is None:
+                durations[node_id] = seconds
+            else:
+                durations[node_id] = (
+                    self.smoothing * seconds + (1 - self.smoothing) * previous
+                )
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = "%s.%d.tmp" % (self.path, os.getpid())
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(durations, handle, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
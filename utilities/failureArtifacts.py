@@ -0,0 +1,193 @@
+"""
+Failure artifacts: screenshot, page source, browser console log and URL.
+
+When a test fails the raw data is grabbed from the browser on the test thread,
+which is all the driver is needed for, and the test moves on. Decoding the
+screenshot, pretty-printing the DOM and writing the files happen on a small
+background thread pool. The artifact directory is kept under a size limit by
+evicting the oldest failures first.
+"""
+
+# Standard library
+import base64
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-party
+from selenium.common.exceptions import WebDriverException
+
+try:
+    # Third-party
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    etree = lxml_html = None
+
+# First-party
+from utilities import config
+
+
+def artifact_dir():
+    """
+    Return the directory failure artifacts are written to.
+    """
+    return config.ARTIFACT_DIR or os.path.join(config.CACHE_DIR, "artifacts")
+
+
+def pretty_html(source):
+    """
+    Indent a page source for reading, or return it unchanged without lxml.
+    :param source: str: Page source as returned by the driver.
+    """
+    if lxml_html is None:
+        return source
+    try:
+        document = lxml_html.document_fromstring(source)
+    except (etree.ParserError, ValueError):
+        return source
+    etree.indent(document)
+    return etree.tostring(
+        document,
+        pretty_print=True,
+        method="html",
+        encoding="unicode",
+        doctype="<!DOCTYPE html>",
+    )
+
+
+def directory_size(path):
+    """
+    Return the total size of the files below a directory in bytes.
+    :param path: str: Directory path.
+    """
+    total = 0
+    for directory, _, names in os.walk(path):
+        for name in names:
+            try:
+                total += os.path.getsize(os.path.join(directory, name))
+            except OSError:
+                pass
+    return total
+
+
+class ArtifactCollector:
+    """
+    Grabs failure artifacts from a driver and writes them in the background.
+    """
+
+    def __init__(self, directory=None, max_bytes=None, workers=None):
+        """
+        Initialize the ArtifactCollector instance.
+        :param directory: str: Output directory, defaults to artifact_dir().
+        :param max_bytes: int: Size the directory is kept under, defaults to
+            config.ARTIFACT_MAX_MB.
+        :param workers: int: Background writer threads, defaults to
+            config.ARTIFACT_WORKERS.
+        """
+        self.directory = directory or artifact_dir()
+        self.max_bytes = (
+            config.ARTIFACT_MAX_MB * 2**20 if max_bytes is None else max_bytes
+        )
+        self.executor = ThreadPoolExecutor(
+            config.ARTIFACT_WORKERS if workers is None else workers,
+            thread_name_prefix="failure-artifacts",
+        )
+        self.written = []
+        self.evicted = 0
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def capture(self, node_id, driver, since=None, when="call"):
+        """
+        Grab the raw artifacts of a failed test and queue them for writing.
+
+        Every grab is independent, so a browser that crashed still yields
+        whatever it can answer.
+        :param node_id: str: Test node id.
+        :param driver: WebDriver instance the test ran in.
+        :param since: float: Epoch seconds; older console entries are left out.
+        :param when: str: Test phase that failed, "setup" or "call".
+        :return: str: Directory the artifacts are written to.
+        """
+        raw = {"node_id": node_id, "when": when, "captured_at": time.time()}
+        for key, grab in (
+            ("url", lambda: driver.current_url),
+            ("screenshot", driver.get_screenshot_as_base64),
+            ("page_source", lambda: driver.page_source),
+            ("console", lambda: driver.get_log("browser")),
+        ):
+            try:
+                raw[key] = grab()
+            except WebDriverException as error:
+                raw.setdefault("errors", {})[key] = (
+                    error.msg or error.__class__.__name__
+                )
+        if since is not None and "console" in raw:
+            raw["console"] = [
+                entry for entry in raw["console"] if entry["timestamp"] >= since * 1000
+            ]
+        # One directory per phase, so two failures of a test never share one.
+        path = os.path.join(
+            self.directory,
+            "%s-%s" % (re.sub(r"[^\w.-]+", "_", node_id).strip("_"), when),
+        )
+        self._pending.append(self.executor.submit(self._write, path, raw))
+        return path
+
+    def close(self):
+        """
+        Wait for the queued artifacts to be written, raising the first write error.
+        """
+        self.executor.shutdown(wait=True)
+        for future in self._pending:
+            future.result()
+
+    def _write(self, path, raw):
+        """
+        Decode, format and write one failure's artifacts, then enforce the size limit.
+        :param path: str: Directory for this failure.
+        :param raw: dict: Data grabbed by capture().
+        """
+        # A rerun's failure replaces the earlier one of the same test.
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path)
+        if "screenshot" in raw:
+            with open(os.path.join(path, "screenshot.png"), "wb") as handle:
+                handle.write(base64.b64decode(raw.pop("screenshot")))
+        if "page_source" in raw:
+            with open(os.path.join(path, "page.html"), "w", encoding="utf-8") as handle:
+                handle.write(pretty_html(raw.pop("page_source")))
+        with open(os.path.join(path, "failure.json"), "w", encoding="utf-8") as handle:
+            json.dump(raw, handle, indent=2)
+        with self._lock:
+            self.written.append(path)
+            self._evict(keep=path)
+
+    def _evict(self, keep):
+        """
+        Remove the oldest failure directories until the total size fits the limit.
+        :param keep: str: Directory just written, which is never removed.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if os.path.isdir(path):
+                try:
+                    entries.append((os.path.getmtime(path), path, directory_size(path)))
+                except OSError:
+                    pass
+        total = sum(size for _, _, size in entries)
+        for _, path, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            # Other workers evict from the same directory.
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            self.evicted += 1
@@ -0,0 +1,121 @@
+"""
+Protocol-level OrangeHRM login that produces a session cookie without a browser.
+
+The login page embeds a CSRF token in the ``:token`` attribute of its Vue
+component. The client fetches the page, posts the token and the credentials
+to the validate endpoint and keeps the ``orangehrm`` session cookie the
+server hands back. Connections are pooled and kept alive, so repeated logins
+skip the TCP and TLS handshakes.
+"""
+
+# Standard library
+import re
+from http.cookies import SimpleCookie
+from urllib.parse import urlsplit
+
+# Third-party
+import urllib3
+
+# First-party
+from utilities import config
+
+TOKEN_PATTERN = re.compile(r':token="&quot;(.+?)&quot;"')
+VALIDATE_PATH = "/web/index.php/auth/validate"
+SESSION_COOKIE = "orangehrm"
+
+
+class HttpLogin:
+    """
+    Logs in over HTTP and returns cookies ready for WebDriver.
+    """
+
+    def __init__(self, base_url=None, timeout=None, pool=None):
+        """
+        Initialize the HttpLogin instance.
+        :param base_url: str: Application URL, defaults to config.BASE_URL.
+        :param timeout: float: Seconds allowed per request, defaults to
+            config.DEFAULT_TIMEOUT.
+        :param pool: urllib3.PoolManager shared between clients.
+        """
+        self.base_url = (base_url or config.BASE_URL).rstrip("/")
+        self.timeout = config.DEFAULT_TIMEOUT if timeout is None else timeout
+        self.pool = pool or urllib3.PoolManager(num_pools=2, maxsize=4)
+
+    def login(self, username, password):
+        """
+        Log in and return the session cookies.
+        :param username: str: OrangeHRM username.
+        :param password: str: OrangeHRM password.
+        :return: list: Cookie dicts in the format of WebDriver.get_cookies().
+        :raises RuntimeError: If the page has no token or the login is rejected.
+        """
+        cookies = {}
+        page = self._request("GET", config.LOGIN_PATH, cookies)
+        if page.status != 200:
+            raise RuntimeError("Login page returned HTTP %d" % page.status)
+        match = TOKEN_PATTERN.search(page.data.decode("utf-8", "replace"))
+        if match is None:
+            raise RuntimeError("No CSRF token found on the login page")
+
+        response = self._request(
+            "POST",
+            VALIDATE_PATH,
+            cookies,
+            fields={
+                "_token": match.group(1),
+                "username": username,
+                "password": password,
+            },
+        )
+        location = response.headers.get("Location", "")
+        if response.status not in (301, 302, 303) or config.LOGIN_PATH in location:
+            raise RuntimeError("Login as %r was rejected" % username)
+        if not cookies.get(SESSION_COOKIE):
+            raise RuntimeError("Login response did not set a session cookie")
+        return [self._webdriver_cookie(name, value) for name, value in cookies.items()]
+
+    def _request(self, method, path, cookies, fields=None):
+        """
+        Send a request without following redirects and store the cookies it sets.
+        :param method: str: "GET" or "POST".
+        :param path: str: Application path.
+        :param cookies: dict: Cookie jar sent with the request and updated in place.
+        :param fields: dict: Form fields, url-encoded into the body of a POST.
+        """
+        headers = {}
+        if cookies:
+            headers["Cookie"] = "; ".join("%s=%s" % item for item in cookies.items())
+        kwargs = {"headers": headers}
+        if fields is not None:
+            kwargs["fields"] = fields
+            kwargs["encode_multipart"] = False
+        response = self.pool.request(
+            method,
+            self.base_url + path,
+            redirect=False,
+            retries=False,
+            timeout=self.timeout,
+            **kwargs,
+        )
+        for header in response.headers.getlist("Set-Cookie"):
+            for name, morsel in SimpleCookie(header).items():
+                if morsel.value:
+                    cookies[name] = morsel.value
+                else:
+                    cookies.pop(name, None)
+        return response
+
+    def _webdriver_cookie(self, name, value):
+        """
+        Build a cookie dict that WebDriver and the session cache understand.
+        :param name: str: Cookie name.
+        :param value: str: Cookie value.
+        """
+        # No domain, so the cookie stays host-only like the one the server set.
+        return {
+            "name": name,
+            "value": value,
+            "path": "/",
+            "secure": urlsplit(self.base_url).scheme == "https",
+            "httpOnly": True,
+        }
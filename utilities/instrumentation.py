@@ -0,0 +1,258 @@
+"""
+Per-step timing and WebDriver command counting for the page objects.
+
+When enabled, every public page-object method, including those inherited
+from BasePage, becomes a "step", every Wait.until call a "wait" and every
+chromedriver command a "webdriver" span. Each span knows its wall time, the
+time spent waiting inside it and the number of chromedriver round trips it
+caused. Nothing is patched while tracing is disabled, so the cost when off
+is zero.
+"""
+
+# Standard library
+import functools
+import inspect
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+# First-party
+from pageObjects.basePage import BasePage
+from utilities import config
+from utilities.waits import Wait
+
+tracer = None
+_originals = []
+
+# BasePage helpers that never talk to the browser; spans would only add noise.
+UNTRACED_METHODS = ("locator", "selector", "invalidate", "wait")
+
+
+class Tracer:
+    """
+    Collects nested timing spans for one test at a time.
+    """
+
+    def __init__(self):
+        """
+        Initialize the Tracer instance.
+        """
+        self.test_name = None
+        self.spans = []
+        self.origin = time.perf_counter()
+        # Wall-clock time of the origin, to compare spans with pytest's timings.
+        self.started = time.time()
+        self._local = threading.local()
+
+    def begin(self, test_name):
+        """
+        Start collecting spans for a test.
+        :param test_name: str: Test node id.
+        """
+        self.test_name = test_name
+        self.spans = []
+        self.origin = time.perf_counter()
+        self.started = time.time()
+
+    def spans_since(self, timestamp):
+        """
+        Return the spans that started at or after a wall-clock time.
+        :param timestamp: float: time.time() value, e.g. pytest's CallInfo.start.
+        """
+        return [
+            span for span in self.spans if self.started + span["start"] >= timestamp
+        ]
+
+    @contextmanager
+    def span(self, name, category, **args):
+        """
+        Time a block of code as a span nested in the spans currently open.
+        :param name: str: Span name, e.g. "Login.click_login".
+        :param category: str: "step", "wait" or "webdriver".
+        :param args: Extra values stored with the span.
+        """
+        stack = self._stack()
+        record = {
+            "name": name,
+            "category": category,
+            "start": time.perf_counter() - self.origin,
+            "wait": 0.0,
+            "commands": 0,
+            "thread": threading.get_ident(),
+            "args": args,
+        }
+        stack.append(record)
+        try:
+            yield record
+        finally:
+            stack.pop()
+            record["wall"] = time.perf_counter() - self.origin - record["start"]
+            # A wait that falls back to another wait is only counted once.
+            outermost = not any(parent["category"] == "wait" for parent in stack)
+            for parent in stack:
+                if category == "wait" and outermost:
+                    parent["wait"] += record["wall"]
+                elif category == "webdriver":
+                    parent["commands"] += 1
+            self.spans.append(record)
+
+    def end(self, directory=None):
+        """
+        Write the test's spans as JSON and as a Chrome trace-event file.
+        :param directory: str: Output directory, defaults to <cache>/traces.
+        :return: list: The step spans of the test.
+        """
+        directory = directory or os.path.join(config.CACHE_DIR, "traces")
+        os.makedirs(directory, exist_ok=True)
+        base_name = re.sub(r"[^\w.-]+", "_", self.test_name or "untitled")
+        steps = [span for span in self.spans if span["category"] == "step"]
+
+        with open(
+            os.path.join(directory, base_name + ".json"), "w", encoding="utf-8"
+        ) as handle:
+            json.dump(
+                {
+                    "test": self.test_name,
+                    "steps": [
+                        {
+                            "name": span["name"],
+                            "start": span["start"],
+                            "wall": span["wall"],
+                            "wait": span["wait"],
+                            "commands": span["commands"],
+                        }
+                        for span in sorted(steps, key=lambda span: span["start"])
+                    ],
+                },
+                handle,
+                indent=2,
+            )
+        with open(
+            os.path.join(directory, base_name + ".trace.json"), "w", encoding="utf-8"
+        ) as handle:
+            json.dump({"traceEvents": self.trace_events()}, handle)
+        return steps
+
+    def trace_events(self):
+        """
+        Convert the spans to Chrome trace-event "complete" events.
+        """
+        return [
+            {
+                "name": span["name"],
+                "cat": span["category"],
+                "ph": "X",
+                "ts": span["start"] * 1e6,
+                "dur": span["wall"] * 1e6,
+                "pid": os.getpid(),
+                "tid": span["thread"],
+                "args": dict(
+                    span["args"],
+                    wait_ms=span["wait"] * 1000,
+                    commands=span["commands"],
+                ),
+            }
+            for span in self.spans
+        ]
+
+    def _stack(self):
+        """
+        Return the stack of open spans for the calling thread.
+        """
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+
+def is_enabled():
+    """
+    Check whether tracing is installed.
+    """
+    return tracer is not None
+
+
+def enable():
+    """
+    Install the tracing wrappers on the page objects and the wait engine.
+    """
+    global tracer
+    if tracer is not None:
+        return tracer
+    tracer = Tracer()
+
+    for cls in (BasePage, *BasePage.page_classes()):
+        for name, attribute in list(vars(cls).items()):
+            if (
+                name.startswith("_")
+                or name in UNTRACED_METHODS
+                or not inspect.isfunction(attribute)
+            ):
+                continue
+            _patch(cls, name, "%s.%s" % (cls.__name__, name), "step")
+    _patch(Wait, "until", "Wait.until", "wait")
+    _patch(Wait, "until_element", "Wait.until_element", "wait")
+    return tracer
+
+
+def disable():
+    """
+    Restore the original methods.
+    """
+    global tracer
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+    tracer = None
+
+
+def attach(driver):
+    """
+    Count and time every chromedriver command issued through a driver.
+    :param driver: WebDriver instance.
+    """
+    if tracer is None or getattr(driver, "_orangehrm_traced", False):
+        return
+    execute = driver.execute
+
+    @functools.wraps(execute)
+    def traced_execute(driver_command, params=None):
+        if tracer is None:
+            return execute(driver_command, params)
+        with tracer.span(driver_command, "webdriver"):
+            return execute(driver_command, params)
+
+    driver.execute = traced_execute
+    driver._orangehrm_traced = True
+
+
+def _patch(owner, name, span_name, category):
+    """
+    Replace a method with a version that records a span around each call.
+    :param owner: type: Class owning the method.
+    :param name: str: Method name.
+    :param span_name: str: Name given to the spans.
+    :param category: str: Span category.
+    """
+    original = vars(owner)[name]
+
+    method_suffix = "." + name
+
+    @functools.wraps(original)
+    def traced(*args, **kwargs):
+        stack = tracer._stack()
+        if (
+            category == "step"
+            and stack
+            and stack[-1]["category"] == "step"
+            and stack[-1]["name"].endswith(method_suffix)
+        ):
+            # An override calling the method it overrides is one step.
+            return original(*args, **kwargs)
+        with tracer.span(span_name, category):
+            return original(*args, **kwargs)
+
+    _originals.append((owner, name, original))
+    setattr(owner, name, traced)
@@ -0,0 +1,403 @@
+"""
+Profiles the page-object XPaths and proposes faster equivalent selectors.
+
+The profiler drives a browser through the page states the tests visit and, on
+every state, times each locator's XPath in the page with performance.now().
+For every element an XPath matches it derives candidate selectors (id, a
+distinguishing attribute, the class list, or the XPath anchored to the tag
+instead of ``*``). A second visit of every state checks that each candidate
+finds exactly the element the XPath finds, or nothing wherever the XPath
+finds nothing, and times it. Candidates faster by the margin on every state
+are written to pageObjects/fastSelectors.json together with the base URL they
+were verified on. BasePage.selector() uses them against that application only,
+and for as long as the locator's XPath stays the one that was verified.
+
+    python -m utilities.locatorProfiler --target local --repeat 50
+    python -m utilities.locatorProfiler --target demo --write
+
+The stand-in only mimics the application's DOM, so --write is refused for the
+local target.
+"""
+
+# Standard library
+import argparse
+import json
+import os
+import sys
+
+# First-party
+from pageObjects.adminPage import AdminHeader
+from pageObjects.basePage import FAST_SELECTORS_PATH, BasePage
+from pageObjects.loginPage import Login
+from utilities import config
+from utilities.browserLauncher import PROFILES, BrowserLauncher
+from utilities.standin.server import StandinServer
+
+# Times every XPath and derives candidate selectors from its first match.
+PROFILE_SCRIPT = """
+var locators = arguments[0], repeat = arguments[1], result = {};
+function first(xpath) {
+    return document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+}
+function quote(value) {
+    return '"' + value.replace(/\\\\/g, '\\\\\\\\').replace(/"/g, '\\\\"') + '"';
+}
+function candidates(xpath, node) {
+    var tag = node.tagName.toLowerCase(), found = [];
+    if (node.id) {
+        found.push(['css selector', '#' + CSS.escape(node.id)]);
+    }
+    ['name', 'type', 'href', 'placeholder'].forEach(function (attribute) {
+        var value = node.getAttribute(attribute);
+        if (value) {
+            found.push(
+                ['css selector', tag + '[' + attribute + '=' + quote(value) + ']']
+            );
+        }
+    });
+    var classes = Array.prototype.slice.call(node.classList);
+    if (classes.length) {
+        found.push(['css selector', tag + classes.map(function (name) {
+            return '.' + CSS.escape(name);
+        }).join('')]);
+        classes.forEach(function (name) {
+            found.push(['css selector', tag + '.' + CSS.escape(name)]);
+        });
+    }
+    var anchored = xpath.replace(/^(\\.?\\/\\/)\\*/, '$1' + tag);
+    if (anchored !== xpath) {
+        found.push(['xpath', anchored]);
+    }
+    return found;
+}
+Object.keys(locators).forEach(function (key) {
+    var xpath = locators[key], node = null, started = performance.now();
+    for (var index = 0; index < repeat; index++) {
+        node = first(xpath);
+    }
+    result[key] = {
+        ms: (performance.now() - started) / repeat,
+        candidates: node ? candidates(xpath, node) : []
+    };
+});
+return result;
+"""
+
+# Checks that every candidate finds the XPath's element and times it.
+VERIFY_SCRIPT = """
+var checks = arguments[0], repeat = arguments[1], result = {};
+function find(by, value) {
+    return by === 'css selector'
+        ? document.querySelector(value)
+        : document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+}
+Object.keys(checks).forEach(function (key) {
+    var expected = find('xpath', checks[key].xpath);
+    result[key] = checks[key].candidates.map(function (candidate) {
+        var node = null, started = performance.now();
+        try {
+            for (var index = 0; index < repeat; index++) {
+                node = find(candidate[0], candidate[1]);
+            }
+        } catch (error) {
+            return {same: false, ms: null};
+        }
+        return {same: node === expected, ms: (performance.now() - started) / repeat};
+    });
+});
+return result;
+"""
+
+
+def _open_login(driver):
+    """
+    Start from a fresh login page.
+    :param driver: WebDriver instance.
+    """
+    driver.delete_all_cookies()
+    driver.get(config.url_for(config.LOGIN_PATH))
+    login_object = Login(driver)
+    login_object.is_login_form_displayed()
+    return login_object
+
+
+def _logged_in(driver):
+    """
+    Log in as the configured admin.
+    :param driver: WebDriver instance.
+    """
+    login_object = _open_login(driver)
+    login_object.enter_username(config.ADMIN_USERNAME)
+    login_object.enter_password(config.ADMIN_PASSWORD)
+    login_object.click_login()
+    login_object.wait_for_url(config.DASHBOARD_PATH)
+    return login_object
+
+
+def login_page(driver):
+    """
+    The empty login form.
+    """
+    _open_login(driver)
+
+
+def invalid_credentials(driver):
+    """
+    The login form after a rejected login.
+    """
+    login_object = _open_login(driver)
+    login_object.enter_username(config.ADMIN_USERNAME)
+    login_object.enter_password("invalid-password")
+    login_object.click_login()
+    login_object.invalid_credentials_message()
+
+
+def required_fields(driver):
+    """
+    The login form after submitting it empty.
+    """
+    login_object = _open_login(driver)
+    login_object.click_login()
+    login_object.required_field_message()
+
+
+def forgot_password(driver):
+    """
+    The reset password form.
+    """
+    _open_login(driver).click_forgot_password_link()
+
+
+def reset_link_sent(driver):
+    """
+    The confirmation after requesting a reset link.
+    """
+    login_object = _open_login(driver)
+    login_object.click_forgot_password_link()
+    login_object.enter_username(config.ADMIN_USERNAME)
+    login_object.click_reset_password_button()
+    login_object.check_reset_link_sent_message()
+
+
+def dashboard_menu(driver):
+    """
+    The dashboard with the user drop-down open.
+    """
+    _logged_in(driver).view_drop_down_menu()
+
+
+def admin_module(driver):
+    """
+    The Admin module with its header and main menu.
+    """
+    _logged_in(driver)
+    admin_object = AdminHeader(driver)
+    admin_object.click_admin_tab()
+    admin_object.visibility_report()
+
+
+STATES = {
+    "login_page": login_page,
+    "invalid_credentials": invalid_credentials,
+    "required_fields": required_fields,
+    "forgot_password": forgot_password,
+    "reset_link_sent": reset_link_sent,
+    "dashboard_menu": dashboard_menu,
+    "admin_module": admin_module,
+}
+
+
+def page_locators():
+    """
+    Return every locator XPath keyed by "Class.name" of the class declaring it.
+    """
+    locators = {}
+    for cls in BasePage.page_classes():
+        for name, xpath in cls.locators.items():
+            if name in vars(cls):
+                locators["%s.%s" % (cls.__name__, name)] = xpath
+    return locators
+
+
+class LocatorProfiler:
+    """
+    Times the locator XPaths on every page state and verifies faster candidates.
+    """
+
+    def __init__(self, driver, repeat=20, margin=0.2, states=None):
+        """
+        Initialize the LocatorProfiler instance.
+        :param driver: WebDriver instance to profile in.
+        :param repeat: int: Evaluations per timing, averaged.
+        :param margin: float: How much faster a candidate has to be, 0.2 is 20%.
+        :param states: list: Names from STATES to visit, defaults to all of them.
+        """
+        self.driver = driver
+        self.repeat = repeat
+        self.margin = margin
+        self.states = states or list(STATES)
+        self.locators = page_locators()
+
+    def run(self):
+        """
+        Profile, verify and rank every locator.
+        :return: list: One dict per locator, the most expensive XPath first.
+        """
+        timings = {key: [] for key in self.locators}
+        candidates = {key: [] for key in self.locators}
+        for state in self.states:
+            STATES[state](self.driver)
+            profile = self.driver.execute_script(
+                PROFILE_SCRIPT, self.locators, self.repeat
+            )
+            for key, entry in profile.items():
+                timings[key].append(entry["ms"])
+                for candidate in entry["candidates"]:
+                    if candidate not in candidates[key]:
+                        candidates[key].append(candidate)
+
+        checks = {
+            key: {"xpath": self.locators[key], "candidates": candidates[key]}
+            for key in self.locators
+            if candidates[key]
+        }
+        verified = {key: [[] for _ in checks[key]["candidates"]] for key in checks}
+        for state in self.states:
+            STATES[state](self.driver)
+            results = self.driver.execute_script(VERIFY_SCRIPT, checks, self.repeat)
+            for key, outcomes in results.items():
+                for index, outcome in enumerate(outcomes):
+                    verified[key][index].append(
+                        outcome["ms"] if outcome["same"] else None
+                    )
+
+        ranking = []
+        for key, xpath in self.locators.items():
+            xpath_ms = sum(timings[key]) / len(timings[key])
+            best = None
+            for index, samples in enumerate(verified.get(key, ())):
+                if None in samples:
+                    continue
+                ms = sum(samples) / len(samples)
+                if ms < xpath_ms * (1 - self.margin) and (
+                    best is None or ms < best["ms"]
+                ):
+                    by, value = checks[key]["candidates"][index]
+                    best = {"by": by, "value": value, "ms": ms}
+            ranking.append(
+                {"locator": key, "xpath": xpath, "xpath_ms": xpath_ms, "fast": best}
+            )
+        ranking.sort(key=lambda entry: entry["xpath_ms"], reverse=True)
+        return ranking
+
+
+def fast_selector_table(ranking):
+    """
+    Build the fastSelectors.json content from a profiler ranking.
+    :param ranking: list: Result of LocatorProfiler.run().
+    """
+    return {
+        entry["locator"]: {
+            "xpath": entry["xpath"],
+            "by": entry["fast"]["by"],
+            "value": entry["fast"]["value"],
+            "xpath_ms": round(entry["xpath_ms"], 4),
+            "ms": round(entry["fast"]["ms"], 4),
+        }
+        for entry in ranking
+        if entry["fast"]
+    }
+
+
+def print_report(ranking):
+    """
+    Print the locators from the most to the least expensive with their proposals.
+    :param ranking: list: Result of LocatorProfiler.run().
+    """
+    print("%-40s %10s %10s  %s" % ("locator", "xpath ms", "fast ms", "proposal"))
+    for entry in ranking:
+        fast = entry["fast"]
+        print(
+            "%-40s %10.4f %10s  %s"
+            % (
+                entry["locator"],
+                entry["xpath_ms"],
+                "%.4f" % fast["ms"] if fast else "-",
+                "%s %s" % (fast["by"], fast["value"]) if fast else "",
+            )
+        )
+
+
+def main(argv=None):
+    """
+    Run the profiler from the command line.
+    :param argv: list: Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--target",
+        default=config.TARGET,
+        help='"demo", "local" for the bundled stand-in, or a base URL.',
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--margin",
+        type=float,
+        default=0.2,
+        help="How much faster a selector must be to be proposed, 0.2 is 20%%.",
+    )
+    parser.add_argument(
+        "--states", nargs="+", choices=sorted(STATES), default=list(STATES)
+    )
+    parser.add_argument(
+        "--profile", choices=sorted(PROFILES), default=config.BROWSER_PROFILE
+    )
+    parser.add_argument(
+        "--write",
+        action="store_true",
+        help="Write the verified selectors to %s."
+        % os.path.relpath(FAST_SELECTORS_PATH),
+    )
+    args = parser.parse_args(argv)
+    if args.write and args.target == "local":
+        parser.error(
+            "--write needs --target demo or a base URL: the stand-in only mimics "
+            "the application, so its selectors are not known to work there"
+        )
+
+    standin = None
+    if args.target == "local":
+        standin = StandinServer(port=0)
+        standin.start()
+        config.BASE_URL = standin.url
+    elif args.target != "demo":
+        config.BASE_URL = args.target.rstrip("/")
+
+    # Profile the XPaths themselves, not the fast selectors of an earlier run.
+    BasePage.fast_selectors = {}
+    launcher = BrowserLauncher(args.profile, warm=0)
+    driver = launcher.acquire()
+    try:
+        ranking = LocatorProfiler(driver, args.repeat, args.margin, args.states).run()
+    finally:
+        driver.quit()
+        if standin is not None:
+            standin.stop()
+
+    print_report(ranking)
+    if args.write:
+        temp_path = "%s.%d.tmp" % (FAST_SELECTORS_PATH, os.getpid())
+        table = {"base_url": config.BASE_URL, "selectors": fast_selector_table(ranking)}
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(table, handle, indent=2, sort_keys=True)
+        os.replace(temp_path, FAST_SELECTORS_PATH)
+        print("Fast selectors written to", FAST_SELECTORS_PATH)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+Checks the page-object XPaths against stored DOM snapshots, without a browser.
+
+Every locator a page object found during the capture run is evaluated again,
+with its current XPath, against the snapshot of the page it was found on. A
+locator fails when it no longer matches anything, or when it had to be
+clickable and its first match was not. The whole check takes milliseconds,
+which makes it usable as a pre-commit hook:
+
+    python -m utilities.locatorReplay
+
+Needs the optional lxml package.
+"""
+
+# Standard library
+import importlib
+import os
+import sys
+import time
+
+try:
+    # Third-party
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    etree = lxml_html = None
+
+# First-party
+from utilities.domSnapshot import VISIBLE_ATTRIBUTE, load_index, snapshot_dir
+
+
+def page_class(name):
+    """
+    Import a page-object class from its "module:Class" name.
+    :param name: str: Class name as stored in the snapshot index.
+    """
+    module_name, class_name = name.split(":", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def check_locator(document, xpath, clickable):
+    """
+    Evaluate one XPath against a parsed snapshot.
+    :param document: lxml document of the snapshot.
+    :param xpath: str: Locator XPath.
+    :param clickable: bool: Whether the first match has to be clickable.
+    :return: str: Problem description, or None if the locator is fine.
+    """
+    try:
+        matches = document.xpath(xpath)
+    except etree.XPathError as error:
+        return "invalid XPath (%s)" % error
+    elements = [match for match in matches if isinstance(match, etree.ElementBase)]
+    if not elements:
+        return "matches nothing"
+    if clickable and elements[0].get(VISIBLE_ATTRIBUTE) != "true":
+        return "first match is not clickable"
+    return None
+
+
+def replay(directory=None):
+    """
+    Check every recorded locator against its snapshot.
+    :param directory: str: Snapshot directory, defaults to domSnapshot.snapshot_dir().
+    :return: tuple: (number of checks, list of failure messages).
+    """
+    if lxml_html is None:
+        raise RuntimeError("Offline locator replay needs lxml: pip install lxml")
+    directory = directory or snapshot_dir()
+    checks, failures = 0, []
+    for entry in load_index(directory):
+        try:
+            cls = page_class(entry["page"])
+        except (ImportError, AttributeError):
+            failures.append("%s: page object no longer exists" % entry["page"])
+            continue
+        with open(os.path.join(directory, entry["file"]), "rb") as handle:
+            document = lxml_html.fromstring(handle.read())
+        for name, clickable in entry["locators"].items():
+            checks += 1
+            xpath = getattr(cls, name, None)
+            if xpath is None:
+                failures.append("%s.%s: locator removed" % (cls.__name__, name))
+                continue
+            problem = check_locator(document, xpath, clickable)
+            if problem:
+                failures.append(
+                    "%s.%s on %s: %s (%s)"
+                    % (cls.__name__, name, entry["path"], problem, xpath)
+                )
+    return checks, failures
+
+
+def main(argv=None):
+    """
+    Run the replay from the command line; exits with 1 if a locator broke.
+    :param argv: list: Optional snapshot directory.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    directory = argv[0] if argv else None
+    started = time.perf_counter()
+    checks, failures = replay(directory)
+    if not checks:
+        print(
+            "No snapshots in %s; capture them with ORANGEHRM_SNAPSHOTS=1 python main.py"
+            % (directory or snapshot_dir())
+        )
+        return 0
+    for failure in failures:
+        print("BROKEN", failure)
+    print(
+        "%d locators checked, %d broken, in %.0f ms"
+        % (checks, len(failures), (time.perf_counter() - started) * 1000)
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Per-test memory curves of the browser and chromedriver.
+
+A background thread samples the process tree of the test's browser while the
+test runs. The curves are written to the cache so growth across a long
+session can be read from data instead of guessed from timeouts.
+"""
+
+# Standard library
+import json
+import os
+import threading
+import time
+
+# First-party
+from utilities import config
+from utilities.processMemory import driver_memory_breakdown
+
+
+class MemorySampler:
+    """
+    Samples a memory reading in a background thread.
+    """
+
+    def __init__(self, read, interval=0.25):
+        """
+        Initialize the MemorySampler instance.
+        :param read: Callable returning the current memory, or None to skip a sample.
+        :param interval: float: Seconds between samples; 0 samples only at
+            the start and the end.
+        """
+        self.read = read
+        self.interval = interval
+        self.samples = []
+        self._origin = time.perf_counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="memory-sampler", daemon=True
+        )
+
+    def __enter__(self):
+        """
+        Start sampling.
+        """
+        self._origin = time.perf_counter()
+        self._sample()
+        if self.interval > 0:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Stop sampling, wait for the sampler thread and take a last sample.
+        """
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self._sample()
+
+    @property
+    def values(self):
+        """
+        The sampled readings without their timestamps.
+        """
+        return [value for _, value in self.samples]
+
+    def _run(self):
+        """
+        Record a sample every interval until stopped.
+        """
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        """
+        Record one reading with its offset from the start in seconds.
+        """
+        value = self.read()
+        if value is not None:
+            self.samples.append((time.perf_counter() - self._origin, value))
+
+
+class MemoryMonitor:
+    """
+    Records a memory curve for every test and writes them out at the end of the session.
+    """
+
+    def __init__(self, interval=None, path=None):
+        """
+        Initialize the MemoryMonitor instance.
+        :param interval: float: Seconds between samples during a test, defaults
+            to config.MEMORY_SAMPLE_INTERVAL.
+        :param path: str: JSON file the curves are written to.
+        """
+        self.interval = config.MEMORY_SAMPLE_INTERVAL if interval is None else interval
+        self.path = path or os.path.join(
+            config.CACHE_DIR,
+            "memory",
+            "worker-%s.json" % os.environ.get("ORANGEHRM_WORKER_ID", "0"),
+        )
+        self.tests = {}
+        self._browsers = {}
+
+    def watch(self, test_name, driver):
+        """
+        Sample a browser's memory while a test uses it.
+        :param test_name: str: Test node id.
+        :param driver: WebDriver instance the test runs in.
+        :return: MemorySampler: Context manager active for the duration of the test.
+        """
+        browser = getattr(driver, "session_id", id(driver))
+        self._browsers[browser] = self._browsers.get(browser, 0) + 1
+        sampler = MemorySampler(lambda: driver_memory_breakdown(driver), self.interval)
+        self.tests[test_name] = {
+            # How many tests this browser served, this one included.
+            "browser_tests": self._browsers[browser],
+            "sampler": sampler,
+        }
+        return sampler
+
+    def summary(self, test_name):
+        """
+        Summarise the memory of a watched test.
+        :param test_name: str: Test node id.
+        :return: dict: Start, end and peak bytes of the browser and chromedriver,
+            and the curve of total bytes, or None if nothing was sampled.
+        """
+        record = self.tests.get(test_name)
+        if record is None or not record["sampler"].samples:
+            return None
+        samples = record["sampler"].samples
+        return {
+            "browser_tests": record["browser_tests"],
+            "start": samples[0][1],
+            "end": samples[-1][1],
+            "peak": max(
+                (sample for _, sample in samples), key=lambda sample: sample["total"]
+            ),
+            "curve": [
+                [round(offset, 3), sample["total"]] for offset, sample in samples
+            ],
+        }
+
+    def save(self):
+        """
+        Write the summaries of every watched test.
+        """
+        summaries = {name: self.summary(name) for name in self.tests}
+        summaries = {name: value for name, value in summaries.items() if value}
+        if not summaries:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as handle:
+            json.dump(summaries, handle, indent=2)
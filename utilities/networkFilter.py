@@ -0,0 +1,180 @@
+"""
+Blocks resources the assertions never look at, using the Chrome DevTools Protocol.
+"""
+
+# Standard library
+import json
+import os
+
+# Third-party
+from selenium.common.exceptions import WebDriverException
+
+# First-party
+from utilities import config
+from utilities.browserLauncher import get_profile
+
+# URL patterns for each resource type, as understood by Network.setBlockedURLs.
+RESOURCE_TYPE_EXTENSIONS = {
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "image": ("png", "jpg", "jpeg", "gif", "svg", "webp", "ico"),
+    "media": ("mp4", "webm", "ogg", "mp3", "wav"),
+}
+
+THIRD_PARTY_DOMAINS = (
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "youtube.com",
+)
+
+
+class NetworkFilterProfile:
+    """
+    A named list of resource types and domains to block.
+    """
+
+    def __init__(self, name, resource_types=(), domains=()):
+        """
+        Initialize the NetworkFilterProfile instance.
+        :param name: str: Profile name used in config and reports.
+        :param resource_types: tuple: Keys of RESOURCE_TYPE_EXTENSIONS to block.
+        :param domains: tuple: Domains whose requests are blocked.
+        """
+        self.name = name
+        self.resource_types = tuple(resource_types)
+        self.domains = tuple(domains)
+
+    def patterns(self):
+        """
+        Return the URL patterns to pass to Network.setBlockedURLs.
+        """
+        patterns = []
+        for resource_type in self.resource_types:
+            for extension in RESOURCE_TYPE_EXTENSIONS[resource_type]:
+                patterns += ["*.%s" % extension, "*.%s?*" % extension]
+        patterns += ["*://%s/*" % domain for domain in self.domains]
+        patterns += ["*://*.%s/*" % domain for domain in self.domains]
+        return patterns
+
+
+FILTER_PROFILES = {
+    profile.name: profile
+    for profile in (
+        NetworkFilterProfile("none"),
+        # Blocks nothing but records resource sizes for later estimates.
+        NetworkFilterProfile("measure"),
+        NetworkFilterProfile("assets", ("font", "image", "media")),
+        NetworkFilterProfile("third_party", domains=THIRD_PARTY_DOMAINS),
+        NetworkFilterProfile("strict", ("font", "image", "media"), THIRD_PARTY_DOMAINS),
+    )
+}
+
+
+def get_filter(name=None):
+    """
+    Return a network filter profile by name.
+    :param name: str: Profile name, defaults to config.NETWORK_FILTER or the
+        filter of the active launch profile.
+    """
+    name = name or config.NETWORK_FILTER or get_profile().network_filter
+    try:
+        return FILTER_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            "Unknown network filter %r, expected one of %s"
+            % (name, ", ".join(sorted(FILTER_PROFILES)))
+        ) from None
+
+
+class NetworkFilter:
+    """
+    Applies a filter profile to browsers and reports what it saved.
+
+    Blocked requests never download, so their size is estimated from the
+    sizes seen when the same URLs were last loaded without blocking.
+    """
+
+    def __init__(self, profile=None, history_path=None):
+        """
+        Initialize the NetworkFilter instance.
+        :param profile: str: Filter profile name, see get_filter().
+        :param history_path: str: JSON file of known resource sizes.
+        """
+        self.profile = get_filter(profile)
+        self.history_path = history_path or os.path.join(
+            config.CACHE_DIR, "resource_sizes.json"
+        )
+        self.sizes = self._load_sizes()
+
+    @property
+    def active(self):
+        """
+        Whether this filter blocks anything.
+        """
+        return bool(self.profile.patterns())
+
+    def apply(self, driver):
+        """
+        Start blocking the profile's resources in a browser.
+        :param driver: Chrome WebDriver instance.
+        """
+        if self.active:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": self.profile.patterns()}
+            )
+
+    def collect(self, driver):
+        """
+        Summarise the requests blocked since the last call.
+        :param driver: Chrome WebDriver instance launched by a profile with a filter.
+        :return: dict: Blocked request count, estimated bytes saved and the
+            number of blocked URLs whose size is not known yet.
+        """
+        savings = {"blocked_requests": 0, "bytes_saved": 0, "unknown_size": 0}
+        if self.profile.name == "none":
+            return savings
+        try:
+            entries = driver.get_log("performance")
+        except WebDriverException:
+            return savings
+
+        urls = {}
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            request_id = params.get("requestId")
+            if message["method"] == "Network.requestWillBeSent":
+                urls[request_id] = params["request"]["url"]
+            elif message["method"] == "Network.loadingFinished":
+                if request_id in urls:
+                    self.sizes[urls[request_id]] = params["encodedDataLength"]
+            elif message["method"] == "Network.loadingFailed":
+                if params.get("blockedReason") and request_id in urls:
+                    savings["blocked_requests"] += 1
+                    size = self.sizes.get(urls[request_id])
+                    if size is None:
+                        savings["unknown_size"] += 1
+                    else:
+                        savings["bytes_saved"] += size
+        return savings
+
+    def save(self):
+        """
+        Persist the known resource sizes for later estimates.
+        """
+        os.makedirs(os.path.dirname(self.history_path), exist_ok=True)
+        with open(self.history_path, "w", encoding="utf-8") as handle:
+            json.dump(self.sizes, handle)
+
+    def _load_sizes(self):
+        """
+        Read the known resource sizes, or return an empty dict.
+        """
+        try:
+            with open(self.history_path, encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
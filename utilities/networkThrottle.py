@@ -0,0 +1,169 @@
+"""
+Emulates slow networks with the Chrome DevTools Protocol, and checks flow budgets.
+
+Named profiles describe a link by its round-trip latency and throughput and
+are applied to every browser with Network.emulateNetworkConditions. Tests
+declare how long their flow may take on a profile with the budget marker:
+
+    @pytest.mark.budget(wan=4.0, slow_3g=12.0)
+
+The budget for the profile of the run is enforced; runs at full bandwidth
+ignore it. A test over budget fails with a breakdown of its steps.
+"""
+
+# First-party
+from utilities import config
+
+
+class ThrottleProfile:
+    """
+    A named network link: latency and throughput in each direction.
+    """
+
+    def __init__(self, name, latency=0, download_kbps=0, upload_kbps=0):
+        """
+        Initialize the ThrottleProfile instance.
+        :param name: str: Profile name used in config, markers and reports.
+        :param latency: float: Added round-trip latency in milliseconds.
+        :param download_kbps: float: Download throughput in kbit/s, 0 for unlimited.
+        :param upload_kbps: float: Upload throughput in kbit/s, 0 for unlimited.
+        """
+        self.name = name
+        self.latency = latency
+        self.download_kbps = download_kbps
+        self.upload_kbps = upload_kbps
+
+    @property
+    def active(self):
+        """
+        Whether this profile slows anything down.
+        """
+        return bool(self.latency or self.download_kbps or self.upload_kbps)
+
+    def conditions(self):
+        """
+        Return the parameters of Network.emulateNetworkConditions.
+        """
+        return {
+            "offline": False,
+            "latency": self.latency,
+            # Bytes per second; -1 disables throttling.
+            "downloadThroughput": self.download_kbps * 1000 / 8 or -1,
+            "uploadThroughput": self.upload_kbps * 1000 / 8 or -1,
+        }
+
+    def describe(self):
+        """
+        Return a short human-readable summary of the link.
+        """
+        if not self.active:
+            return "%s (unthrottled)" % self.name
+        return "%s (%d ms RTT, %g/%g kbit/s down/up)" % (
+            self.name,
+            self.latency,
+            self.download_kbps,
+            self.upload_kbps,
+        )
+
+
+THROTTLE_PROFILES = {
+    profile.name: profile
+    for profile in (
+        ThrottleProfile("none"),
+        # Branch office on a long-haul WAN link.
+        ThrottleProfile("wan", 300, 2000, 1000),
+        ThrottleProfile("dsl", 50, 8000, 1000),
+        # The Chrome DevTools presets.
+        ThrottleProfile("3g", 562.5, 1600, 750),
+        ThrottleProfile("slow_3g", 2000, 400, 400),
+    )
+}
+
+
+def get_throttle(name=None):
+    """
+    Return a throttle profile by name.
+    :param name: str: Profile name, defaults to config.NETWORK_THROTTLE.
+    """
+    name = name or config.NETWORK_THROTTLE
+    try:
+        return THROTTLE_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            "Unknown network throttle %r, expected one of %s"
+            % (name, ", ".join(sorted(THROTTLE_PROFILES)))
+        ) from None
+
+
+def apply_throttle(driver, profile=None):
+    """
+    Emulate a throttle profile in a browser.
+    :param driver: Chrome WebDriver instance.
+    :param profile: str: Profile name, see get_throttle().
+    """
+    profile = get_throttle(profile)
+    if profile.active:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", profile.conditions())
+
+
+def top_level_steps(spans):
+    """
+    Return the step spans not nested in another step, in the order they started.
+    :param spans: list: Spans recorded by utilities.instrumentation.Tracer.
+    """
+    steps = sorted(
+        (span for span in spans if span["category"] == "step"),
+        key=lambda span: (span["start"], -span["wall"]),
+    )
+    top, end = [], -1.0
+    for span in steps:
+        if span["start"] >= end:
+            top.append(span)
+            end = span["start"] + span["wall"]
+    return top
+
+
+def budget_breakdown(seconds, budget, profile, spans, page_loads=()):
+    """
+    Explain where the time of a flow over budget went.
+    :param seconds: float: Time the flow took, from setup to the end of the body.
+    :param budget: float: Allowed seconds.
+    :param profile: ThrottleProfile the test ran on.
+    :param spans: list: Tracer spans recorded during the flow.
+    :param page_loads: list: (page, {metric: ms}) of the documents it loaded.
+    :return: str: Multi-line report.
+    """
+    lines = [
+        "Flow took %.2fs, over its %.2fs budget on %s"
+        % (seconds, budget, profile.describe()),
+        "%-45s %9s %9s %9s" % ("step", "wall s", "wait s", "commands"),
+    ]
+    steps = top_level_steps(spans)
+    for span in steps:
+        lines.append(
+            "%-45s %9.2f %9.2f %9d"
+            % (span["name"], span["wall"], span["wait"], span["commands"])
+        )
+    lines.append(
+        "%-45s %9.2f"
+        % ("outside page objects", seconds - sum(span["wall"] for span in steps))
+    )
+    for page, metrics in page_loads:
+        lines.append(
+            "page %s: TTFB %.0f ms, DOM content loaded %.0f ms, load %.0f ms, "
+            "%d resources, %.1f KiB"
+            % (
+                page,
+                metrics.get("ttfb", 0),
+                metrics.get("dom_content_loaded", 0),
+                metrics.get("load", 0),
+                metrics.get("resource_count", 0),
+                (
+                    metrics.get("transfer_size", 0)
+                    + metrics.get("resource_transfer_size", 0)
+                )
+                / 1024,
+            )
+        )
+    return "\n".join(lines)
@@ -0,0 +1,279 @@
+"""
+Runs the test suite across several worker processes, each with its own browser.
+"""
+
+# Standard library
+import heapq
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ElementTree
+
+# First-party
+from utilities import config
+from utilities.durations import DurationStore
+from utilities.testImpact import ImpactIndex
+from utilities.standin.server import StandinServer
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds assumed for a test that has never been timed.
+DEFAULT_DURATION = 10.0
+
+
+def resolve_paths(pytest_args, cwd=None):
+    """
+    Make the test paths among pytest arguments absolute.
+
+    Collection and the workers run from the repository root, so a path given
+    relative to the caller's directory would otherwise point elsewhere.
+    :param pytest_args: list: Arguments as given on the command line.
+    :param cwd: str: Directory the paths are relative to, defaults to os.getcwd().
+    :return: list: The arguments with existing paths made absolute.
+    """
+    cwd = cwd or os.getcwd()
+    resolved = []
+    for argument in pytest_args:
+        # Paths come alone or as option values, e.g. --ignore=testCases/x.py,
+        # and may carry a node id suffix, e.g. test_login.py::TestLogin.
+        prefix, value = "", argument
+        if argument.startswith("-"):
+            option, equals, value = argument.partition("=")
+            if not equals:
+                resolved.append(argument)
+                continue
+            prefix = option + equals
+        path, separator, node = value.partition("::")
+        if path and os.path.exists(os.path.join(cwd, path)):
+            value = os.path.abspath(os.path.join(cwd, path)) + separator + node
+        resolved.append(prefix + value)
+    return resolved
+
+
+class ParallelRunner:
+    """
+    Shards tests over worker processes by longest-processing-time-first.
+    """
+
+    def __init__(self, workers, report_path=None):
+        """
+        Initialize the ParallelRunner instance.
+        :param workers: int: Number of worker processes to start.
+        :param report_path: str: Where the merged JUnit XML report is written.
+        """
+        self.workers = workers
+        self.run_dir = os.path.join(config.CACHE_DIR, "parallel")
+        self.report_path = report_path or os.path.join(self.run_dir, "report.xml")
+        self.durations = DurationStore()
+        self.worker_wall = {}
+
+    def run(self, pytest_args):
+        """
+        Collect, shard and run the tests, then merge the worker reports.
+        :param pytest_args: list: Arguments selecting the tests to run.
+        """
+        exit_code, node_ids = self.collect(resolve_paths(pytest_args))
+        if exit_code not in (0, 5):
+            print("Collection failed with exit code %d" % exit_code)
+            return exit_code
+        if not node_ids:
+            # 0 when test impact selection deselected everything, as in a serial run.
+            print("No tests collected")
+            return exit_code
+
+        shards = self.schedule(node_ids, self.durations.load())
+        os.makedirs(self.run_dir, exist_ok=True)
+
+        # One stand-in serves every worker; their own fixtures reuse it.
+        standin = StandinServer() if config.TARGET == "local" else None
+        if standin is not None:
+            standin.start()
+        try:
+            exit_codes, wall_time = self._run_shards(shards)
+        finally:
+            if standin is not None:
+                standin.stop()
+
+        indexes = [index for index, shard in enumerate(shards) if shard]
+        for index in indexes:
+            self.durations.update(
+                DurationStore(self._worker_file(index, "durations.json")).load()
+            )
+            ImpactIndex().update(
+                ImpactIndex(self._worker_file(index, "impact.json")).load()
+            )
+            with open(self._worker_file(index, "log.txt"), encoding="utf-8") as log:
+                print("=" * 30, "worker %d" % index, "=" * 30)
+                print(log.read())
+
+        suites = self.merge_reports(indexes)
+        self.print_summary(suites, wall_time)
+        return max(exit_codes.values())
+
+    def _run_shards(self, shards):
+        """
+        Start one worker per non-empty shard and wait for all of them.
+        :param shards: list: Test node ids per worker.
+        :return: tuple: (worker index to exit code, wall time in seconds).
+        """
+        started = time.monotonic()
+        processes = [
+            self._start_worker(index, shard)
+            for index, shard in enumerate(shards)
+            if shard
+        ]
+        exit_codes = {}
+        while len(exit_codes) < len(processes):
+            for index, process, log_handle in processes:
+                if index not in exit_codes and process.poll() is not None:
+                    exit_codes[index] = process.returncode
+                    log_handle.close()
+                    self.worker_wall[index] = time.monotonic() - started
+            time.sleep(0.1)
+        return exit_codes, time.monotonic() - started
+
+    def collect(self, pytest_args):
+        """
+        Return the node ids pytest would run for the given arguments.
+
+        pytest's output is printed when collection fails, e.g. on an import
+        error in a test module.
+        :param pytest_args: list: Arguments selecting the tests to run.
+        :return: tuple: (pytest exit code, list of node ids).
+        """
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "--collect-only", "-q", *pytest_args],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode not in (0, 5):
+            print(result.stdout, end="")
+            print(result.stderr, end="", file=sys.stderr)
+        node_ids = [line.strip() for line in result.stdout.splitlines() if "::" in line]
+        return result.returncode, node_ids
+
+    def schedule(self, node_ids, durations):
+        """
+        Assign each test to the least loaded worker, slowest tests first.
+        :param node_ids: list: Tests to distribute.
+        :param durations: dict: Historical seconds per test node id.
+        """
+        known = sorted(
+            durations[node_id] for node_id in node_ids if node_id in durations
+        )
+        fallback = known[len(known) // 2] if known else DEFAULT_DURATION
+
+        shards = [[] for _ in range(self.workers)]
+        loads = [(0.0, index) for index in range(self.workers)]
+        ordered = sorted(
+            node_ids, key=lambda node_id: durations.get(node_id, fallback), reverse=True
+        )
+        for node_id in ordered:
+            load, index = heapq.heappop(loads)
+            shards[index].append(node_id)
+            heapq.heappush(loads, (load + durations.get(node_id, fallback), index))
+        return shards
+
+    def merge_reports(self, indexes):
+        """
+        Combine the worker JUnit reports into one file and return per-worker stats.
+        :param indexes: list: Worker indexes that produced a report.
+        """
+        merged = ElementTree.Element("testsuites")
+        suites = []
+        for index in indexes:
+            try:
+                tree = ElementTree.parse(self._worker_file(index, "junit.xml"))
+            except (OSError, ElementTree.ParseError):
+                continue
+            for suite in tree.getroot().iter("testsuite"):
+                suite.set("name", "worker-%d" % index)
+                merged.append(suite)
+                suites.append((index, suite))
+
+        for attribute in ("tests", "failures", "errors", "skipped"):
+            merged.set(
+                attribute,
+                str(sum(int(suite.get(attribute, 0)) for _, suite in suites)),
+            )
+        ElementTree.ElementTree(merged).write(
+            self.report_path, encoding="utf-8", xml_declaration=True
+        )
+        return suites
+
+    def print_summary(self, suites, wall_time):
+        """
+        Print totals and how busy each worker was over the run.
+        :param suites: list: (worker index, testsuite element) pairs.
+        :param wall_time: float: Seconds from first worker start to last worker exit.
+        """
+        print("=" * 30, "parallel summary", "=" * 30)
+        for index, suite in suites:
+            busy = sum(float(case.get("time", 0)) for case in suite.iter("testcase"))
+            print(
+                "worker-%d: %s tests, busy %.1fs, finished after %.1fs, "
+                "utilisation %.0f%%"
+                % (
+                    index,
+                    suite.get("tests"),
+                    busy,
+                    self.worker_wall.get(index, wall_time),
+                    100 * busy / wall_time if wall_time else 0,
+                )
+            )
+        totals = {
+            attribute: sum(int(suite.get(attribute, 0)) for _, suite in suites)
+            for attribute in ("tests", "failures", "errors", "skipped")
+        }
+        print(
+            "%(tests)d tests, %(failures)d failures, %(errors)d errors, "
+            "%(skipped)d skipped" % totals,
+            "in %.1fs across %d workers" % (wall_time, len(suites)),
+        )
+        print("Merged report written to", self.report_path)
+
+    def _start_worker(self, index, shard):
+        """
+        Launch one pytest process for a shard of tests.
+        :param index: int: Worker number.
+        :param shard: list: Test node ids assigned to the worker.
+        """
+        env = dict(
+            os.environ,
+            ORANGEHRM_WORKER_ID=str(index),
+            # Page metrics of all workers are filed under one run.
+            ORANGEHRM_RUN_ID=config.RUN_ID,
+            ORANGEHRM_DURATIONS_FILE=self._worker_file(index, "durations.json"),
+            # Workers record into their own index and, finding it empty, run
+            # every test they are given; selection happened at collection.
+            ORANGEHRM_IMPACT_FILE=self._worker_file(index, "impact.json"),
+        )
+        for name in ("durations.json", "impact.json", "junit.xml"):
+            if os.path.exists(self._worker_file(index, name)):
+                os.remove(self._worker_file(index, name))
+        log_handle = open(self._worker_file(index, "log.txt"), "w", encoding="utf-8")
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "pytest",
+                "-v",
+                "--junitxml=%s" % self._worker_file(index, "junit.xml"),
+                *shard,
+            ],
+            cwd=ROOT_DIR,
+            env=env,
+            stdout=log_handle,
+            stderr=subprocess.STDOUT,
+        )
+        return index, process, log_handle
+
+    def _worker_file(self, index, name):
+        """
+        Return the path of a per-worker output file.
+        :param index: int: Worker number.
+        :param name: str: File name suffix.
+        """
+        return os.path.join(self.run_dir, "worker-%d-%s" % (index, name))
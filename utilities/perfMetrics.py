@@ -0,0 +1,315 @@
+"""
+Page-performance metrics of the application under test, kept across builds.
+
+A page listener reads Navigation Timing, resource timing and paint entries
+from window.performance for every document the page objects load, once the
+document has finished loading. The metrics are appended to a local SQLite
+store keyed by build, run and page, and the report compares builds:
+
+    ORANGEHRM_BUILD=5.7.1 python main.py --full-run
+    python -m utilities.perfMetrics --metric load --threshold 0.2
+"""
+
+# Standard library
+import argparse
+import os
+import sqlite3
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+
+# Third-party
+from selenium.common.exceptions import WebDriverException
+
+# First-party
+from utilities import config
+
+# Returns the metrics of the current document once it has loaded, and marks
+# it so every document is harvested only once.
+HARVEST_SCRIPT = """
+if (window.__orangehrmPerfHarvested || document.readyState !== 'complete') {
+    return null;
+}
+var navigation = performance.getEntriesByType('navigation')[0];
+if (!navigation || !navigation.loadEventEnd) { return null; }
+window.__orangehrmPerfHarvested = true;
+var metrics = {
+    ttfb: navigation.responseStart,
+    dns: navigation.domainLookupEnd - navigation.domainLookupStart,
+    connect: navigation.connectEnd - navigation.connectStart,
+    request: navigation.responseStart - navigation.requestStart,
+    response: navigation.responseEnd - navigation.responseStart,
+    dom_interactive: navigation.domInteractive,
+    dom_content_loaded: navigation.domContentLoadedEventEnd,
+    load: navigation.loadEventEnd,
+    transfer_size: navigation.transferSize
+};
+performance.getEntriesByType('paint').forEach(function (entry) {
+    metrics[entry.name.replace(/-/g, '_')] = entry.startTime;
+});
+var resources = performance.getEntriesByType('resource');
+metrics.resource_count = resources.length;
+metrics.resource_transfer_size = resources.reduce(function (total, entry) {
+    return total + entry.transferSize;
+}, 0);
+metrics.resource_slowest = resources.reduce(function (slowest, entry) {
+    return Math.max(slowest, entry.duration);
+}, 0);
+return {url: location.href, metrics: metrics};
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metrics (
+    id INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    build TEXT NOT NULL,
+    run TEXT NOT NULL,
+    page TEXT NOT NULL,
+    test TEXT,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS metrics_page ON metrics (metric, page, build);
+"""
+
+
+class MetricsStore:
+    """
+    Append-only SQLite store of page metrics.
+    """
+
+    def __init__(self, path=None):
+        """
+        Initialize the MetricsStore instance.
+        :param path: str: SQLite database file.
+        """
+        self.path = path or os.environ.get(
+            "ORANGEHRM_METRICS_DB", os.path.join(config.CACHE_DIR, "metrics.sqlite")
+        )
+
+    def connect(self):
+        """
+        Open the database, creating it and its schema on first use.
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Parallel workers append to the same file; wait for each other's locks.
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.executescript(SCHEMA)
+        return connection
+
+    def append(self, rows):
+        """
+        Add measurements in one transaction.
+        :param rows: list: (recorded_at, build, run, page, test, metric, value) tuples.
+        """
+        if not rows:
+            return
+        connection = self.connect()
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO metrics "
+                    "(recorded_at, build, run, page, test, metric, value) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        finally:
+            connection.close()
+
+    def builds(self):
+        """
+        Return the recorded builds, oldest first by their first measurement.
+        """
+        connection = self.connect()
+        try:
+            return [
+                build
+                for build, in connection.execute(
+                    "SELECT build FROM metrics GROUP BY build ORDER BY MIN(recorded_at)"
+                )
+            ]
+        finally:
+            connection.close()
+
+    def medians(self, metric):
+        """
+        Return the median of a metric per page and build.
+        :param metric: str: Metric name, e.g. "load".
+        :return: dict: Page to {build: (median, samples)}.
+        """
+        connection = self.connect()
+        try:
+            rows = connection.execute(
+                "SELECT page, build, value FROM metrics WHERE metric = ?", (metric,)
+            ).fetchall()
+        finally:
+            connection.close()
+        values = {}
+        for page, build, value in rows:
+            values.setdefault(page, {}).setdefault(build, []).append(value)
+        return {
+            page: {
+                build: (statistics.median(samples), len(samples))
+                for build, samples in builds.items()
+            }
+            for page, builds in values.items()
+        }
+
+    def regressions(self, metric, threshold, baseline, current):
+        """
+        Return the pages whose median got slower than the threshold allows.
+        :param metric: str: Metric name.
+        :param threshold: float: Allowed slowdown, 0.2 is 20%.
+        :param baseline: str: Build to compare against.
+        :param current: str: Build to check.
+        :return: list: (page, baseline median, current median) tuples.
+        """
+        slower = []
+        for page, builds in sorted(self.medians(metric).items()):
+            if baseline in builds and current in builds:
+                before, after = builds[baseline][0], builds[current][0]
+                if after > before * (1 + threshold):
+                    slower.append((page, before, after))
+        return slower
+
+
+class PerformanceHarvester:
+    """
+    Page listener collecting the metrics of every document the page objects load.
+    """
+
+    def __init__(self, store=None, build=None, run=None):
+        """
+        Initialize the PerformanceHarvester instance.
+        :param store: MetricsStore the rows are saved to.
+        :param build: str: Build of the application, defaults to config.BUILD.
+        :param run: str: Run id, defaults to config.RUN_ID.
+        """
+        self.store = store or MetricsStore()
+        self.build = build or config.BUILD
+        self.run = run or config.RUN_ID
+        self.test = None
+        self.rows = []
+
+    def harvest(self, driver):
+        """
+        Record the metrics of the browser's current document if it loaded and
+        was not recorded yet.
+        :param driver: WebDriver instance.
+        """
+        try:
+            result = driver.execute_script(HARVEST_SCRIPT)
+        except WebDriverException:
+            # The document is being replaced; the next event catches the new one.
+            return
+        if not result:
+            return
+        recorded_at = time.time()
+        page = urlsplit(result["url"]).path
+        self.rows += [
+            (recorded_at, self.build, self.run, page, self.test, metric, value)
+            for metric, value in sorted(result["metrics"].items())
+            if value is not None
+        ]
+
+    def on_leaving(self, page):
+        """
+        Harvest the document a page object is about to leave.
+        :param page: BasePage instance.
+        """
+        self.harvest(page.driver)
+
+    def on_loaded(self, page):
+        """
+        Harvest the document a page object just loaded.
+        :param page: BasePage instance.
+        """
+        self.harvest(page.driver)
+
+    def page_loads(self, test):
+        """
+        Return the documents a test loaded that were harvested so far.
+        :param test: str: Test node id.
+        :return: list: (page, {metric: value}) pairs in load order.
+        """
+        loads = {}
+        for recorded_at, _, _, page, row_test, metric, value in self.rows:
+            if row_test == test:
+                loads.setdefault((recorded_at, page), {})[metric] = value
+        return [(page, metrics) for (_, page), metrics in sorted(loads.items())]
+
+    def save(self):
+        """
+        Append the collected rows to the store.
+        """
+        self.store.append(self.rows)
+        self.rows = []
+
+
+def print_report(store, metric, threshold, baseline=None, current=None):
+    """
+    Print the median of a metric per page across builds and flag regressions.
+    :param store: MetricsStore to read.
+    :param metric: str: Metric name.
+    :param threshold: float: Allowed slowdown between builds, 0.2 is 20%.
+    :param baseline: str: Build to compare against, defaults to the second newest.
+    :param current: str: Build to check, defaults to the newest.
+    :return: list: Regressions, see MetricsStore.regressions().
+    """
+    builds = store.builds()
+    if not builds:
+        print("No metrics recorded in", store.path)
+        return []
+    current = current or builds[-1]
+    baseline = baseline or (builds[-2] if len(builds) > 1 else current)
+    medians = store.medians(metric)
+    print("%s (median ms, samples) per build, oldest first" % metric)
+    print("%-45s %s" % ("page", "  ".join("%18s" % build for build in builds)))
+    for page, per_build in sorted(medians.items()):
+        cells = [
+            "%12.1f (%3d)" % per_build[build] if build in per_build else "%18s" % "-"
+            for build in builds
+        ]
+        print("%-45s %s" % (page, "  ".join(cells)))
+    if baseline == current:
+        return []
+    slower = store.regressions(metric, threshold, baseline, current)
+    for page, before, after in slower:
+        print(
+            "REGRESSED %s: %.1f -> %.1f ms (+%.0f%%) from %s to %s"
+            % (page, before, after, 100 * (after / before - 1), baseline, current)
+        )
+    if not slower:
+        print(
+            "No page regressed more than %.0f%% from %s to %s"
+            % (100 * threshold, baseline, current)
+        )
+    return slower
+
+
+def main(argv=None):
+    """
+    Print the metric trends from the command line; exits with 1 on a regression.
+    :param argv: list: Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--metric", default="load")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown between builds, 0.2 is 20%%.",
+    )
+    parser.add_argument("--baseline", help="Build to compare against.")
+    parser.add_argument("--current", help="Build to check.")
+    parser.add_argument("--db", help="SQLite file, defaults to the cache.")
+    args = parser.parse_args(argv)
+    slower = print_report(
+        MetricsStore(args.db), args.metric, args.threshold, args.baseline, args.current
+    )
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Memory used by a browser and all of its helper processes, read from /proc.
+
+Chrome splits itself into a browser, GPU, network and one renderer process per
+site, all started below chromedriver. Their resident sets overlap through
+shared libraries, so the proportional set size (PSS) is summed where the
+kernel provides it and the resident set size (RSS) otherwise. On systems
+without /proc every function returns None.
+"""
+
+# Standard library
+import os
+
+PROC = "/proc"
+
+
+def process_memory(pid):
+    """
+    Return the memory of one process in bytes, or None if it is gone.
+    :param pid: int: Process id.
+    """
+    for file_name, field in (("smaps_rollup", "Pss:"), ("status", "VmRSS:")):
+        try:
+            with open(os.path.join(PROC, str(pid), file_name)) as handle:
+                for line in handle:
+                    if line.startswith(field):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            continue
+    return None
+
+
+def child_pids(pid):
+    """
+    Return the ids of the direct children of a process.
+    :param pid: int: Process id.
+    """
+    children = []
+    try:
+        tasks = os.listdir(os.path.join(PROC, str(pid), "task"))
+    except OSError:
+        return children
+    for task in tasks:
+        try:
+            with open(os.path.join(PROC, str(pid), "task", task, "children")) as handle:
+                children += [int(child) for child in handle.read().split()]
+        except OSError:
+            continue
+    return children
+
+
+def tree_memory(pid):
+    """
+    Return the summed memory of a process and all of its descendants in bytes.
+    :param pid: int: Id of the root process.
+    """
+    if not os.path.isdir(PROC):
+        return None
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        total += process_memory(current) or 0
+        pending += child_pids(current)
+    return total
+
+
+def driver_memory(driver):
+    """
+    Return the memory of a local Chrome session, chromedriver included, in bytes.
+    :param driver: Chrome WebDriver instance started by this process.
+    """
+    pid = _driver_pid(driver)
+    return None if pid is None else tree_memory(pid)
+
+
+def driver_memory_breakdown(driver):
+    """
+    Return the memory of chromedriver and of the browser below it, in bytes.
+    :param driver: Chrome WebDriver instance started by this process.
+    :return: dict: "chromedriver", "browser" and "total", or None off Linux.
+    """
+    pid = _driver_pid(driver)
+    total = None if pid is None else tree_memory(pid)
+    if total is None:
+        return None
+    chromedriver = process_memory(pid) or 0
+    return {
+        "chromedriver": chromedriver,
+        "browser": total - chromedriver,
+        "total": total,
+    }
+
+
+def _driver_pid(driver):
+    """
+    Return the chromedriver process id of a local session, or None.
+    :param driver: WebDriver instance.
+    """
+    try:
+        return driver.service.process.pid
+    except AttributeError:
+        return None
@@ -0,0 +1,200 @@
+"""
+Disk-backed cache of an authenticated OrangeHRM session.
+
+Tests that only need to be logged in restore the saved cookies and local
+storage into their browser instead of driving the login form. A new session
+is obtained over HTTP when possible and through the login form otherwise.
+"""
+
+# Standard library
+import json
+import os
+import time
+
+# Third-party
+from urllib3.exceptions import HTTPError
+
+# First-party
+from pageObjects.loginPage import Login
+from utilities import config
+from utilities.httpLogin import HttpLogin
+
+CAPTURE_STORAGE_SCRIPT = "return Object.assign({}, window.localStorage);"
+
+RESTORE_STORAGE_SCRIPT = """
+var origin = %s, items = %s;
+if (window.location.origin === origin) {
+    Object.keys(items).forEach(function (key) {
+        window.localStorage.setItem(key, items[key]);
+    });
+}
+"""
+
+
+class SessionCache:
+    """
+    Saves a logged-in session to disk and injects it into new browsers.
+    """
+
+    def __init__(
+        self, path=None, ttl=None, username=None, password=None, http_login=None
+    ):
+        """
+        Initialize the SessionCache instance.
+        :param path: str: File the session is stored in.
+        :param ttl: int: Seconds a saved session stays valid.
+        :param username: str: Username used when a fresh login is needed.
+        :param password: str: Password used when a fresh login is needed.
+        :param http_login: HttpLogin used for fresh logins, defaults to one for
+            config.BASE_URL unless config.HTTP_LOGIN is off.
+        """
+        self.path = path or os.path.join(config.CACHE_DIR, "session.json")
+        self.ttl = config.SESSION_TTL if ttl is None else ttl
+        self.username = username or config.ADMIN_USERNAME
+        self.password = password or config.ADMIN_PASSWORD
+        if http_login is None and config.HTTP_LOGIN:
+            http_login = HttpLogin()
+        self.http_login = http_login
+
+    def open(self, driver, path):
+        """
+        Open a page as a logged-in user, logging in only when no valid session exists.
+        :param driver: WebDriver instance to authenticate.
+        :param path: str: Application path to land on.
+        """
+        state = self.load()
+        if state is None:
+            state = self.refresh(driver)
+        self.restore(driver, state, path)
+
+        if self.is_expired(driver):
+            # The saved or HTTP session was not accepted; the login form is the
+            # path of last resort.
+            self.restore(driver, self.refresh(driver, use_http=False), path)
+            if self.is_expired(driver):
+                raise RuntimeError(
+                    "Login as %r did not produce a usable session" % self.username
+                )
+
+    def load(self):
+        """
+        Read the saved session, or return None when it is missing or too old.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                state = json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+        if state.get("base_url") != config.BASE_URL:
+            return None
+        if time.time() - state.get("saved_at", 0) > self.ttl:
+            return None
+        return state
+
+    def save(self, state):
+        """
+        Write a session to disk atomically so parallel workers never see a partial file.
+        :param state: dict: Session captured by capture().
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = "%s.%d.tmp" % (self.path, os.getpid())
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(state, handle)
+        os.replace(temp_path, self.path)
+
+    def capture(self, driver):
+        """
+        Collect the cookies and local storage of a logged-in browser.
+        :param driver: WebDriver instance that is currently logged in.
+        """
+        return {
+            "base_url": config.BASE_URL,
+            "saved_at": time.time(),
+            "cookies": driver.get_cookies(),
+            "local_storage": driver.execute_script(CAPTURE_STORAGE_SCRIPT),
+        }
+
+    def restore(self, driver, state, path):
+        """
+        Inject a saved session into a browser and open the given page with it.
+        :param driver: WebDriver instance to authenticate.
+        :param state: dict: Session returned by load().
+        :param path: str: Application path to land on.
+        """
+        script = RESTORE_STORAGE_SCRIPT % (
+            json.dumps(config.BASE_URL),
+            json.dumps(state["local_storage"]),
+        )
+
+        if not hasattr(driver, "execute_cdp_cmd"):
+            driver.get(config.url_for(path))
+            for cookie in state["cookies"]:
+                driver.add_cookie(cookie)
+            driver.execute_script(script)
+            driver.get(config.url_for(path))
+            return
+
+        for cookie in state["cookies"]:
+            cookie = dict(cookie, url=config.BASE_URL)
+            if "expiry" in cookie:
+                cookie["expires"] = cookie.pop("expiry")
+            driver.execute_cdp_cmd("Network.setCookie", cookie)
+        # Seed local storage before any page script runs, then forget the hook
+        # so it does not leak into later tests on a pooled browser.
+        identifier = driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": script}
+        )["identifier"]
+        driver.get(config.url_for(path))
+        driver.execute_cdp_cmd(
+            "Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier}
+        )
+
+    def refresh(self, driver, use_http=True):
+        """
+        Log in, over HTTP when possible and through the UI otherwise, and save
+        the session.
+        :param driver: WebDriver instance used for the UI login.
+        :param use_http: bool: Whether to try the HTTP login first.
+        """
+        state = None
+        if use_http and self.http_login is not None:
+            try:
+                state = {
+                    "base_url": config.BASE_URL,
+                    "saved_at": time.time(),
+                    "cookies": self.http_login.login(self.username, self.password),
+                    "local_storage": {},
+                }
+            except (RuntimeError, HTTPError):
+                state = None
+        if state is None:
+            state = self.login_through_ui(driver)
+        self.save(state)
+        return state
+
+    def login_through_ui(self, driver):
+        """
+        Log in through the login form and capture the resulting session.
+        :param driver: WebDriver instance to log in with.
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+
+        driver.get(config.url_for(config.LOGIN_PATH))
+        login_object = Login(driver)
+        login_object.enter_username(self.username)
+        login_object.enter_password(self.password)
+        login_object.click_login()
+        login_object.wait_for_url(config.DASHBOARD_PATH)
+        return self.capture(driver)
+
+    @staticmethod
+    def is_expired(driver):
+        """
+        Check whether the application bounced the browser back to the login page.
+        :param driver: WebDriver instance to inspect.
+        """
+        return config.LOGIN_PATH in driver.current_url
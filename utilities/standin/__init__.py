@@ -0,0 +1,3 @@
+"""
+Local stand-in for the OrangeHRM application, used for hermetic test runs.
+"""
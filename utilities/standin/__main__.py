@@ -0,0 +1,8 @@
+"""
+Run the stand-in server with ``python -m utilities.standin``.
+"""
+
+# First-party
+from utilities.standin.server import main
+
+main()
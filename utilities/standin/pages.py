@@ -0,0 +1,253 @@
+"""
+HTML served by the stand-in server.
+
+The markup mirrors the OrangeHRM 5 DOM closely enough for every XPath in
+pageObjects to resolve the same way it does against the real application.
+"""
+
+# Standard library
+import struct
+import zlib
+from string import Template
+
+STYLESHEET = """
+body { font-family: sans-serif; margin: 0; }
+.oxd-layout { display: flex; }
+.oxd-sidepanel { width: 220px; }
+.oxd-main-menu { list-style: none; padding: 0; }
+.oxd-main-menu-item { display: block; padding: 8px 16px; }
+.oxd-layout-container { flex: 1; }
+.oxd-topbar-header { display: flex; justify-content: space-between; padding: 8px; }
+.oxd-topbar-body-nav ul { display: flex; list-style: none; gap: 16px; }
+.oxd-userdropdown { list-style: none; cursor: pointer; }
+.oxd-dropdown-menu { list-style: none; border: 1px solid #ccc; padding: 4px; }
+.orangehrm-login-forgot-header { cursor: pointer; }
+.oxd-input-field-error-message { color: #eb0910; }
+"""
+
+
+def _png_chunk(kind, data):
+    """
+    Encode one PNG chunk.
+    :param kind: bytes: Four-letter chunk type.
+    :param data: bytes: Chunk payload.
+    """
+    return (
+        struct.pack(">I", len(data))
+        + kind
+        + data
+        + struct.pack(">I", zlib.crc32(kind + data))
+    )
+
+
+# A 1x1 transparent PNG, served for the branding images.
+LOGO_PNG = (
+    b"\x89PNG\r\n\x1a\n"
+    + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 6, 0, 0, 0))
+    + _png_chunk(b"IDAT", zlib.compress(b"\x00\x00\x00\x00\x00"))
+    + _png_chunk(b"IEND", b"")
+)
+
+PAGE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>OrangeHRM</title>
+<link rel="stylesheet" href="/web/dist/css/app.css">
+</head>
+<body>
+<div id="app">
+$body
+</div>
+$script
+</body>
+</html>
+""")
+
+LOGIN = Template("""<div class="orangehrm-login-layout">
+  <img class="orangehrm-login-branding" src="/web/images/ohrm_branding.png" alt="company-branding">
+  <div class="orangehrm-login-container">
+    <div class="orangehrm-login-slot-wrapper">
+      <auth-login :token="&quot;$token&quot;" :login-logo-src="&quot;/web/images/ohrm_logo.png&quot;"></auth-login>
+      <div class="orangehrm-login-form">
+        <h5 class="oxd-text oxd-text--h5 orangehrm-login-title">Login</h5>
+        <div class="orangehrm-login-error">$error</div>
+        <form class="oxd-form" method="post" action="/web/index.php/auth/validate" novalidate>
+          <input type="hidden" name="_token" value="$token">
+          <div class="oxd-input-group">
+            <label class="oxd-label">Username</label>
+            <input class="oxd-input oxd-input--active" name="username" placeholder="Username" autofocus>
+          </div>
+          <div class="oxd-input-group">
+            <label class="oxd-label">Password</label>
+            <input class="oxd-input oxd-input--active" type="password" name="password" placeholder="Password">
+          </div>
+          <div class="oxd-form-actions orangehrm-login-action">
+            <button type="submit" class="oxd-button oxd-button--main orangehrm-login-button">Login</button>
+          </div>
+          <div class="orangehrm-login-forgot">
+            <p class="oxd-text oxd-text--p orangehrm-login-forgot-header">Forgot your password? </p>
+          </div>
+        </form>
+      </div>
+    </div>
+  </div>
+</div>""")
+
+LOGIN_SCRIPT = """<script>
+(function () {
+  var form = document.querySelector('.oxd-form');
+  form.addEventListener('submit', function (event) {
+    var missing = false;
+    form.querySelectorAll('.oxd-input-group').forEach(function (group) {
+      var input = group.querySelector('input');
+      var message = group.querySelector('.oxd-input-field-error-message');
+      if (message) { message.remove(); }
+      if (input.value === '') {
+        missing = true;
+        message = document.createElement('span');
+        message.className = 'oxd-text oxd-text--span oxd-input-field-error-message oxd-input-group__message';
+        message.textContent = 'Required';
+        group.appendChild(message);
+      }
+    });
+    if (missing) { event.preventDefault(); }
+  });
+  document.querySelector('.orangehrm-login-forgot-header').addEventListener('click', function () {
+    window.location.href = '/web/index.php/auth/requestPasswordResetCode';
+  });
+})();
+</script>"""
+
+INVALID_CREDENTIALS = """<div class="oxd-alert oxd-alert--error" role="alert">
+  <div class="oxd-alert-content oxd-alert-content--error">
+    <p class="oxd-text oxd-text--p oxd-alert-content-text">Invalid credentials</p>
+  </div>
+</div>"""
+
+REQUEST_RESET = Template("""<div class="orangehrm-forgot-password-container">
+  <div class="orangehrm-forgot-password-wrapper">
+    <form class="oxd-form orangehrm-forgot-password-form" method="post" action="/web/index.php/auth/requestResetPassword">
+      <h6 class="oxd-text oxd-text--h6 orangehrm-forgot-password-title">Reset Password</h6>
+      <input type="hidden" name="_token" value="$token">
+      <div class="oxd-input-group">
+        <label class="oxd-label">Username</label>
+        <input class="oxd-input oxd-input--active" name="username" placeholder="Username">
+      </div>
+      <div class="orangehrm-forgot-password-button-container">
+        <button type="button" class="oxd-button oxd-button--ghost orangehrm-forgot-password-button orangehrm-forgot-password-button--cancel" onclick="window.location.href='/web/index.php/auth/login'">Cancel</button>
+        <button type="submit" class="oxd-button oxd-button--secondary orangehrm-forgot-password-button orangehrm-forgot-password-button--reset">Reset Password</button>
+      </div>
+    </form>
+  </div>
+</div>""")
+
+RESET_SENT = """<div class="orangehrm-forgot-password-container">
+  <div class="orangehrm-card-container">
+    <h6 class="oxd-text oxd-text--h6 orangehrm-forgot-password-title">Reset Password link sent successfully</h6>
+    <p class="oxd-text oxd-text--p">A reset password link has been sent to you via email.</p>
+  </div>
+</div>"""
+
+# Side panel entries as (href, label); the hrefs are what the AdminMainMenu XPaths match.
+MAIN_MENU = (
+    ("/web/index.php/admin/viewAdminModule", "Admin"),
+    ("/web/index.php/pim/viewPimModule", "PIM"),
+    ("/web/index.php/leave/viewLeaveModule", "Leave"),
+    ("/web/index.php/time/viewTimeModule", "Time"),
+    ("/web/index.php/recruitment/viewRecruitmentModule", "Recruitment"),
+    ("/web/index.php/pim/viewMyDetails", "My Info"),
+    ("/web/index.php/performance/viewPerformanceModule", "Performance"),
+    ("/web/index.php/dashboard/index", "Dashboard"),
+    ("/web/index.php/directory/viewDirectory", "Directory"),
+    ("/web/index.php/maintenance/viewMaintenanceModule", "Maintenance"),
+    ("/web/index.php/claim/viewClaimModule", "Claim"),
+    ("/web/index.php/buzz/viewBuzz", "Buzz"),
+)
+
+MENU_ITEM = Template(
+    """<li class="oxd-main-menu-item-wrapper"><a class="oxd-main-menu-item" href="$href"><span class="oxd-text oxd-text--span oxd-main-menu-item--name">$label</span></a></li>"""
+)
+
+LAYOUT = Template("""<div class="oxd-layout">
+  <div class="oxd-layout-navigation">
+    <aside class="oxd-sidepanel">
+      <nav class="oxd-navbar-nav" aria-label="Sidepanel">
+        <ul class="oxd-main-menu">
+$menu
+        </ul>
+      </nav>
+    </aside>
+  </div>
+  <div class="oxd-layout-container">
+    <header class="oxd-topbar">
+      <div class="oxd-topbar-header">
+        <div class="oxd-topbar-header-title"><h6 class="oxd-text oxd-text--h6 oxd-topbar-header-breadcrumb-module">$title</h6></div>
+        <ul>
+          <li class="oxd-userdropdown">
+            <span class="oxd-userdropdown-tab"><p class="oxd-userdropdown-name">$username</p></span>
+          </li>
+        </ul>
+      </div>
+$topbar
+    </header>
+    <div class="oxd-layout-context">
+$content
+    </div>
+  </div>
+</div>""")
+
+LAYOUT_SCRIPT = """<script>
+(function () {
+  var dropdown = document.querySelector('.oxd-userdropdown');
+  dropdown.addEventListener('click', function () {
+    if (dropdown.querySelector('.oxd-dropdown-menu')) { return; }
+    var menu = document.createElement('ul');
+    menu.className = 'oxd-dropdown-menu';
+    menu.setAttribute('role', 'menu');
+    menu.innerHTML = '<li><a href="#" class="oxd-userdropdown-link">About</a></li>'
+      + '<li><a href="/web/index.php/help/support" class="oxd-userdropdown-link">Support</a></li>'
+      + '<li><a href="/web/index.php/pim/updatePassword" class="oxd-userdropdown-link">Change Password</a></li>'
+      + '<li><a href="/web/index.php/auth/logout" class="oxd-userdropdown-link">Logout</a></li>';
+    dropdown.appendChild(menu);
+  });
+})();
+</script>"""
+
+DASHBOARD_CONTENT = """<div class="orangehrm-dashboard-grid">
+  <div class="orangehrm-dashboard-widget"><p class="oxd-text oxd-text--p">Time at Work</p></div>
+  <div class="orangehrm-dashboard-widget"><p class="oxd-text oxd-text--p">My Actions</p></div>
+  <div class="orangehrm-dashboard-widget"><p class="oxd-text oxd-text--p">Quick Launch</p></div>
+</div>"""
+
+ADMIN_TOPBAR = """      <nav class="oxd-topbar-body-nav" aria-label="Topbar Menu">
+        <ul>
+          <li class="oxd-topbar-body-nav-tab --parent --visited"><span class="oxd-topbar-body-nav-tab-item">User Management </span></li>
+          <li class="oxd-topbar-body-nav-tab --parent"><span class="oxd-topbar-body-nav-tab-item">Job </span></li>
+          <li class="oxd-topbar-body-nav-tab --parent"><span class="oxd-topbar-body-nav-tab-item">Organization </span></li>
+          <li class="oxd-topbar-body-nav-tab --parent"><span class="oxd-topbar-body-nav-tab-item">Qualifications </span></li>
+          <li class="oxd-topbar-body-nav-tab"><a class="oxd-topbar-body-nav-tab-item" href="/web/index.php/admin/nationality">Nationalities</a></li>
+          <li class="oxd-topbar-body-nav-tab"><a class="oxd-topbar-body-nav-tab-item" href="/web/index.php/admin/addTheme">Corporate Branding</a></li>
+          <li class="oxd-topbar-body-nav-tab --parent"><span class="oxd-topbar-body-nav-tab-item">Configuration </span></li>
+        </ul>
+      </nav>"""
+
+ADMIN_CONTENT = """<div class="orangehrm-paper-container">
+  <div class="orangehrm-container"><div class="oxd-table" role="table"><div class="oxd-table-body" role="rowgroup"></div></div></div>
+</div>"""
+
+# The Admin module renders its user list from the REST API, as the real SPA does.
+ADMIN_SCRIPT = """<script>
+fetch('/web/index.php/api/v2/admin/users?limit=50&offset=0')
+  .then(function (response) { return response.json(); })
+  .then(function (payload) {
+    var body = document.querySelector('.oxd-table-body');
+    payload.data.forEach(function (user) {
+      var row = document.createElement('div');
+      row.className = 'oxd-table-card';
+      row.setAttribute('role', 'row');
+      row.textContent = user.userName + ' - ' + user.userRole.displayName;
+      body.appendChild(row);
+    });
+  });
+</script>"""
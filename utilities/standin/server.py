@@ -0,0 +1,324 @@
+"""
+Local HTTP stand-in for the OrangeHRM pages exercised by the test suite.
+
+It serves the login page, the forgot-password flow, the dashboard and the
+Admin module with the DOM structure the page objects target, so the suite
+can run offline and without the latency of the public demo.
+"""
+
+# Standard library
+import argparse
+import json
+import secrets
+import threading
+import time
+import urllib.error
+import urllib.request
+from http import cookies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# First-party
+from utilities import config
+from utilities.standin import pages
+
+SESSION_COOKIE = "orangehrm"
+FLASH_COOKIE = "orangehrm_flash"
+USERS = {"Admin": "admin123"}
+
+# Protected module pages, as path to breadcrumb title.
+MODULE_TITLES = {
+    href: label for href, label in pages.MAIN_MENU if href != config.ADMIN_PATH
+}
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """
+    Routes requests to the stand-in OrangeHRM pages.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "OrangeHRMStandin/1.0"
+
+    def do_GET(self):
+        """
+        Serve a page, asset or API response.
+        """
+        path = urlsplit(self.path).path
+        if path in ("/", "/web/index.php", "/web/index.php/"):
+            self._redirect(config.LOGIN_PATH)
+        elif path == config.LOGIN_PATH:
+            self._login_page()
+        elif path == "/web/index.php/auth/requestPasswordResetCode":
+            self._html(pages.REQUEST_RESET.substitute(token=self.server.token))
+        elif path == "/web/index.php/auth/sendPasswordReset":
+            self._html(pages.RESET_SENT)
+        elif path == "/web/index.php/auth/logout":
+            self.server.sessions.pop(self._cookie(SESSION_COOKIE), None)
+            self._redirect(config.LOGIN_PATH, {SESSION_COOKIE: ""})
+        elif path == "/web/dist/css/app.css":
+            self._send(200, "text/css", pages.STYLESHEET.encode())
+        elif path.startswith("/web/images/"):
+            self._send(200, "image/png", pages.LOGO_PNG)
+        elif not self._session():
+            self._redirect(config.LOGIN_PATH)
+        elif path == config.ADMIN_PATH:
+            self._layout(
+                "Admin",
+                pages.ADMIN_CONTENT,
+                pages.ADMIN_TOPBAR,
+                pages.ADMIN_SCRIPT,
+            )
+        elif path == "/web/index.php/api/v2/admin/users":
+            self._send(200, "application/json", json.dumps(self._users()).encode())
+        elif path in MODULE_TITLES:
+            content = pages.DASHBOARD_CONTENT if "dashboard" in path else ""
+            self._layout(MODULE_TITLES[path], content)
+        else:
+            self._send(404, "text/plain", b"Not Found")
+
+    def do_POST(self):
+        """
+        Handle the login and password reset forms.
+        """
+        path = urlsplit(self.path).path
+        length = int(self.headers.get("Content-Length", 0))
+        form = {
+            key: values[0]
+            for key, values in parse_qs(
+                self.rfile.read(length).decode(), keep_blank_values=True
+            ).items()
+        }
+        if form.get("_token") != self.server.token:
+            self._send(403, "text/plain", b"CSRF token validation failed")
+        elif path == "/web/index.php/auth/validate":
+            username = form.get("username", "")
+            if username in USERS and USERS[username] == form.get("password"):
+                session_id = secrets.token_hex(16)
+                self.server.sessions[session_id] = (username, time.time())
+                self._redirect(config.DASHBOARD_PATH, {SESSION_COOKIE: session_id})
+            else:
+                self._redirect(config.LOGIN_PATH, {FLASH_COOKIE: "invalid"})
+        elif path == "/web/index.php/auth/requestResetPassword":
+            self._redirect("/web/index.php/auth/sendPasswordReset")
+        else:
+            self._send(404, "text/plain", b"Not Found")
+
+    def log_message(self, format, *args):
+        """
+        Keep request logging out of the test output unless asked for.
+        """
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _login_page(self):
+        """
+        Render the login page, showing a pending login error once.
+        """
+        error = pages.INVALID_CREDENTIALS if self._cookie(FLASH_COOKIE) else ""
+        body = pages.LOGIN.substitute(token=self.server.token, error=error)
+        self._html(body, pages.LOGIN_SCRIPT, {FLASH_COOKIE: ""} if error else None)
+
+    def _layout(self, title, content, topbar="", script=""):
+        """
+        Render a page inside the logged-in layout.
+        :param title: str: Module name shown in the top bar.
+        :param content: str: Page body.
+        :param topbar: str: Module navigation shown below the header.
+        :param script: str: Extra page script.
+        """
+        menu = "\n".join(
+            pages.MENU_ITEM.substitute(href=href, label=label)
+            for href, label in pages.MAIN_MENU
+        )
+        body = pages.LAYOUT.substitute(
+            menu=menu,
+            title=title,
+            username=self._session()[0],
+            topbar=topbar,
+            content=content,
+        )
+        self._html(body, pages.LAYOUT_SCRIPT + script)
+
+    def _users(self):
+        """
+        Return the system user list in the shape of the OrangeHRM REST API.
+        """
+        data = [
+            {"id": index + 1, "userName": name, "userRole": {"displayName": "Admin"}}
+            for index, name in enumerate(USERS)
+        ]
+        return {"data": data, "meta": {"total": len(data)}, "rels": []}
+
+    def _session(self):
+        """
+        Return (username, created) for the request's session, or None.
+        """
+        session_id = self._cookie(SESSION_COOKIE)
+        session = self.server.sessions.get(session_id)
+        if session is None:
+            return None
+        if (
+            self.server.session_ttl
+            and time.time() - session[1] > self.server.session_ttl
+        ):
+            self.server.sessions.pop(session_id, None)
+            return None
+        return session
+
+    def _cookie(self, name):
+        """
+        Return the value of a request cookie, or None.
+        :param name: str: Cookie name.
+        """
+        jar = cookies.SimpleCookie(self.headers.get("Cookie", ""))
+        return jar[name].value if name in jar and jar[name].value else None
+
+    def _html(self, body, script="", set_cookies=None):
+        """
+        Send a full HTML page.
+        :param body: str: Markup placed inside the application root.
+        :param script: str: Script tags appended to the body.
+        :param set_cookies: dict: Cookies to set; an empty value deletes the cookie.
+        """
+        document = pages.PAGE.substitute(body=body, script=script)
+        self._send(200, "text/html; charset=utf-8", document.encode(), set_cookies)
+
+    def _redirect(self, location, set_cookies=None):
+        """
+        Send a 302 redirect.
+        :param location: str: Target path.
+        :param set_cookies: dict: Cookies to set; an empty value deletes the cookie.
+        """
+        self._send(302, "text/plain", b"", set_cookies, {"Location": location})
+
+    def _send(self, status, content_type, payload, set_cookies=None, headers=None):
+        """
+        Write a complete response, after the configured artificial latency.
+        :param status: int: HTTP status code.
+        :param content_type: str: Value of the Content-Type header.
+        :param payload: bytes: Response body.
+        :param set_cookies: dict: Cookies to set; an empty value deletes the cookie.
+        :param headers: dict: Extra response headers.
+        """
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        for name, value in (set_cookies or {}).items():
+            expiry = "" if value else "; Max-Age=0"
+            self.send_header(
+                "Set-Cookie", "%s=%s; Path=/; HttpOnly%s" % (name, value, expiry)
+            )
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class StandinServer:
+    """
+    Runs the stand-in on a background thread.
+
+    When the port is already served by another stand-in, for example one
+    started by the parallel runner for all of its workers, start() reuses it.
+    """
+
+    def __init__(self, host=None, port=None, latency=0.0, session_ttl=0, verbose=False):
+        """
+        Initialize the StandinServer instance.
+        :param host: str: Interface to bind, defaults to config.STANDIN_HOST.
+        :param port: int: Port to bind, defaults to config.STANDIN_PORT; 0 picks a
+            free one.
+        :param latency: float: Seconds added before every response.
+        :param session_ttl: int: Seconds a login session lasts, 0 for no expiry.
+        :param verbose: bool: Log every request to stderr.
+        """
+        self.host = config.STANDIN_HOST if host is None else host
+        self.port = config.STANDIN_PORT if port is None else port
+        self.latency = latency
+        self.session_ttl = session_ttl
+        self.verbose = verbose
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """
+        Base URL of the running stand-in.
+        """
+        return "http://%s:%d" % (self.host, self.port)
+
+    def start(self):
+        """
+        Start serving, or reuse a stand-in already listening on the port.
+        :return: bool: True if this instance owns the server.
+        """
+        try:
+            self._httpd = ThreadingHTTPServer((self.host, self.port), StandinHandler)
+        except OSError:
+            if self.is_running():
+                return False
+            raise
+
+        self._httpd.daemon_threads = True
+        self._httpd.token = secrets.token_urlsafe(24)
+        self._httpd.sessions = {}
+        self._httpd.latency = self.latency
+        self._httpd.session_ttl = self.session_ttl
+        self._httpd.verbose = self.verbose
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="orangehrm-standin", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """
+        Stop the server if this instance started it.
+        """
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def is_running(self):
+        """
+        Check whether a stand-in answers on the configured address.
+        """
+        try:
+            with urllib.request.urlopen(self.url + config.LOGIN_PATH, timeout=2):
+                return True
+        except (OSError, urllib.error.URLError):
+            return False
+
+
+def main(argv=None):
+    """
+    Serve the stand-in in the foreground until interrupted.
+    :param argv: list: Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Run the OrangeHRM stand-in server.")
+    parser.add_argument("--host", default=config.STANDIN_HOST)
+    parser.add_argument("--port", type=int, default=config.STANDIN_PORT)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to every response."
+    )
+    parser.add_argument(
+        "--session-ttl", type=int, default=0, help="Seconds a login session lasts."
+    )
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    server = StandinServer(
+        args.host, args.port, args.latency, args.session_ttl, args.verbose
+    )
+    server.start()
+    print("OrangeHRM stand-in serving on", server.url)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,324 @@
+"""
+Runs several flows in one browser process, each in its own isolated tab.
+
+Used by benchmarks/tabs.py, whose threads run flows concurrently. The pytest
+suite does not use it: pytest runs one test at a time per process, so a test
+session would only keep idle tabs open ahead of the next test.
+
+Every tab lives in a separate browser context created through the DevTools
+protocol, so cookies, local storage and cache are never shared between tabs.
+A flow gets a tab driver: a copy of the browser's WebDriver whose commands
+switch to the flow's window handle first. The switch and the command hold one
+lock, so the browser runs with the "none" page load strategy and no command
+blocks on a page load: a navigation, or a click that starts one, returns at
+once, and the tab waits for the new document outside the lock. Waits poll
+outside it too, so flows overlap while the application loads and answers.
+"""
+
+# Standard library
+import copy
+import itertools
+import json
+import queue
+import threading
+import time
+
+# Third-party
+from selenium.common.exceptions import (
+    JavascriptException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.switch_to import SwitchTo
+
+# First-party
+from utilities import config
+from utilities.browserLauncher import BrowserLauncher
+from utilities.networkFilter import NetworkFilter
+from utilities.networkThrottle import apply_throttle
+from utilities.processMemory import driver_memory
+from utilities.waits import install_request_tracker
+
+# Commands that load a new document in the tab.
+NAVIGATION_COMMANDS = (
+    Command.GET,
+    Command.REFRESH,
+    Command.GO_BACK,
+    Command.GO_FORWARD,
+)
+
+# Commands that may start a navigation, which then has to be waited for.
+CLICK_COMMANDS = (Command.CLICK_ELEMENT,)
+
+# Marks the document a command may leave, so its replacement can be recognised,
+# and notes when the document starts unloading. The mark is unique per
+# command: a page restored from the back-forward cache carries an older one.
+MARK_DOCUMENT_SCRIPT = """
+window.__orangehrmTabLeaving = arguments[0];
+window.__orangehrmTabUnloading = false;
+if (!window.__orangehrmTabUnloadListener) {
+    window.__orangehrmTabUnloadListener = true;
+    window.addEventListener('beforeunload', function () {
+        window.__orangehrmTabUnloading = true;
+    });
+}
+"""
+
+# Where the navigation started by a command stands: "loaded" once a document
+# other than the marked one reached a ready state, "loading" before that,
+# "leaving" while the marked document unloads and "stayed" if it does not.
+DOCUMENT_STATE_SCRIPT = """
+if (window.__orangehrmTabLeaving !== arguments[1]) {
+    return arguments[0].indexOf(document.readyState) >= 0 ? 'loaded' : 'loading';
+}
+return window.__orangehrmTabUnloading ? 'leaving' : 'stayed';
+"""
+
+# document.readyState values each page load strategy waits for.
+READY_STATES = {
+    "normal": ["complete"],
+    "eager": ["interactive", "complete"],
+    "none": [],
+}
+
+
+class TabPool:
+    """
+    Hands out isolated tabs of a single browser with the DriverPool interface.
+
+    A tab is closed together with its browser context when the flow checks it
+    back in and a fresh one takes its place, so no state survives a flow.
+    Quitting a tab driver closes only its tab and context, and its performance
+    log only holds the entries of its own tab.
+    """
+
+    def __init__(self, tabs, factory=None, network_filter=None, profile=None):
+        """
+        Initialize the TabPool instance.
+        :param tabs: int: Number of tabs, i.e. flows that can run at once.
+        :param factory: Callable returning the WebDriver hosting the tabs,
+            defaults to a BrowserLauncher for the launch profile. The browser
+            it returns waits for page loads itself.
+        :param network_filter: NetworkFilter applied to every tab.
+        :param profile: str: Launch profile, defaults to config.BROWSER_PROFILE.
+        """
+        self.launcher = None
+        # Document states the tabs wait for after a navigation; empty when the
+        # browser waits for page loads itself.
+        self.ready_states = []
+        if factory is None:
+            self.launcher = BrowserLauncher(profile, warm=0, page_load_strategy="none")
+            factory = self.launcher.acquire
+            self.ready_states = READY_STATES[self.launcher.profile.page_load_strategy]
+        self.tabs = tabs
+        self.network_filter = network_filter or NetworkFilter()
+        self.browser = factory()
+        self._execute = self.browser.execute
+        # The browser's first window stays open as a place to park chromedriver
+        # while tabs are closed.
+        self._home = self._command(Command.W3C_GET_CURRENT_WINDOW_HANDLE)
+        self._current = self._home
+        self._lock = threading.RLock()
+        self._contexts = {}
+        # Performance log entries drained from the browser, per tab target.
+        self._logs = {}
+        self._marks = itertools.count(1)
+        self._free = queue.Queue()
+        for _ in range(self.tabs):
+            self._free.put(self._open_tab())
+
+    def checkout(self):
+        """
+        Return a free tab driver, waiting for a flow to finish if all are busy.
+        """
+        return self._free.get()
+
+    def checkin(self, tab):
+        """
+        Close a tab and its browser context and open a fresh one in its place.
+        :param tab: Tab driver previously returned by checkout().
+        """
+        self._close_tab(tab)
+        self._free.put(self._open_tab())
+
+    def shutdown(self):
+        """
+        Quit the browser hosting the tabs.
+        """
+        try:
+            self.browser.quit()
+        except WebDriverException:
+            pass
+        if self.launcher is not None:
+            self.launcher.shutdown()
+        self.network_filter.save()
+
+    def memory(self):
+        """
+        Return the memory of the whole browser in bytes, or None off Linux.
+        """
+        return driver_memory(self.browser)
+
+    def _open_tab(self):
+        """
+        Create a browser context with one tab and return a driver bound to it.
+        """
+        with self._lock:
+            context = self._cdp("Target.createBrowserContext", {})["browserContextId"]
+            before = set(self._command(Command.W3C_GET_WINDOW_HANDLES))
+            target = self._cdp(
+                "Target.createTarget",
+                {"url": "about:blank", "browserContextId": context},
+            )["targetId"]
+            handles = set(self._command(Command.W3C_GET_WINDOW_HANDLES))
+            # chromedriver uses target ids as window handles; the set difference
+            # covers versions that do not.
+            handle = target if target in handles else (handles - before).pop()
+            self._contexts[handle] = context
+            self._logs[target] = []
+
+        tab = copy.copy(self.browser)
+        tab.execute = lambda command, params=None: self._tab_execute(
+            handle, command, params
+        )
+        tab._switch_to = SwitchTo(tab)
+        # The copy shares the browser's session; quitting it would end every tab.
+        tab.quit = lambda: self._close_tab(tab)
+        # The browser's log mixes every tab; hand each tab its own entries.
+        tab.get_log = lambda log_type: self._tab_log(target, log_type)
+        tab.tab_handle = handle
+        tab.tab_target = target
+        # An in-browser wait would hold the lock and stall every other tab.
+        tab.observer_waits = False
+        install_request_tracker(tab)
+        self.network_filter.apply(tab)
+        apply_throttle(tab)
+        return tab
+
+    def _close_tab(self, tab):
+        """
+        Close a tab and dispose of its browser context, unless that happened already.
+        :param tab: Tab driver returned by _open_tab().
+        """
+        with self._lock:
+            context = self._contexts.pop(tab.tab_handle, None)
+            if context is None:
+                return
+            self._logs.pop(tab.tab_target, None)
+            if self._current == tab.tab_handle:
+                self._execute(Command.SWITCH_TO_WINDOW, {"handle": self._home})
+                self._current = self._home
+            try:
+                self._cdp("Target.closeTarget", {"targetId": tab.tab_handle})
+            except WebDriverException:
+                pass
+            self._cdp("Target.disposeBrowserContext", {"browserContextId": context})
+
+    def _tab_execute(self, handle, command, params):
+        """
+        Run a WebDriver command in the given tab, switching to it first.
+
+        Navigations, and clicks that start one, return once the browser started
+        them; the wait for the new document happens outside the lock.
+        :param handle: str: Window handle of the tab.
+        :param command: str: WebDriver command name.
+        :param params: dict: Command parameters.
+        """
+        mark = None
+        if self.ready_states and command in NAVIGATION_COMMANDS + CLICK_COMMANDS:
+            mark = next(self._marks)
+        with self._lock:
+            self._switch(handle)
+            if mark is not None:
+                self._execute(
+                    Command.W3C_EXECUTE_SCRIPT,
+                    {"script": MARK_DOCUMENT_SCRIPT, "args": [mark]},
+                )
+            response = self._execute(command, params)
+        if mark is not None:
+            self._wait_for_document(handle, mark, may_stay=command in CLICK_COMMANDS)
+        return response
+
+    def _wait_for_document(self, handle, mark, may_stay=False, timeout=None):
+        """
+        Wait for a navigation in a tab to load its new document, taking the
+        lock only for each check.
+        :param handle: str: Window handle of the tab.
+        :param mark: int: Mark set on the document the command may leave.
+        :param may_stay: bool: Whether the command may not navigate at all, as a
+            click; the document staying over two checks then ends the wait.
+        :param timeout: float: Seconds to wait, defaults to config.LONG_TIMEOUT.
+        """
+        deadline = time.monotonic() + (
+            config.LONG_TIMEOUT if timeout is None else timeout
+        )
+        checks = 0
+        while True:
+            try:
+                with self._lock:
+                    self._switch(handle)
+                    state = self._execute(
+                        Command.W3C_EXECUTE_SCRIPT,
+                        {
+                            "script": DOCUMENT_STATE_SCRIPT,
+                            "args": [self.ready_states, mark],
+                        },
+                    )["value"]
+            except JavascriptException:
+                # The old document was torn down while the script ran.
+                state = "leaving"
+            checks += 1
+            # A click's form submission may only start unloading a task later.
+            if state == "loaded" or (state == "stayed" and may_stay and checks > 1):
+                return
+            if time.monotonic() > deadline:
+                raise TimeoutException("Tab %s did not finish loading" % handle)
+            time.sleep(config.WAIT_INITIAL_POLL)
+
+    def _tab_log(self, target, log_type):
+        """
+        Return a tab's share of a browser log.
+
+        Performance log entries name the target they came from, so the whole
+        log is drained and every tab's entries are kept until it asks.
+        :param target: str: DevTools target id of the tab.
+        :param log_type: str: Log name, e.g. "performance".
+        """
+        if log_type != "performance":
+            with self._lock:
+                return self.browser.get_log(log_type)
+        with self._lock:
+            for entry in self.browser.get_log(log_type):
+                webview = json.loads(entry["message"]).get("webview")
+                if webview in self._logs:
+                    self._logs[webview].append(entry)
+            entries = self._logs.get(target, [])
+            if target in self._logs:
+                self._logs[target] = []
+        return entries
+
+    def _switch(self, handle):
+        """
+        Make a tab the target of the next command; call with the lock held.
+        :param handle: str: Window handle of the tab.
+        """
+        if self._current != handle:
+            self._execute(Command.SWITCH_TO_WINDOW, {"handle": handle})
+            self._current = handle
+
+    def _command(self, command, params=None):
+        """
+        Run a WebDriver command on the browser itself and return its value.
+        :param command: str: WebDriver command name.
+        :param params: dict: Command parameters.
+        """
+        return self._execute(command, params)["value"]
+
+    def _cdp(self, method, params):
+        """
+        Run a browser-wide DevTools command.
+        :param method: str: DevTools method, e.g. "Target.createTarget".
+        :param params: dict: Method parameters.
+        """
+        return self._command("executeCdpCommand", {"cmd": method, "params": params})
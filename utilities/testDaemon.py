@@ -0,0 +1,519 @@
+"""
+A long-lived test daemon that keeps the interpreter, the imported tests and a
+warm browser between runs.
+
+    python main.py --daemon                                  # start it
+    python -m utilities.testDaemon run testCases/test_admin.py -k header
+    python -m utilities.testDaemon stop
+
+The daemon runs pytest in-process for every request and streams its output
+back to the client. Selenium, pytest and the test modules stay imported, and
+the browser pool outlives the runs: a browser is only replaced by the pool's
+own health, use and memory checks. One browser stays logged in between runs
+for the tests that use admin_session, and is replaced only when unhealthy.
+Before a run, every project module whose file changed is dropped from
+sys.modules together with the project modules built on it, so pytest imports
+the edited page objects and tests afresh.
+
+The client only needs the standard library, so it starts in milliseconds.
+"""
+
+# Standard library
+import ast
+import contextlib
+import hmac
+import io
+import json
+import os
+import secrets
+import socket
+import socketserver
+import sys
+import time
+import types
+
+# First-party
+from utilities import config
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_PATH = os.path.join(config.CACHE_DIR, "daemon.json")
+# Last line of a run's output, followed by the pytest exit code.
+EXIT_MARKER = "\0orangehrm-exit "
+NO_DAEMON_MESSAGE = "No test daemon is running; start one with main.py --daemon"
+# Modules whose state must survive a reload of the rest of the project.
+PERSISTENT_MODULES = ("utilities.config", "utilities.testDaemon")
+
+# Browser pool shared by every run; testCases/conftest.py uses it when set.
+persistent_pool = None
+# Logged-in browser handed to the tests that use admin_session.
+session_browser = None
+
+
+def project_modules():
+    """
+    Return the imported modules that belong to this repository, by name.
+    """
+    modules = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if (
+            path
+            and name not in PERSISTENT_MODULES
+            and name != "__main__"
+            and os.path.abspath(path).startswith(ROOT_DIR + os.sep)
+        ):
+            modules[name] = module
+    return modules
+
+
+def _imported_modules(module):
+    """
+    Return the names of the modules a module's source imports from.
+    :param module: Imported module.
+    :return: set: Absolute module names, empty if the source cannot be read.
+    """
+    try:
+        with open(module.__file__, encoding="utf-8") as handle:
+            tree = ast.parse(handle.read())
+    except (OSError, SyntaxError, TypeError, ValueError):
+        return set()
+    package = module.__name__ if hasattr(module, "__path__") else module.__package__
+    imported = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parts = (package or "").split(".")
+                parent = ".".join(parts[: len(parts) - node.level + 1])
+                base = ".".join(part for part in (parent, base) if part)
+            imported.add(base)
+            # "from package import module" imports a module, not a name.
+            imported.update(base + "." + alias.name for alias in node.names)
+    return imported
+
+
+def _uses(module, names):
+    """
+    Check whether a module imports any of the named modules, or holds a
+    reference to any of them or to something defined in them.
+    :param module: Module to inspect.
+    :param names: set: Module names.
+    """
+    # Constants taken with "from module import NAME" carry no reference back.
+    own = module.__name__ + "."
+    if any(not name.startswith(own) for name in _imported_modules(module) & names):
+        return True
+    for value in vars(module).values():
+        if isinstance(value, types.ModuleType):
+            owner = value.__name__
+            # A package's own submodules are not what it is built on.
+            if owner.startswith(module.__name__ + "."):
+                continue
+        else:
+            owner = getattr(value, "__module__", None)
+        if owner in names:
+            return True
+    return False
+
+
+class ModuleReloader:
+    """
+    Drops changed project modules, and those importing them, before a run.
+    """
+
+    def __init__(self):
+        """
+        Initialize the ModuleReloader instance.
+        """
+        self.mtimes = {}
+        self.snapshot()
+
+    def snapshot(self):
+        """
+        Remember the modification time of every imported project module.
+        """
+        self.mtimes = {
+            name: self._mtime(module) for name, module in project_modules().items()
+        }
+
+    def reload_changed(self):
+        """
+        Remove changed modules and their dependents from sys.modules.
+        :return: list: Names of the removed modules.
+        """
+        modules = project_modules()
+        stale = {
+            name
+            for name, module in modules.items()
+            if self._mtime(module) != self.mtimes.get(name)
+        }
+        # Follow the imports until no other module refers to a stale one.
+        grew = bool(stale)
+        while grew:
+            dependents = {
+                name
+                for name, module in modules.items()
+                if name not in stale and _uses(module, stale)
+            }
+            stale |= dependents
+            grew = bool(dependents)
+        for name in stale:
+            sys.modules.pop(name, None)
+        return sorted(stale)
+
+    @staticmethod
+    def _mtime(module):
+        """
+        Return the modification time of a module's source file.
+        :param module: Imported module.
+        """
+        try:
+            return os.path.getmtime(module.__file__)
+        except (OSError, TypeError):
+            return None
+
+
+class _StreamWriter(io.TextIOBase):
+    """
+    Text stream writing straight to the client socket.
+    """
+
+    def __init__(self, handle):
+        """
+        Initialize the _StreamWriter instance.
+        :param handle: Binary file object of the client connection.
+        """
+        self.handle = handle
+
+    def writable(self):
+        """
+        The stream accepts writes.
+        """
+        return True
+
+    def isatty(self):
+        """
+        Not a terminal, so pytest sends plain text without colour codes.
+        """
+        return False
+
+    def write(self, text):
+        """
+        Send text to the client immediately.
+        :param text: str: Output of the run.
+        """
+        try:
+            self.handle.write(text.encode("utf-8", "replace"))
+            self.handle.flush()
+        except OSError:
+            # The client went away; the run still finishes.
+            pass
+        return len(text)
+
+
+class _RunHandler(socketserver.StreamRequestHandler):
+    """
+    Serves one client request: a run, a status query or a stop.
+    """
+
+    def handle(self):
+        """
+        Read the JSON request line and answer it.
+        """
+        try:
+            request = json.loads(self.rfile.readline() or b"{}")
+        except ValueError:
+            request = {}
+        # Only a client that can read the daemon's state file knows the token.
+        token = str(request.get("token", "")).encode("utf-8")
+        if not hmac.compare_digest(token, self.server.daemon.token.encode("utf-8")):
+            stream = _StreamWriter(self.wfile)
+            stream.write("Rejected: missing or wrong daemon token\n")
+            stream.write("%s%d\n" % (EXIT_MARKER, 2))
+            return
+        command = request.get("command")
+        if command == "stop":
+            self.wfile.write(b"Stopping the test daemon\n")
+            self.server.stopping = True
+            return
+        if command == "status":
+            self.wfile.write(
+                (json.dumps(self.server.daemon.status()) + "\n").encode("utf-8")
+            )
+            return
+        stream = _StreamWriter(self.wfile)
+        exit_code = self.server.daemon.run(request.get("args", []), stream)
+        stream.write("%s%d\n" % (EXIT_MARKER, exit_code))
+
+
+class _DaemonServer(socketserver.TCPServer):
+    """
+    TCP server that can rebind the port of a daemon that just stopped.
+    """
+
+    allow_reuse_address = True
+
+
+class SessionBrowser:
+    """
+    A browser from the shared pool that stays logged in between runs.
+
+    It never goes back through the pool's reset, so its cookies and storage
+    survive. It is only replaced when it stops answering commands.
+    """
+
+    def __init__(self, pool, session_cache=None):
+        """
+        Initialize the SessionBrowser instance.
+        :param pool: DriverPool the browser is checked out from.
+        :param session_cache: SessionCache used to log in, defaults to a new one.
+        """
+        # Imported here so the client side of this module stays light.
+        from utilities.sessionCache import SessionCache
+
+        self.pool = pool
+        self.session_cache = session_cache or SessionCache()
+        self.driver = None
+
+    def checkout(self):
+        """
+        Return the logged-in browser, replacing it first if it is unhealthy.
+        """
+        from utilities.driverPool import DriverPool
+
+        if self.driver is not None and not DriverPool.is_healthy(self.driver):
+            self._release()
+        if self.driver is None:
+            self.driver = self.pool.checkout()
+            self.session_cache.open(self.driver, config.ADMIN_PATH)
+        return self.driver
+
+    def open(self, path):
+        """
+        Open a page in the logged-in browser, logging in again if the session ended.
+        :param path: str: Application path to land on.
+        """
+        self.driver.get(config.url_for(path))
+        if self.session_cache.is_expired(self.driver):
+            self.session_cache.open(self.driver, path)
+
+    def checkin(self):
+        """
+        Take the browser back after a test, keeping its session.
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        if getattr(self.driver, "tab_handle", None):
+            # A tab sees the windows of every other tab; leave them alone.
+            return
+        try:
+            handles = self.driver.window_handles
+            for handle in handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(handles[0])
+        except WebDriverException:
+            self._release()
+
+    def shutdown(self):
+        """
+        Give the browser back to the pool.
+        """
+        if self.driver is not None:
+            self._release()
+
+    def _release(self):
+        """
+        Return the browser to the pool, which resets or replaces it.
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        driver, self.driver = self.driver, None
+        try:
+            self.pool.checkin(driver)
+        except WebDriverException:
+            pass
+
+
+class TestDaemon:
+    """
+    Runs pytest in-process on request, keeping modules and browsers warm.
+    """
+
+    # Not a test class, whatever pytest's collection rules say.
+    __test__ = False
+
+    def __init__(self, host="127.0.0.1", port=None):
+        """
+        Initialize the TestDaemon instance.
+        :param host: str: Interface to listen on; keep it local.
+        :param port: int: TCP port, defaults to config.DAEMON_PORT (0 picks one).
+        """
+        self.host = host
+        self.port = config.DAEMON_PORT if port is None else port
+        self.reloader = None
+        self.runs = 0
+        self.started = time.time()
+        # Shared with clients through the state file, which only the user can read.
+        self.token = secrets.token_hex(16)
+
+    def start_pool(self):
+        """
+        Start the shared browser pool and log a browser in, so the first run is
+        warm too.
+        """
+        # Imported here so the client side of this module stays light.
+        from utilities.driverPool import DriverPool
+
+        global persistent_pool, session_browser
+        persistent_pool = DriverPool()
+        session_browser = SessionBrowser(persistent_pool)
+        session_browser.checkout()
+        session_browser.checkin()
+
+    def run(self, args, stream):
+        """
+        Run pytest with the given arguments, streaming its output.
+        :param args: list: pytest arguments; --full-run is understood as in main.py.
+        :param stream: Text stream receiving the output.
+        :return: int: pytest exit code.
+        """
+        import pytest
+
+        full_run = "--full-run" in args
+        args = [arg for arg in args if arg != "--full-run"] or ["testCases"]
+        reloaded = self.reloader.reload_changed()
+        stream.write(
+            "test daemon run %d%s\n"
+            % (
+                self.runs + 1,
+                ", reloaded " + ", ".join(reloaded) if reloaded else "",
+            )
+        )
+        previous_full_run, config.FULL_RUN = (
+            config.FULL_RUN,
+            config.FULL_RUN or full_run,
+        )
+        try:
+            with contextlib.redirect_stdout(stream), contextlib.redirect_stderr(stream):
+                exit_code = int(pytest.main(["-v", *args]))
+        finally:
+            config.FULL_RUN = previous_full_run
+            self.runs += 1
+            self.reloader.snapshot()
+        return exit_code
+
+    def status(self):
+        """
+        Describe the daemon for the status command.
+        """
+        return {
+            "pid": os.getpid(),
+            "port": self.port,
+            "runs": self.runs,
+            "uptime": round(time.time() - self.started, 1),
+        }
+
+    def write_state(self):
+        """
+        Write the address and token clients connect with, readable by the user only.
+        """
+        os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+        temp_path = "%s.%d.tmp" % (STATE_PATH, os.getpid())
+        descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+            json.dump(
+                {
+                    "pid": os.getpid(),
+                    "host": self.host,
+                    "port": self.port,
+                    "token": self.token,
+                },
+                handle,
+            )
+        os.replace(temp_path, STATE_PATH)
+
+    def serve(self):
+        """
+        Import the suite, warm the pool and answer requests until stopped.
+        """
+        import pytest
+
+        # Import selenium, the page objects and the tests once, up front.
+        with contextlib.redirect_stdout(io.StringIO()):
+            pytest.main(["--collect-only", "-q", "testCases"])
+        self.reloader = ModuleReloader()
+        self.start_pool()
+
+        server = _DaemonServer((self.host, self.port), _RunHandler)
+        server.daemon = self
+        server.stopping = False
+        self.port = server.server_address[1]
+        self.write_state()
+        print("Test daemon listening on %s:%d" % (self.host, self.port))
+        try:
+            while not server.stopping:
+                server.handle_request()
+        finally:
+            server.server_close()
+            if os.path.exists(STATE_PATH):
+                os.remove(STATE_PATH)
+            session_browser.shutdown()
+            persistent_pool.shutdown()
+        return 0
+
+
+def send(request, output=None):
+    """
+    Send a request to the running daemon and copy its answer to the output.
+    :param request: dict: {"command": ...} or {"args": [...]}.
+    :param output: Text stream, defaults to sys.stdout.
+    :return: int: Exit code of the run, 0 for other commands.
+    """
+    output = output or sys.stdout
+    try:
+        with open(STATE_PATH, encoding="utf-8") as handle:
+            state = json.load(handle)
+    except (OSError, ValueError):
+        raise RuntimeError(NO_DAEMON_MESSAGE) from None
+    exit_code = 0
+    try:
+        connection = socket.create_connection((state["host"], state["port"]))
+    except OSError:
+        # Left behind by a daemon that was killed.
+        os.remove(STATE_PATH)
+        raise RuntimeError(NO_DAEMON_MESSAGE) from None
+    with connection:
+        request = dict(request, token=state.get("token", ""))
+        connection.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        for line in connection.makefile("r", encoding="utf-8", errors="replace"):
+            if line.startswith(EXIT_MARKER):
+                exit_code = int(line[len(EXIT_MARKER) :])
+                continue
+            output.write(line)
+            output.flush()
+    return exit_code
+
+
+def main(argv=None):
+    """
+    Talk to the daemon from the command line: run [pytest args], status or stop.
+    :param argv: list: Command line arguments.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "run"
+    if command == "run":
+        return send({"args": argv[1:]})
+    if command in ("status", "stop"):
+        return send({"command": command})
+    print("Usage: python -m utilities.testDaemon [run [pytest args] | status | stop]")
+    return 2
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except RuntimeError as error:
+        sys.exit(str(error))
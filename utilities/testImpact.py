@@ -0,0 +1,334 @@
+"""
+Test-impact index: which page-object locators and methods each test used.
+
+While tests run, every locator a page object resolves and every page-object
+method it calls is recorded with a hash of its XPath, or of its source and
+the module-level constants it reads. The next run recomputes those hashes and
+runs only the tests whose dependencies changed, that failed or were skipped
+last time, or that are not in the index yet.
+Changes to the framework itself (BasePage, conftest.py, utilities/) or to a
+test module select every test that depends on them.
+"""
+
+# Standard library
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import os
+
+# First-party
+from pageObjects.basePage import BasePage
+from utilities import config
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Files every test depends on, relative to ROOT_DIR. Directories include all
+# Python files below them.
+FRAMEWORK_PATHS = (
+    "pageObjects/basePage.py",
+    "pageObjects/fastSelectors.json",
+    "testCases/conftest.py",
+    "utilities",
+)
+
+
+def content_hash(text):
+    """
+    Return a short stable hash of a string.
+    :param text: str: Content to hash.
+    """
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def file_hash(path):
+    """
+    Return the content hash of a file, or None if it cannot be read.
+    :param path: str: File path.
+    """
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return content_hash(handle.read())
+    except OSError:
+        return None
+
+
+def framework_hash():
+    """
+    Return one hash over every file in FRAMEWORK_PATHS.
+    """
+    paths = []
+    for entry in FRAMEWORK_PATHS:
+        path = os.path.join(ROOT_DIR, entry)
+        if os.path.isdir(path):
+            for directory, _, names in os.walk(path):
+                paths += [
+                    os.path.join(directory, name)
+                    for name in names
+                    if name.endswith(".py")
+                ]
+        else:
+            paths.append(path)
+    return content_hash(
+        "\n".join(
+            "%s %s" % (os.path.relpath(path, ROOT_DIR), file_hash(path))
+            for path in sorted(paths)
+        )
+    )
+
+
+def dependency_key(cls, name):
+    """
+    Return the index key of a class attribute, e.g.
+    "pageObjects.loginPage:Login.login_button".
+    :param cls: type: Page-object class.
+    :param name: str: Attribute name.
+    """
+    return "%s:%s.%s" % (cls.__module__, cls.__qualname__, name)
+
+
+def referenced_constants(function):
+    """
+    Return the module-level constants a function reads, including those read by
+    the functions and lambdas nested in it, e.g. the scripts it executes.
+    :param function: Function to inspect.
+    :return: dict: Global name to value.
+    """
+    names, codes = set(), [function.__code__]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        codes += [const for const in code.co_consts if inspect.iscode(const)]
+    return {
+        name: function.__globals__[name]
+        for name in sorted(names)
+        if isinstance(
+            function.__globals__.get(name), (str, int, float, tuple, list, dict)
+        )
+    }
+
+
+def dependency_hash(kind, key):
+    """
+    Return the current hash of a recorded locator or method, or None if it is gone.
+    :param kind: str: "locators" or "methods".
+    :param key: str: Key built by dependency_key().
+    """
+    module_name, qualified_name = key.split(":", 1)
+    class_name, name = qualified_name.rsplit(".", 1)
+    try:
+        value = getattr(getattr(importlib.import_module(module_name), class_name), name)
+    except (ImportError, AttributeError):
+        return None
+    if kind == "locators":
+        return content_hash(value)
+    function = inspect.unwrap(value)
+    try:
+        parts = [inspect.getsource(function)]
+    except (OSError, TypeError):
+        return None
+    # Generated methods share their source; the values they close over, such
+    # as the locator name of an is_<suffix>_displayed check, tell them apart.
+    parts += [
+        repr(cell.cell_contents)
+        for cell in getattr(function, "__closure__", None) or ()
+        if isinstance(cell.cell_contents, (str, int, float))
+    ]
+    parts += ["%s = %r" % item for item in referenced_constants(function).items()]
+    return content_hash("\n".join(parts))
+
+
+class ImpactRecorder:
+    """
+    Records the locators and methods each test uses.
+    """
+
+    # The recorder whose listener and method wrappers are in place. Kept on the
+    # class so a new recorder, e.g. from a conftest.py imported again by the
+    # test daemon, replaces the old one instead of wrapping its wrappers.
+    installed = None
+
+    def __init__(self):
+        """
+        Initialize the ImpactRecorder instance.
+        """
+        self.records = {}
+        self.current = None
+        self.framework = framework_hash()
+
+    def install(self):
+        """
+        Start listening to page events and wrap the page-object methods.
+        """
+        if ImpactRecorder.installed is self:
+            return
+        if ImpactRecorder.installed is not None:
+            ImpactRecorder.installed.uninstall()
+        ImpactRecorder.installed = self
+        BasePage.add_listener(self)
+        for cls in BasePage.page_classes():
+            for name, attribute in list(vars(cls).items()):
+                if not name.startswith("_") and inspect.isfunction(attribute):
+                    original = getattr(attribute, "_impact_original", attribute)
+                    setattr(cls, name, self._wrap(cls, name, original))
+
+    def uninstall(self):
+        """
+        Stop listening to page events and restore the page-object methods.
+        """
+        BasePage.remove_listener(self)
+        for cls in BasePage.page_classes():
+            for name, attribute in list(vars(cls).items()):
+                original = getattr(attribute, "_impact_original", None)
+                if original is not None:
+                    setattr(cls, name, original)
+        if ImpactRecorder.installed is self:
+            ImpactRecorder.installed = None
+
+    def begin(self, node_id, test_path):
+        """
+        Start recording the dependencies of a test.
+        :param node_id: str: Test node id.
+        :param test_path: str: Path of the test module.
+        """
+        self.current = {
+            "outcome": "passed",
+            "base_url": config.BASE_URL,
+            "framework": self.framework,
+            "files": {os.path.relpath(test_path, ROOT_DIR): file_hash(test_path)},
+            "locators": {},
+            "methods": {},
+        }
+        self.records[node_id] = self.current
+
+    def end(self):
+        """
+        Stop recording for the current test.
+        """
+        self.current = None
+
+    def report(self, node_id, outcome):
+        """
+        Record the outcome of one test phase; a failure in any phase sticks.
+        :param node_id: str: Test node id.
+        :param outcome: str: "passed", "failed" or "skipped".
+        """
+        record = self.records.get(node_id)
+        if record is not None and record["outcome"] == "passed":
+            record["outcome"] = outcome
+
+    def on_locator(self, page, name):
+        """
+        Record a locator resolved by a page object.
+        :param page: BasePage instance.
+        :param name: str: Locator name.
+        """
+        if self.current is None:
+            return
+        key = dependency_key(type(page), name)
+        if key not in self.current["locators"]:
+            self.current["locators"][key] = content_hash(getattr(type(page), name))
+
+    def _wrap(self, cls, name, function):
+        """
+        Wrap a page-object method so calls to it are recorded.
+        :param cls: type: Class defining the method.
+        :param name: str: Method name.
+        :param function: Function to wrap.
+        """
+        key = dependency_key(cls, name)
+        source_hash = dependency_hash("methods", key)
+
+        @functools.wraps(function)
+        def recorded(*args, **kwargs):
+            if self.current is not None:
+                self.current["methods"].setdefault(key, source_hash)
+            return function(*args, **kwargs)
+
+        recorded._impact_original = function
+        return recorded
+
+
+class ImpactIndex:
+    """
+    Stores the recorded dependencies and selects the tests affected by a change.
+    """
+
+    def __init__(self, path=None):
+        """
+        Initialize the ImpactIndex instance.
+        :param path: str: JSON file holding the index.
+        """
+        self.path = path or os.environ.get(
+            "ORANGEHRM_IMPACT_FILE", os.path.join(config.CACHE_DIR, "impact.json")
+        )
+
+    def load(self):
+        """
+        Return the recorded tests, or an empty dict when no index exists yet.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    def update(self, records):
+        """
+        Merge the records of this run into the index and save it.
+        :param records: dict: Test node id to record, see ImpactRecorder.
+        """
+        index = self.load()
+        index.update(records)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = "%s.%d.tmp" % (self.path, os.getpid())
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(index, handle, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+    def reason_to_run(self, node_id, test_path, record, framework):
+        """
+        Explain why a test has to run, or return None if nothing it uses changed.
+        :param node_id: str: Test node id.
+        :param test_path: str: Path of the test module.
+        :param record: dict: The test's entry in the index, or None.
+        :param framework: str: Current framework_hash().
+        """
+        if record is None:
+            return "new"
+        if record["outcome"] != "passed":
+            return record["outcome"]
+        if record["base_url"] != config.BASE_URL or record["framework"] != framework:
+            return "framework"
+        if record["files"] != {
+            os.path.relpath(test_path, ROOT_DIR): file_hash(test_path)
+        }:
+            return "test module"
+        for kind in ("locators", "methods"):
+            for key, recorded_hash in record[kind].items():
+                if dependency_hash(kind, key) != recorded_hash:
+                    return "%s %s" % (kind[:-1], key.split(":", 1)[1])
+        return None
+
+    def select(self, items):
+        """
+        Split collected tests into those to run and those nothing changed for.
+        :param items: list: Collected pytest items.
+        :return: tuple: (selected items, deselected items, reason per selected node id).
+        """
+        index = self.load()
+        if not index:
+            return list(items), [], {}
+        framework = framework_hash()
+        selected, deselected, reasons = [], [], {}
+        for item in items:
+            reason = self.reason_to_run(
+                item.nodeid, str(item.path), index.get(item.nodeid), framework
+            )
+            if reason is None:
+                deselected.append(item)
+            else:
+                selected.append(item)
+                reasons[item.nodeid] = reason
+        return selected, deselected, reasons
@@ -0,0 +1,271 @@
+"""
+Event-driven wait engine used by the page objects instead of fixed sleeps.
+
+Wait polls a condition with an adaptive interval: fast at first so quick
+pages are not penalised, then backing off so slow pages are not hammered
+with chromedriver round trips. Waits for a single element go further and
+watch the DOM from inside the browser, answering in one round trip.
+"""
+
+# Standard library
+import time
+
+# Third-party
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from selenium.webdriver.support import expected_conditions
+
+# First-party
+from utilities import config
+
+# Counts XHR and fetch requests that have started but not finished yet.
+REQUEST_TRACKER_SCRIPT = """
+(function () {
+    if (window.__orangehrmPendingRequests !== undefined) { return; }
+    window.__orangehrmPendingRequests = 0;
+    var done = function () { window.__orangehrmPendingRequests -= 1; };
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        window.__orangehrmPendingRequests += 1;
+        this.addEventListener('loadend', done);
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            window.__orangehrmPendingRequests += 1;
+            return fetch.apply(this, arguments).finally(done);
+        };
+    }
+})();
+"""
+
+PENDING_REQUESTS_SCRIPT = (
+    REQUEST_TRACKER_SCRIPT + "return window.__orangehrmPendingRequests;"
+)
+
+# Returns the index and element of the first alternative that is clickable,
+# using the same rule as BasePage.visibility_report(), or null if none is.
+FIRST_CLICKABLE_SCRIPT = """
+var alternatives = arguments[0];
+for (var index = 0; index < alternatives.length; index++) {
+    var by = alternatives[index][0], value = alternatives[index][1];
+    var node = by === 'css selector'
+        ? document.querySelector(value)
+        : document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    if (!node || node.disabled) { continue; }
+    var style = window.getComputedStyle(node);
+    if (node.getClientRects().length > 0
+            && style.visibility !== 'hidden'
+            && parseFloat(style.opacity) > 0) {
+        return [index, node];
+    }
+}
+return null;
+"""
+
+# Resolves with the element as soon as it reaches the wanted state, re-checking
+# on every DOM mutation and finished transition or animation, or with null once
+# the limit in milliseconds passes. Uses the clickable rule of
+# BasePage.visibility_report().
+OBSERVE_ELEMENT_SCRIPT = """
+var by = arguments[0], value = arguments[1], state = arguments[2];
+var limit = arguments[3], done = arguments[arguments.length - 1];
+var finished = false, observer, interval, timeout;
+function find() {
+    return by === 'css selector'
+        ? document.querySelector(value)
+        : document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+}
+function ready(node) {
+    if (!node) { return false; }
+    if (state === 'present') { return true; }
+    var style = window.getComputedStyle(node);
+    var displayed = node.getClientRects().length > 0
+        && style.visibility !== 'hidden'
+        && parseFloat(style.opacity) > 0;
+    return state === 'visible' ? displayed : displayed && !node.disabled;
+}
+function finish(node) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timeout);
+    document.removeEventListener('transitionend', check, true);
+    document.removeEventListener('animationend', check, true);
+    done(node);
+}
+function check() {
+    var node = find();
+    if (ready(node)) { finish(node); }
+}
+observer = new MutationObserver(check);
+observer.observe(document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+});
+document.addEventListener('transitionend', check, true);
+document.addEventListener('animationend', check, true);
+// Layout changes that neither mutate the DOM nor fire an event.
+interval = setInterval(check, 100);
+timeout = setTimeout(function () { finish(null); }, limit);
+check();
+"""
+
+# Element states the observer understands, by expected_conditions factory.
+OBSERVED_STATES = {
+    expected_conditions.presence_of_element_located: "present",
+    expected_conditions.visibility_of_element_located: "visible",
+    expected_conditions.element_to_be_clickable: "clickable",
+}
+
+
+class Wait:
+    """
+    Polls a condition until it returns a truthy value or the timeout passes.
+    """
+
+    ignored_exceptions = (NoSuchElementException, StaleElementReferenceException)
+
+    def __init__(self, driver, timeout=None):
+        """
+        Initialize the Wait instance.
+        :param driver: WebDriver or WebElement passed to each condition.
+        :param timeout: float: Seconds to wait, defaults to config.DEFAULT_TIMEOUT.
+        """
+        self.driver = driver
+        self.timeout = config.DEFAULT_TIMEOUT if timeout is None else timeout
+
+    def until(self, condition, message=""):
+        """
+        Return the first truthy value produced by the condition.
+        :param condition: Callable taking the driver, e.g. an expected_conditions entry.
+        :param message: str: Text of the TimeoutException raised on expiry.
+        """
+        interval = config.WAIT_INITIAL_POLL
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                value = condition(self.driver)
+                if value:
+                    return value
+            except self.ignored_exceptions:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message)
+            time.sleep(min(interval, remaining))
+            interval = min(interval * config.WAIT_BACKOFF, config.WAIT_MAX_POLL)
+
+    def until_element(self, locator, condition, message=""):
+        """
+        Return the element behind a locator once it satisfies the condition.
+
+        For presence, visibility and clickability the wait runs in the browser
+        as a MutationObserver, so the element is returned in one round trip as
+        soon as it is ready. Other conditions, a script that times out or is cut
+        short by a navigation, and whatever time is left after
+        config.WAIT_OBSERVE_LIMIT fall back to polling, as do drivers with a
+        false observer_waits attribute.
+        :param locator: tuple: (By, value) pair.
+        :param condition: expected_conditions factory, e.g. element_to_be_clickable.
+        :param message: str: Text of the TimeoutException raised on expiry.
+        """
+        state = OBSERVED_STATES.get(condition)
+        deadline = time.monotonic() + self.timeout
+        if (
+            state is not None
+            and getattr(self.driver, "observer_waits", config.OBSERVER_WAITS)
+            and hasattr(self.driver, "execute_async_script")
+        ):
+            limit = min(self.timeout, config.WAIT_OBSERVE_LIMIT)
+            try:
+                element = self.driver.execute_async_script(
+                    OBSERVE_ELEMENT_SCRIPT, locator[0], locator[1], state, limit * 1000
+                )
+            except (TimeoutException, JavascriptException):
+                element = None
+            if element is not None:
+                return element
+        remaining = max(deadline - time.monotonic(), 0)
+        return Wait(self.driver, remaining).until(condition(locator), message)
+
+
+def install_request_tracker(driver):
+    """
+    Track XHR and fetch requests from the start of every document the browser loads.
+    :param driver: Chrome WebDriver instance.
+    """
+    driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument", {"source": REQUEST_TRACKER_SCRIPT}
+    )
+
+
+def url_contains(text):
+    """
+    Condition that the current URL contains the given text.
+    :param text: str: Expected part of the URL.
+    """
+
+    def condition(driver):
+        return text in driver.current_url
+
+    return condition
+
+
+def navigation_settled():
+    """
+    Condition that the document has loaded and the URL held still between two polls.
+    """
+    last_url = []
+
+    def condition(driver):
+        url, ready_state = driver.execute_script(
+            "return [window.location.href, document.readyState];"
+        )
+        settled = ready_state == "complete" and last_url == [url]
+        last_url[:] = [url]
+        return settled
+
+    return condition
+
+
+def no_pending_xhr():
+    """
+    Condition that no XHR or fetch request is in flight.
+
+    Requests are only counted once the tracker is installed, either up front by
+    install_request_tracker() or lazily by the first poll of this condition.
+    """
+
+    def condition(driver):
+        return driver.execute_script(PENDING_REQUESTS_SCRIPT) <= 0
+
+    return condition
+
+
+def first_clickable(alternatives):
+    """
+    Condition that one of several locators is clickable, checked in one round trip.
+
+    Every poll checks all alternatives in order, so the first to become
+    clickable wins without waiting for the others to time out.
+    :param alternatives: list: (By, value) pairs, most preferred first.
+    :return: Callable returning (index, WebElement) of the winner, or None.
+    """
+    alternatives = [list(alternative) for alternative in alternatives]
+
+    def condition(driver):
+        return driver.execute_script(FIRST_CLICKABLE_SCRIPT, alternatives)
+
+    return condition